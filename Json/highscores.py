@@ -1,45 +1,35 @@
 """
 highscores.py - Sistema de High Scores
 
-Maneja el guardado y carga de las mejores puntuaciones.
+Maneja el guardado y carga de las mejores puntuaciones (a través del
+almacén compartido objects/score_store.py).
 """
 
-import json
-import os
 from datetime import datetime
-from objects.constants import HIGH_SCORES_FILE, MAX_HIGH_SCORES
+from objects.score_store import score_store
 
 class HighScoreManager:
     """
-    Gestor de puntuaciones altas.
-    Guarda y carga puntuaciones en un archivo JSON.
+    Gestor de puntuaciones altas de una dificultad.
+    Delegado en el almacén compartido (objects/score_store.py).
     """
     
-    def __init__(self):
+    def __init__(self, difficulty="normal", store=None):
         """Inicializa el gestor de high scores"""
-        self.scores = []
-        self.load_scores()
+        self.difficulty = difficulty
+        self.store = store if store is not None else score_store
+    
+    @property
+    def scores(self):
+        return self.store.top(self.difficulty)
     
     def load_scores(self):
-        """Carga las puntuaciones desde el archivo"""
-        try:
-            if os.path.exists(HIGH_SCORES_FILE):
-                with open(HIGH_SCORES_FILE, 'r') as f:
-                    self.scores = json.load(f)
-            else:
-                # Crear puntuaciones por defecto
-                self.scores = []
-        except Exception as e:
-            print(f"Error al cargar puntuaciones: {e}")
-            self.scores = []
+        """Las puntuaciones ya están en memoria en el almacén"""
+        return self.scores
     
     def save_scores(self):
         """Guarda las puntuaciones en el archivo"""
-        try:
-            with open(HIGH_SCORES_FILE, 'w') as f:
-                json.dump(self.scores, f, indent=4)
-        except Exception as e:
-            print(f"Error al guardar puntuaciones: {e}")
+        self.store.save()
     
     def add_score(self, player_name, score, level_reached):
         """
@@ -53,34 +43,8 @@ class HighScoreManager:
         Returns:
             Posición en el ranking (None si no entró al top)
         """
-        # Crear entrada
-        entry = {
-            'name': player_name,
-            'score': score,
-            'level': level_reached,
-            'date': datetime.now().strftime('%Y-%m-%d %H:%M')
-        }
-        
-        # Agregar a la lista
-        self.scores.append(entry)
-        
-        # Ordenar por puntuación (descendente)
-        self.scores.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Encontrar posición
-        position = None
-        for i, s in enumerate(self.scores):
-            if s == entry:
-                position = i + 1
-                break
-        
-        # Mantener solo las mejores
-        self.scores = self.scores[:MAX_HIGH_SCORES]
-        
-        # Guardar
-        self.save_scores()
-        
-        return position if position and position <= MAX_HIGH_SCORES else None
+        return self.store.add(self.difficulty, player_name, score, level=level_reached,
+                              date=datetime.now().strftime('%Y-%m-%d %H:%M'))
     
     def is_high_score(self, score):
         """
@@ -92,10 +56,7 @@ class HighScoreManager:
         Returns:
             True si califica, False en caso contrario
         """
-        if len(self.scores) < MAX_HIGH_SCORES:
-            return True
-        
-        return score > self.scores[-1]['score']
+        return self.store.qualifies(self.difficulty, score)
     
     def get_scores(self):
         """
@@ -108,8 +69,7 @@ class HighScoreManager:
     
     def clear_scores(self):
         """Borra todas las puntuaciones"""
-        self.scores = []
-        self.save_scores()
+        self.store.clear(self.difficulty)
 
 
 # Instancia global
@@ -0,0 +1,155 @@
+"""
+endless.py - Modo de ascenso infinito
+
+El nivel se genera por segmentos de altura fija justo por encima del
+jugador, reutilizando las rutinas _generate_* de Level, y los segmentos
+que quedan por debajo de la lava se liberan. Así la memoria y el coste
+por frame no dependen de la altura alcanzada.
+"""
+
+from collections import deque
+from objects.constants import *
+from objects.event_log import event_log
+from Levels.level import Level, level_config_for
+from Levels.reachability import ReachabilityGraph
+
+
+class EndlessLevel(Level):
+    """
+    Nivel sin cima: segmentos generados bajo demanda y retirados bajo la lava.
+    La zona (tema y densidad de enemigos) avanza cada ENDLESS_CHUNKS_PER_ZONE
+    segmentos hasta la tormenta del nivel 3.
+    """
+
+    def __init__(self, difficulty="normal"):
+        # Segmentos vivos, del más bajo al más alto
+        self.chunks = deque()
+        self.chunks_generated = 0
+        self.chunks_retired = 0
+        self.top_y = SCREEN_HEIGHT - 100   # Techo de lo generado hasta ahora
+
+        super().__init__(1, custom_config=self._zone_config(1, difficulty),
+                         use_tiles=False, difficulty=difficulty)
+
+    @staticmethod
+    def _zone_config(zone, difficulty):
+        """Configuración de una zona ajustada por dificultad, por segmento"""
+        config = level_config_for(zone, difficulty)
+        config['platforms'] = ENDLESS_CHUNK_PLATFORMS
+        return config
+
+    # ============================================
+    # 🏗️ GENERACIÓN POR SEGMENTOS
+    # ============================================
+
+    def _generate(self):
+        """
+        Plataforma de inicio y los primeros segmentos. Cada segmento se
+        materializa al terminarlo, así que el layout del nivel queda vacío.
+        """
+        self._plan_platform('platform', SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, 180,
+                            is_spawn=True)
+
+        while self.top_y > SCREEN_HEIGHT - 100 - ENDLESS_GENERATE_AHEAD:
+            self._generate_chunk()
+
+        event_log.info('Endless', "%s segmentos iniciales hasta y=%.0f", len(self.chunks), self.top_y)
+
+    def _generate_chunk(self):
+        """Genera un segmento por encima del techo actual"""
+        zone = min(3, 1 + self.chunks_generated // ENDLESS_CHUNKS_PER_ZONE)
+        if zone != self.number:
+            self.number = zone
+            self.theme = LEVEL_COLORS[zone]
+            self.config = self._zone_config(zone, self.difficulty)
+            event_log.info('Endless', "Entrando en zona %s: %s", zone, self.config['name'])
+
+        # El grafo solo cubre el segmento en curso (arranca en la última
+        # plataforma del anterior) para que no crezca con la altura
+        self.reach_graph = ReachabilityGraph(self.envelope)
+        self.reach_graph.add(self.climb_tip, is_start=True)
+        
+        bottom_y = self.top_y
+        first_platform = len(self.plan['platforms'])
+        self.top_y = self._generate_platform_run(bottom_y, self.config['platforms'])
+
+        # Enemigos y power-ups solo sobre las plataformas nuevas
+        new_platforms = self.plan['platforms'][first_platform:]
+        y_range = (self.top_y, bottom_y)
+        self._generate_bats(self.config['bats'], new_platforms, y_range)
+        self._generate_traps(self.config['traps'], new_platforms)
+        self._generate_rocks(self.config['rocks'], new_platforms, y_range)
+        self._generate_platform_powerups(self.config['powerups'], new_platforms)
+
+        # Materializar el segmento (el plan queda vacío para el siguiente)
+        self._spawn_layout_objects(self._plan_to_layout())
+
+        self.chunks.append({
+            'index': self.chunks_generated,
+            'top': self.top_y,
+            'bottom': bottom_y,
+        })
+        self.chunks_generated += 1
+
+    # ============================================
+    # 🔄 STREAMING
+    # ============================================
+
+    def stream(self, player_y, lava_y):
+        """
+        Genera por arriba y libera por abajo. Se llama una vez por frame;
+        como mucho crea un segmento por llamada para no provocar picos.
+
+        Args:
+            player_y: Posición Y del jugador
+            lava_y: Superficie de la lava
+        """
+        if self.top_y > player_y - ENDLESS_GENERATE_AHEAD:
+            self._generate_chunk()
+
+        retire_y = min(lava_y + ENDLESS_RETIRE_MARGIN, player_y + ENDLESS_MAX_BELOW_PLAYER)
+        self.retire_below(retire_y)
+
+    def retire_below(self, line_y):
+        """
+        Libera los segmentos que quedaron completamente por debajo de line_y
+        junto con todo lo que haya debajo (incluidos enemigos dinámicos).
+
+        Returns:
+            int: Segmentos liberados
+        """
+        retired = 0
+        while self.chunks and self.chunks[0]['top'] > line_y:
+            self.chunks.popleft()
+            retired += 1
+
+        if retired:
+            self.chunks_retired += retired
+            self.platforms = [p for p in self.platforms if p.y < line_y]
+            enemies = self.enemies
+            kept = 0
+            for enemy in enemies:
+                if enemy.y < line_y:
+                    enemies[kept] = enemy
+                    kept += 1
+                else:
+                    self._drop_enemy(enemy)
+            del enemies[kept:]
+            self.powerups = [p for p in self.powerups if p.y < line_y]
+            self.effects = [e for e in self.effects if getattr(e, 'y', line_y - 1) < line_y]
+        return retired
+
+    def _rock_reference_y(self, player_y):
+        """
+        Sin cima: las rocas toman como referencia el techo del segmento en
+        el que está el jugador, así que se hacen más frecuentes al final de
+        cada segmento.
+        """
+        for chunk in self.chunks:
+            if chunk['top'] <= player_y <= chunk['bottom']:
+                return chunk['top']
+        return self.top_y
+
+    def climbed_height(self, player_y):
+        """Altura ascendida desde el punto de inicio (en píxeles)"""
+        return max(0, SCREEN_HEIGHT - 150 - player_y)
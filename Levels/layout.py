@@ -0,0 +1,119 @@
+"""
+layout.py - Layouts de nivel serializados y packs de niveles
+
+Un layout es la descripción en datos puros de un nivel ya generado
+(ver Level.to_layout): plataformas, enemigos con sus parámetros, power-ups
+y banderas. Construir un Level desde un layout se salta toda la generación
+aleatoria, por lo que reiniciar un nivel es prácticamente instantáneo.
+
+Exportar un pack de niveles curado:
+    python -m Levels.layout
+"""
+
+import os
+import sys
+import json
+
+LAYOUT_VERSION = 1
+LEVEL_PACK_DIR = "./Levels/packs"
+
+
+class LayoutEntry:
+    """
+    Objeto del nivel en forma de datos puros (sin superficies).
+    La fase de generación trabaja con estas entradas como si fueran los
+    objetos reales (x, y, is_spawn, speed...) y después se materializan.
+    """
+
+    def __init__(self, kind, **fields):
+        self.kind = kind
+        self.__dict__.update(fields)
+
+    def to_dict(self):
+        """Descripción serializable; omite las marcas desactivadas"""
+        return {key: value for key, value in self.__dict__.items()
+                if value is not False and value is not None}
+
+
+def layout_path(level_number, difficulty, pack_dir=LEVEL_PACK_DIR):
+    """Ruta del layout de un nivel dentro de un pack"""
+    return os.path.join(pack_dir, f"level_{level_number}_{difficulty}.json")
+
+
+def save_layout(layout, path):
+    """
+    Guarda un layout en JSON compacto.
+
+    Returns:
+        bool: True si se guardó correctamente
+    """
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = dict(layout, version=LAYOUT_VERSION)
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        return True
+    except Exception as e:
+        print(f"[Layout] Error al guardar {path}: {e}")
+        return False
+
+
+def load_layout(path):
+    """
+    Carga un layout desde JSON.
+
+    Returns:
+        dict o None si no existe, es de otra versión o está dañado
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            layout = json.load(f)
+    except Exception as e:
+        print(f"[Layout] Error al cargar {path}: {e}")
+        return None
+
+    if layout.get('version') != LAYOUT_VERSION:
+        print(f"[Layout] {path} tiene versión {layout.get('version')}, se ignora")
+        return None
+    return layout
+
+
+def load_level_pack(level_number, difficulty, pack_dir=LEVEL_PACK_DIR):
+    """Layout curado de un nivel si el pack lo incluye; None en caso contrario"""
+    return load_layout(layout_path(level_number, difficulty, pack_dir))
+
+
+def export_level_pack(pack_dir=LEVEL_PACK_DIR, difficulties=("easy", "normal", "hard")):
+    """
+    Genera los niveles 1-3 para cada dificultad y guarda sus layouts.
+    Necesita pygame inicializado con una ventana (los sprites usan convert).
+
+    Returns:
+        int: Número de layouts guardados
+    """
+    from Levels.level import Level, level_config_for
+
+    saved = 0
+    for difficulty in difficulties:
+        for level_number in (1, 2, 3):
+            level = Level(level_number, level_config_for(level_number, difficulty),
+                          difficulty=difficulty)
+            if level.tile_manager:
+                # El pack lleva el contenido de todas las secciones, no solo de las visitadas
+                level.tile_manager.ensure_all()
+            if save_layout(level.to_layout(), layout_path(level_number, difficulty, pack_dir)):
+                saved += 1
+    print(f"[Layout] Pack exportado en {pack_dir}: {saved} niveles")
+    return saved
+
+
+if __name__ == "__main__":
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    export_level_pack(sys.argv[1] if len(sys.argv) > 1 else LEVEL_PACK_DIR)
+    pygame.quit()
@@ -11,6 +11,15 @@ import os
 from objects.constants import *
 from objects.platforms import Platform, MovingPlatform, CastlePlatform, VictoryFlag
 from Models.enemies import Bat, RotatingTrap, FallingRock, Lightning, SurveillanceDrone
+from Models.enemy_batch import EnemyBatchStore
+from objects.pool import enemy_pools
+from Levels.layout import LayoutEntry
+from Levels.reachability import ReachabilityGraph, build_reachability_graph, jump_envelope
+from Levels.spatial import PlatformIndex
+from Levels.lifecycle import LifecycleManager
+from objects.event_log import event_log
+from objects.memory_ledger import memory_ledger
+from objects.quality import quality
 
 # ============================================
 # 🔧 IMPORTACIÓN CORREGIDA DE POWER-UPS
@@ -71,13 +80,35 @@ except ImportError:
                 pass
 
 
+def level_config_for(level_number, difficulty="normal"):
+    """
+    Configuración de un nivel con las cantidades ajustadas por dificultad.
+    
+    Args:
+        level_number: Número del nivel (1-3)
+        difficulty: Dificultad del juego ("easy", "normal", "hard")
+    """
+    settings = DIFFICULTY_SETTINGS[difficulty]
+    level_config = LEVELS_CONFIG[level_number].copy()
+    
+    for enemy_type in ['bats', 'traps', 'rocks', 'lightning']:
+        if enemy_type in level_config:
+            level_config[enemy_type] = int(level_config[enemy_type] * settings["enemy_rate"])
+    
+    if 'powerups' in level_config:
+        level_config['powerups'] = int(level_config['powerups'] * settings["powerup_rate"])
+    
+    return level_config
+
+
 class Level:
     """
     Clase que representa un nivel del juego.
     Genera y gestiona todos los elementos del nivel.
     """
     
-    def __init__(self, level_number, custom_config=None, use_tiles=True, difficulty="normal"):
+    def __init__(self, level_number, custom_config=None, use_tiles=True, difficulty="normal",
+                 layout=None, materialize=True):
         """
         Inicializa un nivel.
         
@@ -86,81 +117,106 @@ class Level:
             custom_config: Configuración personalizada (opcional)
             use_tiles: True para usar TileManager (por defecto)
             difficulty: Dificultad del juego ("easy", "normal", "hard")
+            layout: Descripción serializada (ver to_layout); si se indica
+                    se construye directamente sin generar nada
+            materialize: False para quedarse en la fase de datos (sin crear
+                         superficies); se puede llamar desde otro hilo y
+                         completar después con materialize()
         """
         self.number = level_number
         self.difficulty = difficulty
         self.config = custom_config if custom_config else LEVELS_CONFIG[level_number]
         self.theme = LEVEL_COLORS[level_number]
-        self.use_tiles = use_tiles
+        # Altura del nivel - ¡MUCHO MÁS GRANDE!
+        self.height = self.config['platforms'] * PLATFORM_VERTICAL_SPACING * 2
+        
+        # Alcance de salto de la dificultad: solo se colocan plataformas
+        # alcanzables y el grafo se mantiene mientras se planifica
+        self.envelope = jump_envelope(difficulty)
+        self.reach_graph = ReachabilityGraph(self.envelope)
+        self.climb_tip = None      # Última plataforma del camino de subida
+        self.spawn_platform = None
+        
+        # Un layout con 'tiles' se reconstruye con la misma semilla; sin ella
+        # el layout ya describe todas las plataformas
+        tiles = layout.get('tiles') if layout is not None else None
+        self.use_tiles = use_tiles and (layout is None or tiles is not None)
         
         # Intentar cargar TileManager
         self.tile_manager = None
         if self.use_tiles:
-            self.tile_manager = self._try_load_tile_manager()
+            if tiles is not None:
+                self.height = tiles['height']
+            self.tile_manager = self._try_load_tile_manager(tiles['seed'] if tiles else None)
             if not self.tile_manager:
-                print(f"[Level {self.number}] Usando sistema de plataformas original")
+                event_log.info('Level', "Nivel %s: Usando sistema de plataformas original", self.number)
                 self.use_tiles = False
         
         # Listas de objetos
         self.platforms = []        # Plataformas regulares
         self.tile_platforms = []   # Plataformas de tiles (si usamos TileManager)
+        if self.tile_manager:
+            # Misma lista que el TileManager: crece al generar cada sección
+            self.tile_platforms = self.tile_manager.get_platforms()
         self.enemies = []
         self.powerups = []
         self.effects = []
         self.flags = []            # Lista de banderas de victoria
+        self.lifecycle = LifecycleManager()
+        self.enemy_batches = EnemyBatchStore()
         
         # Referencia a plataforma final
         self.final_platform = None
         
-        # Altura del nivel - ¡MUCHO MÁS GRANDE!
-        self.height = self.config['platforms'] * PLATFORM_VERTICAL_SPACING * 2
+        # Fuente del dibujo de emergencia de power-ups (se crea al primer fallo)
+        self._debug_font = None
         
         # Parallax layers
         self.parallax_layers = self._create_parallax_layers()
+        memory_ledger.track('parallax', self, 'parallax_layers')
+        memory_ledger.track('entities', self, 'enemies', 'powerups', 'effects', 'platforms',
+                            'tile_platforms', 'flags')
+        
+        # Plan de generación: solo datos (LayoutEntry), sin superficies
+        self.plan = self._new_plan()
+        self.materialized = False
+        
+        # Contenido de las secciones de tiles planificadas al generarse, por
+        # índice (None: el layout ya trae el contenido de todo el nivel)
+        self.section_layouts = None
+        
+        # Generar nivel (o construirlo desde el layout guardado)
+        if layout is not None:
+            self.layout = layout
+            self.section_layouts = layout.get('sections')
+        else:
+            self._generate()
+            self.layout = self._plan_to_layout()
+        if self.tile_manager:
+            self.tile_manager.on_section_built = self._on_tile_section
         
-        # Generar nivel
-        self._generate()
-        
-        print(f"[Level {self.number}] Altura total del nivel: {self.height}px")
-        print(f"[Level {self.number}] Power-ups generados: {len(self.powerups)}")
+        if materialize:
+            self.materialize()
         
-    def _try_load_tile_manager(self):
-        """Intenta cargar TileManager, retorna None si falla"""
+    def _try_load_tile_manager(self, seed=None):
+        """
+        Intenta cargar TileManager (cubriendo toda la altura del nivel),
+        retorna None si falla. seed reproduce los tiles de un layout guardado.
+        """
         try:
-            # Buscar el archivo en diferentes ubicaciones
-            tile_manager_paths = [
-                "tile_manager.py",
-                "./tile_manager.py",
-                "../tile_manager.py",
-                "objects/tile_manager.py",
-                "Levels/tile_manager.py"
-            ]
-            
-            for path in tile_manager_paths:
-                try:
-                    if path == "tile_manager.py":
-                        from .tile_manager import TileManager
-                    elif path == "./tile_manager.py":
-                        from Levels.tile_manager import TileManager
-                    elif path == "objects/tile_manager.py":
-                        from objects.tile_manager import TileManager
-                    elif path == "Levels/tile_manager.py":
-                        from .tile_manager import TileManager
-                    
-                    tm = TileManager(self.number, level_height=self.height)
-                    print(f"[Level {self.number}] TileManager cargado exitosamente desde {path}")
-                    return tm
-                except ImportError:
-                    continue
-                except Exception as e:
-                    print(f"[Level {self.number}] Error cargando TileManager desde {path}: {e}")
-                    continue
-            
-            print(f"[Level {self.number}] No se encontró TileManager")
+            from objects.tile_manager import TileManager
+        except ImportError:
+            event_log.warning('Level', "Nivel %s: No se encontró TileManager", self.number)
             return None
-            
+        
+        try:
+            tm = TileManager(self.number, level_height=self.height, seed=seed,
+                             envelope=self.envelope)
+            event_log.info('Level', "Nivel %s: TileManager cargado (%s tramos en la base y la cima)",
+                           self.number, len(tm.get_platforms()))
+            return tm
         except Exception as e:
-            print(f"[Level {self.number}] Error general cargando TileManager: {e}")
+            event_log.error('Level', "Nivel %s: Error cargando TileManager: %s", self.number, e)
             return None
     
     def _create_parallax_layers(self):
@@ -225,81 +281,94 @@ class Level:
     def _generate(self):
         """Genera TODA la estructura del nivel - VERSIÓN MÁS GRANDE"""
         
-        print(f"[Level {self.number}] Generando nivel ÉPICO de {self.height}px...")
+        event_log.info('Level', "Nivel %s: Generando nivel ÉPICO de %spx...", self.number, self.height)
         
         # Usar TileManager si está disponible
         if self.use_tiles and self.tile_manager:
-            print(f"[Level {self.number}] Usando TileManager con tilesets")
-            self.tile_platforms = self.tile_manager.get_platforms()
+            event_log.info('Level', "Nivel %s: Usando TileManager con tilesets", self.number)
+            
+            # Plataforma de inicio (como en el sistema original)
+            self._plan_platform(
+                'platform',
+                SCREEN_WIDTH // 2,
+                SCREEN_HEIGHT - 100,
+                180,
+                is_spawn=True
+            )
+            for tile_platform in self.tile_platforms:
+                self.reach_graph.add(tile_platform)
             
             # Obtener plataforma final del tile manager
             tile_final = self.tile_manager.get_final_platform()
             
             # Crear plataforma final estilo castillo
             if tile_final and hasattr(tile_final, 'x') and hasattr(tile_final, 'y'):
-                print(f"[Level] Creando CastlePlatform sobre tile final")
-                castle_platform = CastlePlatform(
-                    tile_final.x,
+                event_log.info('Level', "Creando CastlePlatform sobre tile final")
+                castle_platform = self._plan_platform(
+                    'castle',
+                    tile_final.centerx,
                     tile_final.y - 60,  # Más arriba
                     240,  # Más ancha
-                    self.number
+                    is_final=True
                 )
-                castle_platform.is_final = True
-                self.platforms.append(castle_platform)
-                self.final_platform = castle_platform
                 
                 # BANDERA DE VICTORIA MÁS GRANDE
                 flag_x = castle_platform.x - 90
                 flag_y = castle_platform.y - 80
-                victory_flag = VictoryFlag(flag_x, flag_y, self.number)
-                victory_flag.scale = 1.5  # Bandera más grande
-                self.flags.append(victory_flag)
+                self._plan_flag(flag_x, flag_y, scale=1.5)  # Bandera más grande
             
-            # Añadir plataformas móviles extras para nivel grande
-            self._add_extra_moving_platforms()
+            # Solo existen la pantalla base y la cima: el resto de secciones
+            # se planifica al generarse (_on_tile_section), como los chunks
+            # del modo infinito
+            event_log.info('Level', "Nivel %s: Generando enemigos y power-ups...", self.number)
+            self.section_layouts = {}
+            if self.tile_manager.sections_ready:
+                self._plan_tile_rows(*self.tile_manager.section_area(0))
+            self._plan_tile_rows(*self.tile_manager.base_area())
+            self._generate_test_powerups()
         else:
             # SISTEMA ORIGINAL MODIFICADO PARA NIVEL GRANDE
-            print(f"[Level {self.number}] Usando sistema de plataformas original (mejorado)")
+            event_log.info('Level', "Nivel %s: Usando sistema de plataformas original (mejorado)", self.number)
             self._generate_extended_platforms()
-        
-        # GENERAR ELEMENTOS - MÁS Y MEJOR DISTRIBUIDOS
-        print(f"[Level {self.number}] Generando enemigos y power-ups...")
-        self._generate_bats()
-        self._generate_traps()
-        self._generate_rocks()
+            
+            # GENERAR ELEMENTOS - MÁS Y MEJOR DISTRIBUIDOS
+            event_log.info('Level', "Nivel %s: Generando enemigos y power-ups...", self.number)
+            self._generate_bats()
+            self._generate_traps()
+            self._generate_rocks()
+            
+            # Generar power-ups (¡IMPORTANTE!)
+            self._generate_powerups_mejorado()
         
         # Rayos solo en nivel 3
         if self.number == 3:
             self._generate_lightning()
         
-        # Generar power-ups (¡IMPORTANTE!)
-        self._generate_powerups_mejorado()
-        
         # Añadir drones en niveles altos
         if self.number >= 2:
             self._generate_drones()
         
-        print(f"[Level {self.number}] ¡Generación completada!")
-        print(f"  - Altura total: {self.height}px")
-        print(f"  - {len(self.tile_platforms)} tiles")
-        print(f"  - {len(self.platforms)} plataformas especiales")
-        print(f"  - {len(self.enemies)} enemigos")
-        print(f"  - {len(self.powerups)} power-ups")
-        print(f"  - {len(self.flags)} banderas")
+        event_log.info('Level', "Nivel %s: ¡Generación completada!", self.number)
+    
+    def _print_summary(self):
+        """Resumen del nivel ya materializado"""
+        event_log.info('Level', "Nivel %s: altura %spx, %d tiles, %d plataformas especiales, "
+                       "%d enemigos, %d power-ups, %d banderas", self.number, self.height,
+                       len(self.tile_platforms), len(self.platforms), len(self.enemies),
+                       len(self.powerups), len(self.flags))
     
     def _generate_extended_platforms(self):
         """Genera plataformas usando sistema original EXTENDIDO"""
         # ============================================
         # 🏁 PLATAFORMA INICIAL (spawn seguro)
         # ============================================
-        spawn_platform = Platform(
+        self._plan_platform(
+            'platform',
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 100,
             180,  # Más ancha
-            self.number
+            is_spawn=True
         )
-        spawn_platform.is_spawn = True
-        self.platforms.append(spawn_platform)
         
         current_y = SCREEN_HEIGHT - 100
         
@@ -307,25 +376,50 @@ class Level:
         # 📊 PLATAFORMAS NORMALES - MÁS Y MEJOR ESPACIADAS
         # ============================================
         platform_count = self.config['platforms']
+        current_y = self._generate_platform_run(current_y, platform_count)
+        
+        # ============================================
+        # 🏰 PLATAFORMA FINAL CASTILLO (EN LA CIMA)
+        # ============================================
+        final_platform_y = current_y - min(PLATFORM_VERTICAL_SPACING * 2, self.envelope.max_rise)
+        # Centrada, salvo que así quede fuera del alcance del último salto
+        final_x = self._reachable_x(SCREEN_WIDTH // 2, SCREEN_WIDTH // 2, 280, final_platform_y)
+        
+        self._plan_platform(
+            'castle',
+            final_x,
+            final_platform_y,
+            280,  # Más ancha
+            is_final=True
+        )
+        
+        # ============================================
+        # BANDERA DE VICTORIA (MÁS GRANDE)
+        # ============================================
+        flag_x = final_x - 100
+        flag_y = final_platform_y - 100
+        self._plan_flag(flag_x, flag_y, scale=1.8)  # Bandera más grande para nivel grande
+    
+    def _generate_platform_run(self, current_y, platform_count):
+        """
+        Genera un tramo de plataformas por encima de current_y.
+        
+        Args:
+            current_y: Altura desde la que se empieza a subir
+            platform_count: Número de plataformas del tramo
         
+        Returns:
+            float: Altura de la última plataforma generada
+        """
         for i in range(1, platform_count + 1):
             # Variar el espaciado vertical para crear secciones
             if i % 5 == 0:
                 # Cada 5 plataformas, hacer un salto más grande
-                current_y -= PLATFORM_VERTICAL_SPACING * 1.5
+                rise = PLATFORM_VERTICAL_SPACING * 1.5
             else:
-                current_y -= PLATFORM_VERTICAL_SPACING
-            
-            # Posición horizontal variada
-            if i % 3 == 0:
-                # Plataformas a la izquierda
-                x = random.randint(PLATFORM_WIDTH + 50, SCREEN_WIDTH // 2 - 50)
-            elif i % 3 == 1:
-                # Plataformas a la derecha
-                x = random.randint(SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH - PLATFORM_WIDTH - 50)
-            else:
-                # Plataformas en el centro
-                x = random.randint(SCREEN_WIDTH // 2 - 100, SCREEN_WIDTH // 2 + 100)
+                rise = PLATFORM_VERTICAL_SPACING
+            # Nunca más de lo que permite el salto de la dificultad
+            current_y -= min(rise, self.envelope.max_rise)
             
             # Ancho según nivel y posición
             if i < platform_count * 0.3:  # Primera parte
@@ -338,112 +432,167 @@ class Level:
                 width = random.randint(120, 160)
                 move_chance = 0.4
             
+            # Posición horizontal variada (dentro del alcance del salto anterior)
+            if i % 3 == 0:
+                # Plataformas a la izquierda
+                x = self._reachable_x(PLATFORM_WIDTH + 50, SCREEN_WIDTH // 2 - 50, width, current_y)
+            elif i % 3 == 1:
+                # Plataformas a la derecha
+                x = self._reachable_x(SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH - PLATFORM_WIDTH - 50,
+                                      width, current_y)
+            else:
+                # Plataformas en el centro
+                x = self._reachable_x(SCREEN_WIDTH // 2 - 100, SCREEN_WIDTH // 2 + 100,
+                                      width, current_y)
+            
             # Decidir tipo de plataforma
             if random.random() < move_chance:
-                platform = MovingPlatform(
-                    x, current_y, width, self.number,
+                platform = self._plan_platform(
+                    'moving', x, current_y, width,
                     move_range=random.randint(100, 200),
                     speed=random.uniform(1.0, 3.0)
                 )
             else:
-                platform = Platform(x, current_y, width, self.number)
+                platform = self._plan_platform('platform', x, current_y, width)
             
             # Marcar plataformas difíciles en la parte superior
             if i > platform_count * 0.6:
                 platform.is_difficult = True
-            
-            self.platforms.append(platform)
-        
-        # ============================================
-        # 🏰 PLATAFORMA FINAL CASTILLO (EN LA CIMA)
-        # ============================================
-        final_platform_y = current_y - PLATFORM_VERTICAL_SPACING * 2
+            self.climb_tip = platform
         
-        final_platform = CastlePlatform(
-            SCREEN_WIDTH // 2,
-            final_platform_y,
-            280,  # Más ancha
-            self.number
-        )
-        final_platform.is_final = True
-        self.platforms.append(final_platform)
-        self.final_platform = final_platform
-        
-        # ============================================
-        # BANDERA DE VICTORIA (MÁS GRANDE)
-        # ============================================
-        flag_x = SCREEN_WIDTH // 2 - 100
-        flag_y = final_platform_y - 100
-        victory_flag = VictoryFlag(flag_x, flag_y, self.number)
-        victory_flag.scale = 1.8  # Bandera más grande para nivel grande
-        self.flags.append(victory_flag)
+        return current_y
     
-    def _add_extra_moving_platforms(self):
-        """Añade plataformas móviles extras para nivel grande"""
-        if not self.tile_platforms:
-            return
+    def _reachable_x(self, x_min, x_max, width, y):
+        """
+        Centro x al azar dentro de [x_min, x_max] que quede al alcance de
+        climb_tip (consulta O(1) a la envolvente). Si la franja entera está
+        fuera de alcance, se usa el punto alcanzable más cercano a ella.
+        """
+        margin = width // 2
+        x_min, x_max = max(x_min, margin), min(x_max, SCREEN_WIDTH - margin)
+        reach = self.envelope.x_range(self.climb_tip, width, y) if self.climb_tip else None
+        if reach is not None:
+            low, high = max(x_min, reach[0]), min(x_max, reach[1])
+            if low > high:
+                edge = reach[1] if reach[1] < x_min else reach[0]
+                return int(max(margin, min(SCREEN_WIDTH - margin, edge)))
+            x_min, x_max = low, high
+        low, high = math.ceil(x_min), math.floor(x_max)
+        return random.randint(low, high) if low <= high else int(x_min)
+    
+    def _plan_tile_rows(self, platforms, y_range):
+        """
+        Planifica el contenido de unas filas de tiles ya generadas: la parte
+        de enemigos, power-ups y plataformas móviles que les toca según la
+        altura que ocupan en el mapa.
         
+        Args:
+            platforms: Tramos de tiles de esas filas
+            y_range: (y_min, y_max) de las filas en el mundo
+        """
+        fraction = (y_range[1] - y_range[0]) / self.tile_manager.tilemap.height
+        powerups = max(0, self.config.get('powerups', 0) - 2)  # 2 son los de prueba
+        
+        self._add_extra_moving_platforms(platforms)
+        self._generate_bats(self._share(self.config['bats'], fraction), platforms, y_range)
+        self._generate_traps(self._share(self.config['traps'], fraction), platforms)
+        self._generate_rocks(self._share(self.config['rocks'], fraction), platforms, y_range)
+        self._generate_platform_powerups(self._share(powerups, fraction), platforms)
+    
+    def _on_tile_section(self, index, platforms, y_range):
+        """
+        El TileManager acaba de generar la sección index. Su contenido se
+        planifica la primera vez y se guarda en el layout, así los
+        reinicios y los packs repiten lo ya visitado.
+        """
+        if self.section_layouts is None:
+            return  # Layout con el contenido de todo el nivel
+        
+        key = str(index)
+        section = self.section_layouts.get(key)
+        if section is None:
+            for platform in platforms:
+                self.reach_graph.add(platform)
+            self._plan_tile_rows(platforms, y_range)
+            section = self.section_layouts[key] = self._take_plan()
+            event_log.debug('Level', "Nivel %s: sección %s planificada (%s enemigos)", self.number,
+                            index, len(section['enemies']))
+        if self.materialized:
+            self._spawn_layout_objects(section)
+    
+    @staticmethod
+    def _share(total, fraction):
+        """Parte entera de total * fraction; el resto decimal se sortea"""
+        expected = total * fraction
+        count = int(expected)
+        return count + (1 if random.random() < expected - count else 0)
+    
+    def _add_extra_moving_platforms(self, platforms):
+        """Añade plataformas móviles extras sobre tramos de tiles"""
         # Encontrar plataformas adecuadas para convertir en móviles
-        static_tiles = [p for p in self.tile_platforms if not hasattr(p, 'is_moving')]
+        static_tiles = [p for p in platforms if not hasattr(p, 'is_moving')]
         
         # Convertir algunas en móviles (20%)
-        num_to_convert = max(3, len(static_tiles) // 5)
+        num_to_convert = self._share(len(static_tiles), 0.2)
         for _ in range(num_to_convert):
             if static_tiles:
                 tile = random.choice(static_tiles)
                 static_tiles.remove(tile)
                 
                 # Crear plataforma móvil en esa posición
-                moving_platform = MovingPlatform(
-                    tile.x, tile.y, 
+                self._plan_platform(
+                    'moving', tile.x, tile.y, 
                     random.randint(100, 180),  # Ancho variable
-                    self.number,
                     move_range=random.randint(80, 150),
                     speed=random.uniform(1.0, 2.0)
                 )
-                self.platforms.append(moving_platform)
     
-    def _generate_bats(self):
-        """Genera murciélagos - MEJOR DISTRIBUIDOS CON SEGURIDAD"""
-        bats_to_generate = self.config['bats']
-        all_platforms = self.get_all_platforms()
-        
-        if len(all_platforms) < 5:
-            print(f"[Level] Muy pocas plataformas para generar murciélagos")
-            return
+    def _generate_bats(self, count=None, platforms=None, y_range=None):
+        """
+        Genera murciélagos - MEJOR DISTRIBUIDOS CON SEGURIDAD
         
-        print(f"[Level] Generando {bats_to_generate} murciélagos...")
+        Args:
+            count: Cantidad (por defecto la de la configuración)
+            platforms: Plataformas candidatas (por defecto todas)
+            y_range: (y_min, y_max) a cubrir (por defecto todo el nivel)
+        """
+        bats_to_generate = self.config['bats'] if count is None else count
+        all_platforms = self._plan_platforms() if platforms is None else platforms
         
         # CORRECCIÓN: Evitar división por cero
         if bats_to_generate <= 0:
-            print(f"[Level] No hay murciélagos para generar")
             return
         
+        if not all_platforms:
+            event_log.warning('Level', "No hay plataformas para generar murciélagos")
+            return
+        
+        index = PlatformIndex(all_platforms)
+        y_min, y_max = self._placement_range(index, y_range)
+        
+        event_log.info('Level', "Generando %s murciélagos...", bats_to_generate)
+        
         # Asegurar que siempre haya al menos 1 sección
         num_sections = max(2, bats_to_generate // 2)
-        section_height = self.height / num_sections
+        section_height = (y_max - y_min) / num_sections
         
         for i in range(bats_to_generate):
             # Seleccionar sección del nivel
             section_index = i % num_sections
-            target_y = section_index * section_height + section_height / 2
-            
-            # Encontrar plataforma cercana a esa altura
-            closest_platform = None
-            min_distance = float('inf')
+            target_y = y_min + section_index * section_height + section_height / 2
             
-            for platform in all_platforms:
-                if hasattr(platform, 'y'):
-                    distance = abs(platform.y - target_y)
-                    if distance < min_distance and distance < 300:
-                        min_distance = distance
-                        closest_platform = platform
+            # Encontrar plataforma cercana a esa altura (búsqueda binaria)
+            closest_platform = index.nearest(target_y, max_distance=300)
             
             if closest_platform:
-                # Posicionar murciélago
+                # Posicionar murciélago (al otro lado si queda junto al spawn)
                 offset_x = random.choice([-150, 150])
                 x = closest_platform.x + offset_x
                 y = closest_platform.y - random.randint(60, 120)
+                if not self._is_safe_spot(x, y):
+                    x = closest_platform.x - offset_x
+                    if not self._is_safe_spot(x, y):
+                        continue
                 
                 # Configuración según nivel
                 if self.number == 1:
@@ -456,19 +605,18 @@ class Level:
                     pattern_width = random.randint(150, 250)
                     speed = random.uniform(2.5, 3.0)
                 
-                bat = Bat(x, y, pattern_width)
-                bat.speed = speed
-                self.enemies.append(bat)
+                self._plan_enemy('bat', x, y, patrol_range=pattern_width, speed=speed)
     
-    def _generate_traps(self):
+    def _generate_traps(self, count=None, platforms=None):
         """Genera trampas rotantes - MEJOR DISTRIBUIDAS"""
-        traps_to_generate = self.config['traps']
-        all_platforms = self.get_all_platforms()
+        traps_to_generate = self.config['traps'] if count is None else count
+        all_platforms = self._plan_platforms() if platforms is None else platforms
         
-        if len(all_platforms) < 4:
+        # Cada trampa va entre dos plataformas consecutivas
+        if traps_to_generate <= 0 or len(all_platforms) < 2:
             return
         
-        print(f"[Level] Generando {traps_to_generate} trampas rotantes...")
+        event_log.info('Level', "Generando %s trampas rotantes...", traps_to_generate)
         
         for i in range(traps_to_generate):
             # Colocar trampas en espacios entre plataformas
@@ -480,62 +628,67 @@ class Level:
                 if abs(platform1.y - platform2.y) > 120:
                     x = (platform1.x + platform2.x) // 2
                     y = (platform1.y + platform2.y) // 2
+                    if not self._is_safe_spot(x, y):
+                        continue
                     
-                    trap = RotatingTrap(x, y)
+                    trap = self._plan_enemy('trap', x, y, rotation_speed=TRAP_ROTATION_SPEED)
                     
                     # Aumentar velocidad de rotación según nivel
                     if self.number == 2:
                         trap.rotation_speed *= 1.3
                     elif self.number == 3:
                         trap.rotation_speed *= 1.6
-                    
-                    self.enemies.append(trap)
     
-    def _generate_rocks(self):
+    def _generate_rocks(self, count=None, platforms=None, y_range=None):
         """Genera rocas que caen - MEJOR DISTRIBUIDAS"""
-        rocks_to_generate = self.config['rocks']
-        all_platforms = self.get_all_platforms()
+        rocks_to_generate = self.config['rocks'] if count is None else count
+        all_platforms = self._plan_platforms() if platforms is None else platforms
         
-        if len(all_platforms) < 3:
+        if rocks_to_generate <= 0 or not all_platforms:
             return
         
-        print(f"[Level] Generando {rocks_to_generate} rocas...")
+        index = PlatformIndex(all_platforms)
+        y_min, y_max = self._placement_range(index, y_range)
+        
+        event_log.info('Level', "Generando %s rocas...", rocks_to_generate)
         
         # Posicionar rocas en diferentes alturas
         height_sections = 4
-        section_height = self.height / height_sections
+        section_height = (y_max - y_min) / height_sections
+        # Margen dentro de cada franja (menor en tramos cortos, como una sección de tiles)
+        margin = min(100, section_height / 4)
         
         for i in range(rocks_to_generate):
             # Seleccionar sección
             section = i % height_sections
-            target_min_y = section * section_height + 100
-            target_max_y = (section + 1) * section_height - 100
+            target_min_y = y_min + section * section_height + margin
+            target_max_y = y_min + (section + 1) * section_height - margin
             
-            # Encontrar plataforma en esa sección
-            suitable_platforms = []
-            for platform in all_platforms:
-                if hasattr(platform, 'y'):
-                    if target_min_y < platform.y < target_max_y:
-                        suitable_platforms.append(platform)
+            # Encontrar plataforma en esa sección (rango del índice)
+            suitable_platforms = index.in_y_range(target_min_y, target_max_y)
             
             if suitable_platforms:
-                platform = random.choice(suitable_platforms)
-                x = platform.x + random.randint(-80, 80)
-                y = platform.y - random.randint(200, 350)
+                # Unos pocos intentos para no dejarla caer junto al spawn
+                for _ in range(3):
+                    platform = random.choice(suitable_platforms)
+                    x = platform.x + random.randint(-80, 80)
+                    y = platform.y - random.randint(200, 350)
+                    if self._is_safe_spot(x, y):
+                        break
+                else:
+                    continue
                 
-                rock = FallingRock(x, y)
+                rock = self._plan_enemy('rock', x, y, gravity=ROCK_GRAVITY)
                 
                 # Aumentar gravedad según nivel
                 if self.number == 2:
                     rock.gravity *= 1.2
                 elif self.number == 3:
                     rock.gravity *= 1.4
-                
-                self.enemies.append(rock)
     
     def _generate_lightning(self):
         """Genera rayos (solo nivel 3)"""
-        print("[Level] Configurando sistema de rayos para nivel 3...")
+        event_log.info('Level', "Configurando sistema de rayos para nivel 3...")
         # Los rayos se generan dinámicamente en update
     
     def _generate_drones(self):
@@ -552,9 +705,10 @@ class Level:
             }.get(self.difficulty, 1.0)
             
             drone_count = max(1, int(base_count * difficulty_multiplier))
-            all_platforms = self.get_all_platforms()
+            all_platforms = self._plan_platforms()
             
-            print(f"[Level] Generando {drone_count} drones iniciales (difficulty: {self.difficulty})...")
+            event_log.info('Level', "Generando %s drones iniciales (difficulty: %s)...", drone_count,
+                           self.difficulty)
             
             for i in range(drone_count):
                 if len(all_platforms) > i * 2:
@@ -576,64 +730,80 @@ class Level:
                         detection_range = 150
                         patrol_range = 120
                     
-                    drone = SurveillanceDrone(x, y, patrol_range=patrol_range, detection_range=detection_range)
+                    drone = self._plan_enemy('drone', x, y, patrol_range=patrol_range,
+                                             detection_range=detection_range, speed=None)
                     
                     # Mejorar drones según nivel
                     if self.number == 3:
                         drone.detection_range += 50
                         drone.speed = 2.5 if self.difficulty == "hard" else 2.0
-                    
-                    self.enemies.append(drone)
         except ImportError as e:
-            print(f"[Level] Error importando SurveillanceDrone: {e}")
+            event_log.error('Level', "Error importando SurveillanceDrone: %s", e)
     
     def _generate_powerups_mejorado(self):
         """VERSIÓN MEJORADA Y SEGURA para generar power-ups"""
-        print("=" * 50)
-        print(f"[DEBUG POWER-UPS] Iniciando generación...")
+        event_log.debug('Level', "Power-ups: iniciando generación...")
         
         powerups_to_generate = self.config.get('powerups', 0)
-        print(f"[DEBUG] Config powerups: {powerups_to_generate}")
-        print(f"[DEBUG] Config completa: {self.config}")
+        event_log.debug('Level', "Config powerups: %s", powerups_to_generate)
+        event_log.debug('Level', "Config completa: %s", self.config)
         
         if powerups_to_generate <= 0:
-            print(f"[ERROR] ¡powerups_to_generate es {powerups_to_generate}!")
-            print(f"[SOLUCIÓN] Forzando creación de 3 power-ups de prueba")
+            event_log.error('Level', "¡powerups_to_generate es %s!", powerups_to_generate)
+            event_log.debug('Level', "Forzando creación de 3 power-ups de prueba")
             powerups_to_generate = 3
         
-        all_platforms = self.get_all_platforms()
-        print(f"[DEBUG] Total plataformas disponibles: {len(all_platforms)}")
+        all_platforms = self._plan_platforms()
+        event_log.debug('Level', "Total plataformas disponibles: %s", len(all_platforms))
         
-        # Tipos de power-ups
-        all_types = ['shield', 'speed', 'zoom', 'combo', 'time_slow', 'magnet', 'double_jump']
+        powerups_creados = self._generate_test_powerups()
+        
+        # Generar power-ups adicionales en plataformas (ya creamos 2)
+        powerups_creados += self._generate_platform_powerups(powerups_to_generate - 2, all_platforms)
         
+        event_log.debug('Level', "Total power-ups creados: %s", powerups_creados)
+        event_log.debug('Level', "Power-ups en el plan: %s", len(self.plan['powerups']))
+    
+    def _generate_test_powerups(self):
+        """
+        Los dos power-ups de prueba, siempre visibles al empezar.
+        
+        Returns:
+            int: Número de power-ups creados
+        """
         powerups_creados = 0
         
         # POWER-UP DE PRUEBA 1: En posición segura y visible
         x_test = SCREEN_WIDTH // 2
         y_test = SCREEN_HEIGHT - 150  # Justo encima del spawn
-        try:
-            powerup_test = PowerUp(x_test, y_test, 'shield')
-            self.powerups.append(powerup_test)
-            powerups_creados += 1
-            print(f"[TEST] OK Power-up TEST creado en posición visible: ({x_test}, {y_test})")
-        except Exception as e:
-            print(f"[ERROR] No se pudo crear power-up de test: {e}")
+        self._plan_powerup(x_test, y_test, 'shield')
+        powerups_creados += 1
+        event_log.debug('Level', "OK Power-up TEST creado en posición visible: (%s, %s)",
+                        x_test, y_test)
         
         # POWER-UP DE PRUEBA 2: En el centro de la pantalla
         x_test2 = SCREEN_WIDTH // 2
         y_test2 = SCREEN_HEIGHT // 2
-        try:
-            powerup_test2 = PowerUp(x_test2, y_test2, 'speed')
-            self.powerups.append(powerup_test2)
-            powerups_creados += 1
-            print(f"[TEST] OK Power-up TEST 2 creado en centro: ({x_test2}, {y_test2})")
-        except Exception as e:
-            print(f"[ERROR] No se pudo crear power-up de test 2: {e}")
+        self._plan_powerup(x_test2, y_test2, 'speed')
+        powerups_creados += 1
+        event_log.debug('Level', "OK Power-up TEST 2 creado en centro: (%s, %s)", x_test2, y_test2)
+        return powerups_creados
+    
+    def _generate_platform_powerups(self, count, platforms):
+        """
+        Coloca power-ups aleatorios sobre plataformas normales.
         
-        # Generar power-ups adicionales en plataformas
-        for i in range(powerups_to_generate - 2):  # Ya creamos 2
-            if len(all_platforms) > 4:
+        Returns:
+            int: Número de power-ups creados
+        """
+        # Tipos de power-ups
+        all_types = ['shield', 'speed', 'zoom', 'combo', 'time_slow', 'magnet', 'double_jump']
+        powerups_creados = 0
+        all_platforms = platforms
+        index = PlatformIndex(all_platforms)
+        
+        for i in range(count):
+            if all_platforms:
                 # Seleccionar plataforma aleatoria
                 platform = random.choice(all_platforms)
                 
@@ -645,19 +815,189 @@ class Level:
                 x = platform.x
                 y = platform.y - 50  # Un poco arriba de la plataforma
                 
-                try:
-                    powerup_type = random.choice(all_types)
-                    powerup = PowerUp(x, y, powerup_type)
-                    self.powerups.append(powerup)
-                    powerups_creados += 1
-                    print(f"[OK] Power-up {powerup_type} creado en ({x:.0f}, {y:.0f})")
-                except Exception as e:
-                    print(f"[ERROR] No se pudo crear power-up: {e}")
+                # Que no quede dentro de otra plataforma
+                if not index.is_free(x - 15, y - 15, 30, 30):
                     continue
+                
+                powerup_type = random.choice(all_types)
+                self._plan_powerup(x, y, powerup_type)
+                powerups_creados += 1
+                event_log.debug('Level', "Power-up %s planificado en (%.0f, %.0f)", powerup_type, x, y)
         
-        print(f"[DEBUG] Total power-ups creados: {powerups_creados}")
-        print(f"[DEBUG] Power-ups en lista: {len(self.powerups)}")
-        print("=" * 50)
+        return powerups_creados
+    
+    # ============================================
+    # 📍 CONSULTAS DE COLOCACIÓN
+    # ============================================
+    
+    def _placement_range(self, index, y_range):
+        """
+        (y_min, y_max) a repartir: el indicado o, por defecto, la altura
+        que ocupan realmente las plataformas candidatas.
+        """
+        if y_range is not None:
+            return y_range
+        return index.y_extent() or (0, self.height)
+    
+    def _is_safe_spot(self, x, y):
+        """True si (x, y) queda a más de SPAWN_SAFE_RADIUS del spawn"""
+        spawn = self.spawn_platform
+        if spawn is None:
+            return True
+        return (x - spawn.x) ** 2 + (y - spawn.y) ** 2 > SPAWN_SAFE_RADIUS ** 2
+    
+    # ============================================
+    # 📝 PLAN DE GENERACIÓN (solo datos)
+    # ============================================
+    
+    @staticmethod
+    def _new_plan():
+        return {'platforms': [], 'enemies': [], 'powerups': [], 'flags': []}
+    
+    def _plan_platform(self, kind, x, y, width, **fields):
+        """Añade una plataforma al plan ('platform', 'moving' o 'castle')"""
+        fields.setdefault('is_spawn', False)
+        fields.setdefault('is_final', False)
+        entry = LayoutEntry(kind, x=x, y=y, width=width, type=self.number, **fields)
+        self.plan['platforms'].append(entry)
+        self.reach_graph.add(entry, is_start=entry.is_spawn)
+        if entry.is_spawn:
+            self.climb_tip = entry
+            self.spawn_platform = entry
+        return entry
+    
+    def _plan_enemy(self, kind, x, y, **fields):
+        """Añade un enemigo al plan ('bat', 'trap', 'rock' o 'drone')"""
+        entry = LayoutEntry(kind, x=x, y=y, **fields)
+        self.plan['enemies'].append(entry)
+        return entry
+    
+    def _plan_powerup(self, x, y, powerup_type):
+        entry = LayoutEntry('powerup', x=x, y=y, type=powerup_type)
+        self.plan['powerups'].append(entry)
+        return entry
+    
+    def _plan_flag(self, x, y, scale=1.0):
+        entry = LayoutEntry('flag', x=x, y=y, type=self.number, scale=scale)
+        self.plan['flags'].append(entry)
+        return entry
+    
+    def _plan_platforms(self):
+        """Plataformas candidatas durante la generación: tiles + plan"""
+        candidates = []
+        if self.use_tiles and self.tile_platforms:
+            candidates.extend(self.tile_platforms)
+        candidates.extend(self.plan['platforms'])
+        return candidates
+    
+    def _take_plan(self):
+        """Serializa el plan (plataformas, enemigos, power-ups, banderas) y lo vacía"""
+        plan = self.plan
+        self.plan = self._new_plan()
+        return {key: [entry.to_dict() for entry in entries] for key, entries in plan.items()}
+    
+    def _plan_to_layout(self):
+        """Convierte el plan en un layout serializable y lo vacía"""
+        layout = {
+            'level': self.number,
+            'difficulty': self.difficulty,
+            'config': dict(self.config),
+            'height': self.height,
+        }
+        layout.update(self._take_plan())
+        if self.use_tiles and self.tile_manager:
+            # Los tiles no se guardan: basta la semilla para regenerarlos igual
+            layout['tiles'] = {'seed': self.tile_manager.seed, 'height': self.height}
+            # Misma dict que section_layouts: crece con cada sección visitada
+            layout['sections'] = self.section_layouts
+        return layout
+    
+    # ============================================
+    # 💾 LAYOUT SERIALIZADO
+    # ============================================
+    
+    @classmethod
+    def from_layout(cls, layout):
+        """Construye un nivel desde un layout (ruta rápida, sin generación)"""
+        return cls(layout['level'], layout['config'],
+                   difficulty=layout.get('difficulty', "normal"), layout=layout)
+    
+    def to_layout(self):
+        """
+        Layout del nivel tal como se generó (datos puros, serializable a JSON):
+        plataformas, enemigos con sus parámetros, power-ups y banderas.
+        Los elementos dinámicos (rayos, drones extra) no forman parte de él.
+        """
+        return self.layout
+    
+    def materialize(self):
+        """
+        Crea los objetos del juego (y sus superficies) a partir del layout.
+        Debe llamarse en el hilo principal; solo tiene efecto la primera vez.
+        """
+        if not self.materialized:
+            self.materialized = True
+            self.height = self.layout.get('height', self.height)
+            self._spawn_layout_objects(self.layout)
+            # Secciones que ya se generaron antes de materializar
+            for key, section in (self.section_layouts or {}).items():
+                if self.tile_manager and self.tile_manager.sections_ready[int(key)]:
+                    self._spawn_layout_objects(section)
+            self._print_summary()
+        return self
+    
+    def _spawn_layout_objects(self, layout):
+        """Instancia los objetos descritos en un layout y los añade al nivel"""
+        for desc in layout['platforms']:
+            kind = desc['kind']
+            if kind == 'moving':
+                platform = MovingPlatform(desc['x'], desc['y'], desc['width'], desc['type'],
+                                          move_range=desc['move_range'], speed=desc['speed'])
+            elif kind == 'castle':
+                platform = CastlePlatform(desc['x'], desc['y'], desc['width'], desc['type'])
+            else:
+                platform = Platform(desc['x'], desc['y'], desc['width'], desc['type'])
+            
+            platform.is_spawn = desc.get('is_spawn', False)
+            platform.is_final = desc.get('is_final', kind == 'castle')
+            if desc.get('is_difficult'):
+                platform.is_difficult = True
+            if platform.is_final:
+                self.final_platform = platform
+            self.platforms.append(platform)
+        
+        for desc in layout['enemies']:
+            kind = desc['kind']
+            if kind == 'bat':
+                enemy = enemy_pools.acquire(Bat, desc['x'], desc['y'], desc['patrol_range'])
+                enemy.speed = desc['speed']
+            elif kind == 'trap':
+                enemy = RotatingTrap(desc['x'], desc['y'])
+                enemy.rotation_speed = desc['rotation_speed']
+            elif kind == 'rock':
+                enemy = enemy_pools.acquire(FallingRock, desc['x'], desc['y'])
+                enemy.gravity = desc['gravity']
+            elif kind == 'drone':
+                enemy = enemy_pools.acquire(SurveillanceDrone, desc['x'], desc['y'],
+                                            patrol_range=desc['patrol_range'],
+                                            detection_range=desc['detection_range'])
+                if desc.get('speed') is not None:
+                    enemy.speed = desc['speed']
+            else:
+                event_log.warning('Level', "Tipo de enemigo desconocido en layout: %s", kind)
+                continue
+            self.enemies.append(enemy)
+        
+        for desc in layout['powerups']:
+            try:
+                self.powerups.append(PowerUp(desc['x'], desc['y'], desc['type']))
+            except Exception as e:
+                event_log.error('Level', "No se pudo crear power-up: %s", e)
+        
+        for desc in layout['flags']:
+            flag = VictoryFlag(desc['x'], desc['y'], desc['type'])
+            flag.scale = desc.get('scale', 1.0)
+            self.flags.append(flag)
     
     # ============================================
     # 🔧 MÉTODOS DE UTILIDAD
@@ -674,6 +1014,16 @@ class Level:
         
         return all_platforms
     
+    def get_reachability_graph(self):
+        """
+        Grafo de alcanzabilidad de las plataformas actuales del nivel (sirve
+        también para niveles construidos desde un layout). Para bots y
+        herramientas.
+        """
+        if self.tile_manager:
+            self.tile_manager.ensure_all()
+        return build_reachability_graph(self.get_all_platforms(), self.difficulty)
+    
     def get_spawn_position(self):
         """Retorna la posición de spawn del jugador"""
         all_platforms = self.get_all_platforms()
@@ -688,7 +1038,7 @@ class Level:
     # 🔄 MÉTODOS DE ACTUALIZACIÓN
     # ============================================
     
-    def update(self, dt, player_y, player_x=None):
+    def update(self, dt, player_y, player_x=None, lava_y=None):
         """
         Actualiza todos los elementos del nivel.
         
@@ -696,6 +1046,7 @@ class Level:
             dt: Delta time
             player_y: Posición Y del jugador
             player_x: Posición X del jugador (para drones)
+            lava_y: Superficie de la lava (los enemigos por debajo se retiran)
         """
         # Actualizar plataformas móviles
         for platform in self.platforms:
@@ -708,22 +1059,36 @@ class Level:
         for flag in self.flags:
             flag.update(dt)
         
-        # Actualizar enemigos
-        active_enemies = []
-        for enemy in self.enemies:
+        # Actualizar enemigos: los tipos homogéneos en lote (vectorizado) y
+        # el resto objeto a objeto. La lista se compacta en el sitio y los
+        # que salen vuelven a su pool para reutilizarse
+        batches = self.enemy_batches
+        batches.update(dt)
+        
+        enemies = self.enemies
+        lifecycle = self.lifecycle
+        lifecycle.begin_frame(player_y, lava_y)
+        player_pos = (player_x, player_y) if player_x else None
+        kept = 0
+        for enemy in enemies:
             if enemy.active:
-                # Pasar posición del jugador a drones
-                if hasattr(enemy, '__class__') and enemy.__class__.__name__ == 'SurveillanceDrone':
-                    enemy.update(dt, (player_x, player_y) if player_x else None)
-                else:
-                    enemy.update(dt)
+                if enemy.batch_slot is None:
+                    batch = batches.get(type(enemy))
+                    if batch is not None:
+                        # Nuevo en el lote: se mueve desde el próximo frame
+                        batch.add(enemy)
+                    elif isinstance(enemy, SurveillanceDrone):
+                        # Pasar posición del jugador a drones
+                        enemy.update(dt, player_pos)
+                    else:
+                        enemy.update(dt)
                 
-                if hasattr(enemy, 'should_remove'):
-                    if not enemy.should_remove():
-                        active_enemies.append(enemy)
-                else:
-                    active_enemies.append(enemy)
-        self.enemies = active_enemies
+                if lifecycle.keep(enemy, dt):
+                    enemies[kept] = enemy
+                    kept += 1
+                    continue
+            self._drop_enemy(enemy)
+        del enemies[kept:]
         
         # Actualizar power-ups
         for powerup in self.powerups:
@@ -731,25 +1096,65 @@ class Level:
                 powerup.update(dt)
         
         # Actualizar efectos
-        active_effects = []
-        for effect in self.effects:
+        effects = self.effects
+        kept = 0
+        for effect in effects:
             if effect.active:
                 effect.update(dt)
-                active_effects.append(effect)
-        self.effects = active_effects
+                effects[kept] = effect
+                kept += 1
+        del effects[kept:]
         
         # Spawning dinámico mejorado
         if player_y is not None:
             self._dynamic_spawning(player_y, dt, player_x)
         
         # Limpiar power-ups recolectados
-        self.powerups = [p for p in self.powerups if not p.collected]
+        powerups = self.powerups
+        kept = 0
+        for powerup in powerups:
+            if not powerup.collected:
+                powerups[kept] = powerup
+                kept += 1
+        del powerups[kept:]
+    
+    def spawn_enemy(self, cls, *args, **kwargs):
+        """
+        Genera un enemigo durante la partida (desde su pool) respetando el
+        máximo por tipo; queda con la edad máxima de su tipo.
+        
+        Returns:
+            El enemigo añadido, o None si ya hay demasiados de ese tipo
+        """
+        if not self.lifecycle.can_spawn(cls):
+            return None
+        enemy = enemy_pools.acquire(cls, *args, **kwargs)
+        self.lifecycle.spawned(enemy)
+        self.enemies.append(enemy)
+        return enemy
+    
+    def _drop_enemy(self, enemy):
+        """Saca un enemigo ya quitado de la lista de su lote y lo devuelve a su pool"""
+        self.enemy_batches.remove(enemy)
+        enemy_pools.release(enemy)
+    
+    def release_enemies(self):
+        """Devuelve todos los enemigos a sus pools (al abandonar el nivel)"""
+        self.enemy_batches.clear()
+        for enemy in self.enemies:
+            enemy_pools.release(enemy)
+        self.enemies.clear()
+    
+    def _rock_reference_y(self, player_y):
+        """Altura de la cima a la que se acercan las rocas (None: sin rocas dinámicas)"""
+        return self.final_platform.y if self.final_platform else None
     
     def _dynamic_spawning(self, player_y, dt, player_x=None):
         """Spawning dinámico mejorado"""
         # ROCAS - más frecuentes cerca de la cima
-        if self.final_platform:
-            distance_to_top = abs(player_y - self.final_platform.y)
+        top_y = self._rock_reference_y(player_y)
+        if top_y is not None:
+            distance_to_top = abs(player_y - top_y)
             
             # Base chance aumenta cerca de la cima
             rock_base_chance = {1: 0.003, 2: 0.004, 3: 0.005}[self.number]
@@ -769,8 +1174,7 @@ class Level:
                     x = random.randint(60, SCREEN_WIDTH - 60)
                 
                 y = player_y - random.randint(200, 500)
-                rock = FallingRock(x, y)
-                self.enemies.append(rock)
+                self.spawn_enemy(FallingRock, x, y)
         
         # RAYOS - nivel 3
         if self.number == 3:
@@ -782,8 +1186,7 @@ class Level:
                     x = random.randint(80, SCREEN_WIDTH - 80)
                 
                 y = player_y - random.randint(50, 200)
-                lightning = Lightning(x, y)
-                self.enemies.append(lightning)
+                self.spawn_enemy(Lightning, x, y)
         
         # MURCIÉLAGOS EXTRA - en niveles altos
         if player_y < self.height * 0.4:  # En la mitad superior
@@ -806,9 +1209,9 @@ class Level:
                 else:
                     patrol_range = random.randint(150, 250)
                 
-                bat = Bat(x, y, patrol_range)
-                bat.speed = random.uniform(2.0, 3.0)
-                self.enemies.append(bat)
+                bat = self.spawn_enemy(Bat, x, y, patrol_range)
+                if bat:
+                    bat.speed = random.uniform(2.0, 3.0)
     
     # ============================================
     # 🎨 MÉTODOS DE DIBUJADO - ADAPTADOS PARA NIVEL GRANDE
@@ -818,10 +1221,12 @@ class Level:
         """Dibuja el fondo con parallax - ADAPTADO PARA NIVEL GRANDE"""
         surface.fill(self.theme['bg'])
         
+        # Con calidad baja se dibuja uno de cada parallax_stride elementos
+        stride = quality.current['parallax_stride']
         for layer in self.parallax_layers:
             layer['offset'] = camera_offset * layer['speed']
             
-            for elem in layer['elements']:
+            for elem in layer['elements'][::stride]:
                 screen_y = elem['y'] - layer['offset']
                 
                 # Wrap around para nivel grande
@@ -890,12 +1295,13 @@ class Level:
                     powerups_dibujados += 1
                 except Exception as e:
                     # Dibujo de emergencia
-                    print(f"[DEBUG] Error dibujando power-up {i}: {e}")
+                    event_log.debug('Level', "Error dibujando power-up %s: %s", i, e)
                     screen_y = getattr(powerup, 'y', 0) - camera_offset
                     pygame.draw.circle(surface, (255, 0, 0), 
                                      (int(getattr(powerup, 'x', 100)), int(screen_y)), 20)
-                    font = pygame.font.Font(None, 20)
-                    text = font.render("P", True, (255, 255, 255))
+                    if self._debug_font is None:
+                        self._debug_font = pygame.font.Font(None, 20)
+                    text = self._debug_font.render("P", True, (255, 255, 255))
                     surface.blit(text, (getattr(powerup, 'x', 100) - 5, screen_y - 10))
         
         # Dibujar enemigos
@@ -919,11 +1325,18 @@ class Level:
                 return True
         return False
     
-    def get_all_platforms_for_player(self):
+    def get_all_platforms_for_player(self, player_rect=None):
+        """
+        Plataformas contra las que colisiona el jugador. Con player_rect,
+        de los tiles solo se devuelven los tramos de las filas cercanas.
+        """
         all_platforms = []
         
-        if hasattr(self, 'tile_platforms'):
-            all_platforms.extend(self.tile_platforms)
+        if self.use_tiles and self.tile_manager:
+            if player_rect is not None:
+                all_platforms.extend(self.tile_manager.platforms_near(player_rect))
+            else:
+                all_platforms.extend(self.tile_platforms)
         
         all_platforms.extend(self.platforms)
         
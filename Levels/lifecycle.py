@@ -0,0 +1,68 @@
+"""
+lifecycle.py - Ciclo de vida de los enemigos de un nivel
+
+Decide cada frame qué enemigos siguen vivos:
+  - los que quedan a más de DESPAWN_BELOW_CAMERA por debajo del jugador
+    (la cámara no vuelve a bajar tanto) o bajo la lava ya no se ven ni
+    pueden tocar al jugador;
+  - los generados durante la partida tienen una edad máxima por tipo
+    (ENEMY_MAX_AGES) que comprueba Enemy.should_remove();
+  - y un máximo de instancias vivas por tipo (ENEMY_SPAWN_CAPS): al
+    llegar a él no se generan más hasta que se retire alguno.
+
+Así la lista de enemigos no crece durante las partidas largas.
+"""
+
+from objects.constants import (DESPAWN_BELOW_CAMERA, DESPAWN_BELOW_LAVA,
+                               ENEMY_MAX_AGES, ENEMY_SPAWN_CAPS)
+
+
+class LifecycleManager:
+    """Retira enemigos por distancia, lava y edad, y limita los generados"""
+
+    def __init__(self, max_ages=ENEMY_MAX_AGES, caps=ENEMY_SPAWN_CAPS,
+                 despawn_distance=DESPAWN_BELOW_CAMERA, lava_margin=DESPAWN_BELOW_LAVA):
+        self.max_ages = max_ages
+        self.caps = caps
+        self.despawn_distance = despawn_distance
+        self.lava_margin = lava_margin
+        self.cull_y = None
+        self.counts = {}     # clase -> generados vivos (se recuenta cada frame)
+        self.culled = 0      # Total retirados (estadística)
+
+    def begin_frame(self, player_y, lava_y=None):
+        """Calcula la línea de retirada del frame y reinicia el recuento"""
+        if player_y is None:
+            self.cull_y = None
+        else:
+            self.cull_y = player_y + self.despawn_distance
+            if lava_y is not None:
+                self.cull_y = min(self.cull_y, lava_y + self.lava_margin)
+        self.counts.clear()
+
+    def keep(self, enemy, dt):
+        """
+        Avanza la edad del enemigo y decide si sigue vivo. Se llama una vez
+        por enemigo activo y frame, después de actualizarlo.
+        """
+        enemy.age += dt
+        if (self.cull_y is not None and enemy.y > self.cull_y) or enemy.should_remove():
+            self.culled += 1
+            return False
+        if enemy.max_age is not None:
+            cls = type(enemy)
+            self.counts[cls] = self.counts.get(cls, 0) + 1
+        return True
+
+    def can_spawn(self, cls):
+        """True si aún cabe otro enemigo generado de ese tipo"""
+        cap = self.caps.get(cls.__name__)
+        return cap is None or self.counts.get(cls, 0) < cap
+
+    def spawned(self, enemy):
+        """Registra un enemigo generado durante la partida (con edad máxima)"""
+        cls = type(enemy)
+        max_age = self.max_ages.get(cls.__name__)
+        # Sin límite de edad también cuenta para el máximo por tipo
+        enemy.max_age = max_age if max_age is not None else float('inf')
+        self.counts[cls] = self.counts.get(cls, 0) + 1
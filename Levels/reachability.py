@@ -0,0 +1,216 @@
+"""
+reachability.py - Envolvente de salto y grafo de alcanzabilidad
+
+La envolvente se precalcula una vez por dificultad a partir de la física
+que ejecuta Player (PLAYER_JUMP_FORCE, PLAYER_GRAVITY, PLAYER_RUN_SPEED con
+la fricción del aire, y player_jumps de la dificultad): para cada desnivel
+entero guarda la distancia horizontal máxima que se puede salvar.
+Comprobar si una plataforma es alcanzable desde otra es una consulta O(1)
+a esa tabla.
+
+La generación de niveles la usa para colocar solo plataformas alcanzables
+(sin validar ni regenerar después) y mantiene un ReachabilityGraph a medida
+que planifica; el mismo grafo sirve para bots y herramientas.
+"""
+
+import math
+from collections import deque
+from objects.constants import (DIFFICULTY_SETTINGS, PLAYER_JUMP_FORCE, PLAYER_GRAVITY,
+                               PLAYER_RUN_SPEED, PLAYER_AIR_FRICTION)
+
+# Fracción de la distancia teórica que se da por buena (margen para el jugador)
+REACH_SAFETY = 0.8
+# Caída máxima (en múltiplos de la altura de salto) que se considera arista
+REACH_MAX_DROP_FACTOR = 3
+
+# Envolventes ya calculadas (una por dificultad)
+_envelopes = {}
+
+
+class JumpEnvelope:
+    """
+    Alcance de salto de una física concreta. Los desniveles van en píxeles
+    y son positivos hacia arriba (destino más alto que el origen).
+    """
+
+    def __init__(self, jump_strength, gravity, player_speed, double_jump=False,
+                 safety=REACH_SAFETY):
+        self.jump_strength = jump_strength
+        self.gravity = gravity
+        self.player_speed = player_speed
+        self.double_jump = double_jump
+
+        # Altura de un salto y altura total (el doble salto se da en el vértice)
+        self.jump_height = jump_strength ** 2 / (2 * gravity)
+        self.max_rise = int(self.jump_height * (2 if double_jump else 1) * safety)
+        self.max_drop = int(self.jump_height * REACH_MAX_DROP_FACTOR)
+
+        # reach[dy + max_drop] = hueco horizontal máximo para ese desnivel
+        self.reach = [int(self._flight_frames(dy) * player_speed * safety)
+                      for dy in range(-self.max_drop, self.max_rise + 1)]
+
+    def _flight_frames(self, dy):
+        """Frames de vuelo hasta aterrizar dy píxeles más arriba (rama de bajada)"""
+        v, g = self.jump_strength, self.gravity
+        if not self.double_jump:
+            return (v + math.sqrt(max(0.0, v * v - 2 * g * dy))) / g
+        # Primer salto hasta el vértice y segundo salto desde allí
+        return v / g + (v + math.sqrt(max(0.0, v * v - 2 * g * (dy - self.jump_height)))) / g
+
+    def max_gap(self, dy):
+        """Hueco horizontal máximo salvable con un desnivel dy (-1 si no se puede). O(1)"""
+        dy = int(dy)
+        if dy > self.max_rise or dy < -self.max_drop:
+            return -1
+        return self.reach[dy + self.max_drop]
+
+    def can_reach(self, source, target):
+        """
+        True si se puede saltar de source a target. Ambos con x/y centrales
+        y width, como Platform, LayoutEntry o TilePlatform. O(1)
+        """
+        gap = abs(target.x - source.x) - (source.width + target.width) / 2
+        return gap <= self.max_gap(source.y - target.y)
+
+    def x_range(self, source, width, target_y):
+        """
+        Intervalo de centros x en el que una plataforma de ese ancho a la
+        altura target_y queda al alcance de source (None si ninguna).
+        """
+        gap = self.max_gap(source.y - target_y)
+        if gap < 0:
+            return None
+        reach = gap + (source.width + width) / 2
+        return source.x - reach, source.x + reach
+
+    def rise_for_gap(self, gap, preferred):
+        """Mayor desnivel <= preferred con el que aún se salva el hueco gap"""
+        for dy in range(min(int(preferred), self.max_rise), -1, -1):
+            if self.max_gap(dy) >= gap:
+                return dy
+        return 0
+
+
+def jump_envelope(difficulty):
+    """
+    Envolvente de salto de una dificultad (se calcula una sola vez). Usa la
+    física de Player, no jump_strength/gravity/player_speed de
+    DIFFICULTY_SETTINGS, que el jugador no lee.
+    """
+    if difficulty not in _envelopes:
+        settings = DIFFICULTY_SETTINGS.get(difficulty, DIFFICULTY_SETTINGS['normal'])
+        # En el aire el jugador avanza run_speed * fricción por frame
+        _envelopes[difficulty] = JumpEnvelope(-PLAYER_JUMP_FORCE, PLAYER_GRAVITY,
+                                              PLAYER_RUN_SPEED * PLAYER_AIR_FRICTION,
+                                              settings.get('player_jumps', 1) > 1)
+    return _envelopes[difficulty]
+
+
+class ReachabilityGraph:
+    """
+    Grafo dirigido de plataformas (arista = salto posible). Se construye de
+    forma incremental: cada plataforma nueva solo se compara con las de las
+    bandas de altura que puede alcanzar o desde las que se la alcanza.
+    """
+
+    def __init__(self, envelope):
+        self.envelope = envelope
+        self.nodes = []
+        self.edges = []           # edges[i] = índices alcanzables desde i
+        self.reachable = set()    # Nodos alcanzables desde el inicio
+        self._index = {}          # id(plataforma) -> índice
+        self._bands = {}          # banda de altura -> índices
+        self._band_height = max(1, envelope.max_rise)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _band(self, y):
+        return int(y // self._band_height)
+
+    def add(self, platform, is_start=False):
+        """
+        Añade una plataforma y sus aristas con las cercanas.
+
+        Returns:
+            bool: True si es alcanzable desde el inicio
+        """
+        index = len(self.nodes)
+        self.nodes.append(platform)
+        self.edges.append([])
+        self._index[id(platform)] = index
+
+        envelope = self.envelope
+        band = self._band(platform.y)
+        drop_bands = envelope.max_drop // self._band_height + 1
+        reached = is_start
+        for other_band in range(band - drop_bands, band + drop_bands + 1):
+            for other in self._bands.get(other_band, ()):
+                node = self.nodes[other]
+                if envelope.can_reach(node, platform):
+                    self.edges[other].append(index)
+                    reached = reached or other in self.reachable
+                if envelope.can_reach(platform, node):
+                    self.edges[index].append(other)
+        self._bands.setdefault(band, []).append(index)
+
+        if reached:
+            self._spread(index)
+        return index in self.reachable
+
+    def _spread(self, start):
+        """Marca como alcanzable start y todo lo que se alcanza desde él"""
+        pending = deque([start])
+        self.reachable.add(start)
+        while pending:
+            for neighbour in self.edges[pending.popleft()]:
+                if neighbour not in self.reachable:
+                    self.reachable.add(neighbour)
+                    pending.append(neighbour)
+
+    def is_reachable(self, platform):
+        """True si la plataforma está en el grafo y es alcanzable desde el inicio"""
+        return self._index.get(id(platform)) in self.reachable
+
+    def path(self, source, target):
+        """
+        Secuencia de plataformas de source a target (BFS), o None si no hay
+        camino. Pensado para bots y herramientas.
+        """
+        start, goal = self._index.get(id(source)), self._index.get(id(target))
+        if start is None or goal is None:
+            return None
+        previous = {start: None}
+        pending = deque([start])
+        while pending:
+            current = pending.popleft()
+            if current == goal:
+                route = []
+                while current is not None:
+                    route.append(self.nodes[current])
+                    current = previous[current]
+                return route[::-1]
+            for neighbour in self.edges[current]:
+                if neighbour not in previous:
+                    previous[neighbour] = current
+                    pending.append(neighbour)
+        return None
+
+
+def build_reachability_graph(platforms, difficulty="normal", start=None):
+    """
+    Grafo de una lista de plataformas ya existente (p. ej. un nivel cargado
+    desde un layout). start es la plataforma inicial; por defecto la que
+    tenga is_spawn o, si no hay, la más baja.
+    """
+    graph = ReachabilityGraph(jump_envelope(difficulty))
+    if not platforms:
+        return graph
+    if start is None:
+        spawns = [p for p in platforms if getattr(p, 'is_spawn', False)]
+        start = spawns[0] if spawns else max(platforms, key=lambda p: p.y)
+    graph.add(start, is_start=True)
+    for platform in platforms:
+        if platform is not start:
+            graph.add(platform)
+    return graph
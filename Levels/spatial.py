@@ -0,0 +1,76 @@
+"""
+spatial.py - Índice espacial de plataformas para colocar objetos
+
+Al generar un nivel cada enemigo o power-up pregunta por "la plataforma
+más cercana a esta altura", "las plataformas entre estas alturas" o "¿está
+libre este hueco?". PlatformIndex responde con búsqueda binaria sobre las
+alturas ordenadas (un índice de intervalos en y), en lugar de recorrer
+todas las plataformas por cada objeto colocado.
+
+Funciona con cualquier objeto con x/y centrales y width (Platform,
+LayoutEntry, TilePlatform) y no usa pygame, así que vale en el hilo de
+pre-generación.
+"""
+
+import bisect
+from objects.constants import PLATFORM_HEIGHT
+
+
+def platform_bounds(platform):
+    """(izquierda, arriba, derecha, abajo) de una plataforma con x/y centrales"""
+    half_width = platform.width / 2
+    half_height = getattr(platform, 'height', PLATFORM_HEIGHT) / 2
+    return (platform.x - half_width, platform.y - half_height,
+            platform.x + half_width, platform.y + half_height)
+
+
+class PlatformIndex:
+    """Plataformas ordenadas por altura para consultas por rango de y"""
+
+    def __init__(self, platforms=()):
+        ordered = sorted((p for p in platforms if hasattr(p, 'y')), key=lambda p: p.y)
+        self._platforms = ordered
+        self._ys = [p.y for p in ordered]
+        # Semialtura máxima: cuánto puede sobresalir una plataforma de su y
+        self._max_half_height = max((getattr(p, 'height', PLATFORM_HEIGHT) / 2
+                                     for p in ordered), default=0)
+
+    def __len__(self):
+        return len(self._platforms)
+
+    # ============================================
+    # 🔎 CONSULTAS
+    # ============================================
+
+    def y_extent(self):
+        """(y mínima, y máxima) de las plataformas, o None si no hay"""
+        if not self._ys:
+            return None
+        return self._ys[0], self._ys[-1]
+
+    def nearest(self, y, max_distance=float('inf')):
+        """Plataforma cuya y está más cerca de y (None si ninguna a menos de max_distance)"""
+        index = bisect.bisect_left(self._ys, y)
+        best, best_distance = None, max_distance
+        for candidate in (index - 1, index):
+            if 0 <= candidate < len(self._ys):
+                distance = abs(self._ys[candidate] - y)
+                if distance < best_distance:
+                    best, best_distance = self._platforms[candidate], distance
+        return best
+
+    def in_y_range(self, y_min, y_max):
+        """Plataformas con y_min < y < y_max"""
+        first = bisect.bisect_right(self._ys, y_min)
+        last = bisect.bisect_left(self._ys, y_max)
+        return self._platforms[first:last]
+
+    def is_free(self, left, top, width, height):
+        """True si el rectángulo no se solapa con ninguna plataforma"""
+        right, bottom = left + width, top + height
+        reach = self._max_half_height
+        for platform in self.in_y_range(top - reach, bottom + reach):
+            p_left, p_top, p_right, p_bottom = platform_bounds(platform)
+            if left < p_right and p_left < right and top < p_bottom and p_top < bottom:
+                return False
+        return True
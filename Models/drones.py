@@ -7,6 +7,8 @@ import pygame
 import math
 import random
 from objects.constants import *
+from objects.event_log import event_log
+from objects.memory_ledger import memory_ledger
 
 class SurveillanceDrone:
     """Dron que detecta al jugador y cambia su patrón"""
@@ -24,6 +26,7 @@ class SurveillanceDrone:
         # CARGAR IMAGEN DEL DRON
         self.image = self.load_drone_image()
         self.original_image = self.image.copy() if self.image else None
+        memory_ledger.track('drones', self, 'image', 'original_image')
         
         # Visión computacional simulada
         self.detection_range = detection_range
@@ -47,26 +50,26 @@ class SurveillanceDrone:
         self.player_positions = []
         self.predicted_position = (x, y)
         
-        print(f"[Drone] Creado en ({x}, {y}) con imagen: {'Sí' if self.image else 'No'}")
+        event_log.debug('Drone', "Creado en (%s, %s) con imagen: %s", x, y, 'Sí' if self.image else 'No')
     
     def load_drone_image(self):
         """Carga la imagen del dron o crea una por defecto"""
         try:
             # Intenta cargar la imagen
             image_path = "./Assets/Enemies/drone.png"
-            print(f"[Drone] Intentando cargar: {image_path}")
+            event_log.debug('Drone', "Intentando cargar: %s", image_path)
             
             image = pygame.image.load(image_path).convert_alpha()
-            print(f"[Drone] Imagen cargada: {image.get_width()}x{image.get_height()}")
+            event_log.debug('Drone', "Imagen cargada: %sx%s", image.get_width(), image.get_height())
             
             # Escalar al tamaño correcto
             scaled_image = pygame.transform.scale(image, (self.width, self.height))
-            print(f"[Drone] Imagen escalada a: {self.width}x{self.height}")
+            event_log.debug('Drone', "Imagen escalada a: %sx%s", self.width, self.height)
             return scaled_image
             
         except Exception as e:
-            print(f"[Drone] No se pudo cargar drone.png: {e}")
-            print(f"[Drone] Creando imagen por defecto...")
+            event_log.error('Drone', "No se pudo cargar drone.png: %s", e)
+            event_log.debug('Drone', "Creando imagen por defecto...")
             
             # Crear imagen por defecto
             surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
@@ -98,7 +101,7 @@ class SurveillanceDrone:
             px = self.x + random.randint(-200, 200)
             py = self.y + random.randint(-100, 100)
             self.patrol_points.append((px, py))
-        print(f"[Drone] Puntos de patrulla: {self.patrol_points}")
+        event_log.debug('Drone', "Puntos de patrulla: %s", self.patrol_points)
     
     def update(self, dt, player_pos=None):
         """Actualiza dron con IA"""
@@ -220,13 +223,18 @@ class SurveillanceDrone:
     
     def update_particles(self, dt):
         """Actualiza partículas"""
-        for p in self.particles[:]:
+        particles = self.particles
+        kept = 0
+        for p in particles:
             p['x'] += p['vx']
             p['y'] += p['vy']
             p['life'] -= dt
             
             if p['life'] <= 0:
-                self.particles.remove(p)
+                continue
+            particles[kept] = p
+            kept += 1
+        del particles[kept:]
     
     def draw(self, surface, camera_offset):
         """Dibuja dron con todos los efectos"""
@@ -256,7 +264,7 @@ class SurveillanceDrone:
                     surface.blit(glow, rect.topleft, special_flags=pygame.BLEND_ADD)
                     
             except Exception as e:
-                print(f"[Drone] Error dibujando imagen: {e}")
+                event_log.debug('Drone', "Error dibujando imagen: %s", e)
                 # Fallback: dibujar formas
                 self.draw_fallback(surface, screen_x, screen_y)
         else:
@@ -7,6 +7,9 @@ import math
 import random
 from objects.constants import *
 from objects.utils import sine_wave
+from objects.assets import asset_cache, rotated
+from objects.memory_ledger import memory_ledger
+from objects.quality import quality
 
 
 
@@ -14,10 +17,23 @@ class Enemy:
     """Clase base para todos los enemigos"""
     
     def __init__(self, x, y):
+        self.damage = 20  # Daño base para todos los enemigos
+        Enemy.reset(self, x, y)
+    
+    def reset(self, x, y):
+        """Estado común de una instancia nueva o reciclada desde el pool"""
         self.x = x
         self.y = y
         self.active = True
-        self.damage = 20  # Daño base para todos los enemigos
+        # Ciclo de vida: segundos vivo y edad máxima (None = sin límite)
+        self.age = 0.0
+        self.max_age = None
+        # Hueco en el lote vectorizado de su tipo (ver enemy_batch.py)
+        self.batch_slot = None
+    
+    def should_remove(self):
+        """True cuando ha superado su edad máxima"""
+        return self.max_age is not None and self.age > self.max_age
     
     def get_rect(self):
         """Retorna el rectángulo de colisión"""
@@ -40,22 +56,26 @@ class Bat(Enemy):
     
     def __init__(self, x, y, patrol_range=150):
         super().__init__(x, y)
-        self.start_x = x
-        self.start_y = y
-        self.patrol_range = patrol_range
-        self.speed = BAT_SPEED
-        self.time = random.uniform(0, 2 * math.pi)
-        self.direction = random.choice([-1, 1])
-        
         # Dimensiones
         self.width = BAT_WIDTH
         self.height = BAT_HEIGHT
         
         # Rotación (transformación)
-        self.angle = 0
         self.rotation_speed = 2
 
         self.damage = 15  # Daño específico para murciélago
+        self.reset(x, y, patrol_range)
+    
+    def reset(self, x, y, patrol_range=150):
+        """Reinicia el estado de patrulla (lo usa también el pool de enemigos)"""
+        super().reset(x, y)
+        self.start_x = x
+        self.start_y = y
+        self.patrol_range = patrol_range
+        self.speed = BAT_SPEED
+        self.time = random.uniform(0, 2 * math.pi)
+        self.direction = random.choice([-1, 1])
+        self.angle = 0
     
     def get_rect(self):
         return pygame.Rect(self.x - self.width//2, self.y - self.height//2,
@@ -91,6 +111,15 @@ class Bat(Enemy):
         if screen_y < -50 or screen_y > SCREEN_HEIGHT + 50:
             return
         
+        # Aplicar transformación de rotación (rotaciones compartidas entre murciélagos)
+        rotated_surface = rotated(('bat', self.width, self.height), self.angle,
+                                  quality.current['rotation_step'], self._build_sprite)
+        rotated_rect = rotated_surface.get_rect(center=(self.x, screen_y))
+        
+        surface.blit(rotated_surface, rotated_rect)
+    
+    def _build_sprite(self):
+        """Sprite del murciélago sin rotar"""
         # Color del murciélago
         color = (100, 50, 150)  # Púrpura oscuro
         
@@ -111,12 +140,7 @@ class Bat(Enemy):
         pygame.draw.polygon(bat_surface, color,
                            [(self.width-5, 15), (self.width, 25), 
                             (self.width-10, 20)])
-        
-        # Aplicar transformación de rotación
-        rotated_surface = pygame.transform.rotate(bat_surface, self.angle)
-        rotated_rect = rotated_surface.get_rect(center=(self.x, screen_y))
-        
-        surface.blit(rotated_surface, rotated_rect)
+        return bat_surface
 
 
 class RotatingTrap(Enemy):
@@ -151,6 +175,15 @@ class RotatingTrap(Enemy):
         if screen_y < -50 or screen_y > SCREEN_HEIGHT + 50:
             return
         
+        # Aplicar transformación de rotación (rotaciones compartidas entre trampas)
+        rotated_surface = rotated(('trap', self.size), self.angle,
+                                  quality.current['rotation_step'], self._build_sprite)
+        rotated_rect = rotated_surface.get_rect(center=(self.x, screen_y))
+        
+        surface.blit(rotated_surface, rotated_rect)
+    
+    def _build_sprite(self):
+        """Estrella de púas sin rotar"""
         # Crear superficie para la trampa
         trap_surface = pygame.Surface((self.size * 2, self.size * 2), 
                                       pygame.SRCALPHA)
@@ -176,12 +209,7 @@ class RotatingTrap(Enemy):
         
         pygame.draw.polygon(trap_surface, RED, points)
         pygame.draw.polygon(trap_surface, (150, 0, 0), points, 3)
-        
-        # Aplicar transformación de rotación
-        rotated_surface = pygame.transform.rotate(trap_surface, self.angle)
-        rotated_rect = rotated_surface.get_rect(center=(self.x, screen_y))
-        
-        surface.blit(rotated_surface, rotated_rect)
+        return trap_surface
 
 
 class FallingRock(Enemy):
@@ -193,12 +221,16 @@ class FallingRock(Enemy):
     def __init__(self, x, y):
         super().__init__(x, y)
         self.size = ROCK_SIZE
+        self.damage = 30  # Daño específico para roca
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Vuelve a colocar la roca en reposo en (x, y)"""
+        super().reset(x, y)
         self.vel_y = 0
-        self.gravity = 2.0  # GRAVEDAD REDUCIDA para caída más lenta
+        self.gravity = ROCK_GRAVITY  # GRAVEDAD REDUCIDA para caída más lenta
         self.rotation_angle = random.uniform(0, 360)
         self.rotation_vel = random.uniform(-3, 3)  # REDUCIDO para rotación más lenta
-        self.damage = 30  # Daño específico para roca
-        self.active = True
     
     def get_rect(self):
         return pygame.Rect(self.x - self.size//2, self.y - self.size//2,
@@ -231,6 +263,15 @@ class FallingRock(Enemy):
         if screen_y < -50 or screen_y > SCREEN_HEIGHT + 50:
             return
         
+        # Aplicar rotación (rotaciones compartidas entre rocas)
+        rotated_surface = rotated(('rock', self.size), self.rotation_angle,
+                                  quality.current['rotation_step'], self._build_sprite)
+        rotated_rect = rotated_surface.get_rect(center=(self.x, screen_y))
+        
+        surface.blit(rotated_surface, rotated_rect)
+    
+    def _build_sprite(self):
+        """Roca sin rotar"""
         # Crear superficie para la roca
         rock_surface = pygame.Surface((self.size, self.size), 
                                       pygame.SRCALPHA)
@@ -247,13 +288,7 @@ class FallingRock(Enemy):
         
         pygame.draw.polygon(rock_surface, GRAY, points)
         pygame.draw.polygon(rock_surface, (80, 80, 80), points, 2)
-        
-        # Aplicar rotación
-        rotated_surface = pygame.transform.rotate(rock_surface, 
-                                                  self.rotation_angle)
-        rotated_rect = rotated_surface.get_rect(center=(self.x, screen_y))
-        
-        surface.blit(rotated_surface, rotated_rect)
+        return rock_surface
 
 
 class Lightning(Enemy):
@@ -267,10 +302,15 @@ class Lightning(Enemy):
         self.width = LIGHTNING_WIDTH
         self.height = LIGHTNING_HEIGHT
         self.lifetime = 0.5  # Segundos que permanece visible
-        self.time = 0
         self.warning_time = 0.3  # Tiempo de advertencia antes de aparecer
-        self.warned = False
         self.damage = 35  # Daño específico para rayo
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Reinicia el ciclo de advertencia y descarga en (x, y)"""
+        super().reset(x, y)
+        self.time = 0
+        self.warned = False
         
         # Animación
         self.flicker_time = 0
@@ -339,15 +379,29 @@ class SurveillanceDrone(Enemy):
     
     def __init__(self, x, y, patrol_range=150, detection_range=200):
         super().__init__(x, y)
+        self.width = 40
+        self.height = 30
+        self.damage = 20  # Daño específico para dron
+        self.animation_speed = 0.1
+        self.reset(x, y, patrol_range, detection_range)
+        
+        # Cargar sprite o crear uno simple
+        try:
+            # Superficie compartida entre todos los drones (no se toca el disco)
+            self.sprite = asset_cache.image("./Assets/Enemies/drone.png", (self.width, self.height))
+        except:
+            self.create_simple_sprite()
+        memory_ledger.track('drones', self, 'sprite')
+    
+    def reset(self, x, y, patrol_range=150, detection_range=200):
+        """Reinicia patrulla y animación (el sprite compartido se conserva)"""
+        super().reset(x, y)
         self.start_x = x
         self.start_y = y
         self.patrol_range = patrol_range
         self.detection_range = detection_range
         self.speed = 1.5
         self.direction = 1
-        self.width = 40
-        self.height = 30
-        self.damage = 20  # Daño específico para dron
         
         # Estados
         self.patrolling = True
@@ -357,16 +411,8 @@ class SurveillanceDrone(Enemy):
         
         # Animación
         self.frame = 0
-        self.animation_speed = 0.1
         self.frame_timer = 0
         self.propeller_angle = 0
-        
-        # Cargar sprite o crear uno simple
-        try:
-            self.sprite = pygame.image.load("./Assets/Enemies/drone.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-        except:
-            self.create_simple_sprite()
     
     def create_simple_sprite(self):
         """Crea un sprite simple si no hay imagen"""
@@ -464,8 +510,8 @@ class SurveillanceDrone(Enemy):
             pygame.draw.line(surface, prop_color, 
                            (x1, y1), (x2, y2), 3)
         
-        # Luz de vigilancia si está en modo alerta
-        if self.chasing:
+        # Luz de vigilancia si está en modo alerta (no en calidad baja)
+        if self.chasing and quality.current['scan_cones']:
             light_color = (255, 50, 50, 100)
             light_surf = pygame.Surface((self.detection_range*2, 40), pygame.SRCALPHA)
             pygame.draw.ellipse(light_surf, light_color, 
@@ -0,0 +1,163 @@
+"""
+enemy_batch.py - Actualización vectorizada de enemigos homogéneos
+
+Murciélagos (patrulla sinusoidal), rocas (caída con gravedad y rotación) y
+trampas (giro constante) son pura aritmética: su estado vive en arrays
+NumPy (uno por atributo) y toda la población de un tipo se actualiza con
+operaciones vectoriales. Las instancias siguen existiendo para dibujar,
+colisionar y reciclarse en los pools; tras cada paso se les copian los
+atributos que leen esas rutas.
+
+Los enemigos de comportamiento complejo (drones, rayos) se siguen
+actualizando objeto a objeto.
+"""
+
+import numpy as np
+from objects.constants import SCREEN_HEIGHT, BAT_AMPLITUDE
+from Models.enemies import Bat, FallingRock, RotatingTrap
+
+# Capacidad inicial de cada lote (se duplica al llenarse)
+BATCH_INITIAL_CAPACITY = 32
+
+
+class EnemyBatch:
+    """
+    Arrays de estado de un tipo de enemigo. Cada campo de FIELDS es un
+    atributo de la instancia con el mismo nombre; los de WRITEBACK se
+    copian de vuelta a las instancias tras cada paso.
+    """
+
+    FIELDS = ()
+    WRITEBACK = ()
+
+    def __init__(self, capacity=BATCH_INITIAL_CAPACITY):
+        self.count = 0
+        self.items = []
+        self.arrays = {name: np.zeros(capacity) for name in self.FIELDS}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, enemy):
+        """Copia el estado del enemigo a un hueco libre del lote"""
+        slot = self.count
+        if slot == len(self.arrays[self.FIELDS[0]]):
+            for name, array in self.arrays.items():
+                self.arrays[name] = np.concatenate((array, np.zeros(len(array))))
+        for name in self.FIELDS:
+            self.arrays[name][slot] = getattr(enemy, name)
+        enemy.batch_slot = slot
+        self.items.append(enemy)
+        self.count += 1
+
+    def remove(self, enemy):
+        """Saca al enemigo del lote moviendo el último a su hueco. O(1)"""
+        slot, last = enemy.batch_slot, self.count - 1
+        if slot != last:
+            for array in self.arrays.values():
+                array[slot] = array[last]
+            moved = self.items[last]
+            self.items[slot] = moved
+            moved.batch_slot = slot
+        self.items.pop()
+        self.count = last
+        enemy.batch_slot = None
+
+    def clear(self):
+        for enemy in self.items:
+            enemy.batch_slot = None
+        self.items.clear()
+        self.count = 0
+
+    def update(self, dt):
+        """Avanza todo el lote y copia el resultado a las instancias"""
+        if not self.count:
+            return
+        n = self.count
+        self._step({name: array[:n] for name, array in self.arrays.items()}, dt)
+        for name in self.WRITEBACK:
+            for enemy, value in zip(self.items, self.arrays[name][:n].tolist()):
+                setattr(enemy, name, value)
+
+    def _step(self, state, dt):
+        """Actualiza in situ las vistas (n primeras posiciones) de state"""
+        raise NotImplementedError("Subclases deben implementar _step()")
+
+
+class BatBatch(EnemyBatch):
+    """Misma física que Bat.update: vaivén horizontal, onda vertical y giro"""
+
+    FIELDS = ('x', 'y', 'start_x', 'start_y', 'patrol_range', 'speed',
+              'direction', 'time', 'angle', 'rotation_speed')
+    WRITEBACK = ('x', 'y', 'angle')
+
+    def _step(self, s, dt):
+        frames = dt * 60
+        s['time'] += dt
+        s['x'] += s['speed'] * s['direction'] * frames
+        turn = np.abs(s['x'] - s['start_x']) > s['patrol_range']
+        s['direction'][turn] *= -1
+        np.sin(s['time'] * 2, out=s['y'])
+        s['y'] *= BAT_AMPLITUDE
+        s['y'] += s['start_y']
+        s['angle'] += s['rotation_speed'] * frames
+        s['angle'][s['angle'] >= 360] -= 360
+
+
+class RockBatch(EnemyBatch):
+    """Misma física que FallingRock.update: gravedad con tope y rotación"""
+
+    FIELDS = ('y', 'vel_y', 'gravity', 'rotation_angle', 'rotation_vel')
+    WRITEBACK = ('y', 'rotation_angle')
+
+    def _step(self, s, dt):
+        frames = dt * 60
+        s['vel_y'] += s['gravity'] * frames
+        np.minimum(s['vel_y'], 15.0, out=s['vel_y'])
+        s['y'] += s['vel_y'] * frames
+        s['rotation_angle'] += s['rotation_vel'] * frames
+
+    def update(self, dt):
+        super().update(dt)
+        # Desactivar las que caen fuera de la pantalla (se retiran en Level)
+        for slot in np.flatnonzero(self.arrays['y'][:self.count] > SCREEN_HEIGHT + 200).tolist():
+            self.items[slot].active = False
+
+
+class TrapBatch(EnemyBatch):
+    """Misma física que RotatingTrap.update: giro constante"""
+
+    FIELDS = ('angle', 'rotation_speed')
+    WRITEBACK = ('angle',)
+
+    def _step(self, s, dt):
+        frames = dt * 60
+        s['angle'] += s['rotation_speed'] * frames
+        s['angle'][s['angle'] >= 360] -= 360
+
+
+class EnemyBatchStore:
+    """Un lote por tipo homogéneo; los demás tipos no están en ningún lote"""
+
+    def __init__(self):
+        self.batches = {Bat: BatBatch(), FallingRock: RockBatch(), RotatingTrap: TrapBatch()}
+
+    def get(self, cls):
+        """Lote de una clase (None si se actualiza objeto a objeto)"""
+        return self.batches.get(cls)
+
+    def remove(self, enemy):
+        """Saca al enemigo de su lote si está en uno"""
+        if enemy.batch_slot is not None:
+            self.batches[type(enemy)].remove(enemy)
+
+    def clear(self):
+        for batch in self.batches.values():
+            batch.clear()
+
+    def update(self, dt):
+        for batch in self.batches.values():
+            batch.update(dt)
+
+    def __len__(self):
+        return sum(len(batch) for batch in self.batches.values())
@@ -25,6 +25,8 @@ import math
 import random
 from objects.constants import *
 from objects.utils import lerp, clamp, sine_wave
+from objects.memory_ledger import memory_ledger
+from objects.quality import quality
 
 class Lava:
     """
@@ -104,6 +106,7 @@ class Lava:
         self.particles = []  # Partículas de lava volando
         self.bubbles = []  # Burbujas en la superficie
         self.smoke_particles = []  # Humo cuando el jugador está cerca
+        memory_ledger.track('lava', self, 'particles', 'bubbles', 'smoke_particles')
         self.particle_timer = 0  # Temporizador de generación
         
         # Estados del sistema
@@ -253,10 +256,15 @@ class Lava:
     def _generate_particles(self, dt, player_y):
         self.particle_timer += dt
         
-        density = LAVA_CONFIG["particle_density"] * (2 if self.difficulty == "hard" else 1)
+        # Densidad y tope escalados por el nivel de calidad (objects/quality.py)
+        scale = quality.current['particles']
+        density = LAVA_CONFIG["particle_density"] * (2 if self.difficulty == "hard" else 1) * scale
+        cap = int(LAVA_PARTICLE_CAP * scale)
         
-        if self.particle_timer > 1.0 / density:
+        if density > 0 and self.particle_timer > 1.0 / density:
             for _ in range(random.randint(1, 3)):
+                if len(self.particles) >= cap:
+                    break
                 x = random.randint(50, SCREEN_WIDTH - 50)
                 surface_y = self.get_surface_y(x)
                 
@@ -309,33 +317,48 @@ class Lava:
             })
     
     def _update_particles(self, dt):
-        for p in self.particles[:]:
+        particles = self.particles
+        kept = 0
+        for p in particles:
             p['x'] += p['vx']
             p['y'] += p['vy']
             p['life'] -= dt
             p['vy'] -= 0.1
             
             if p['life'] <= 0 or p['y'] < -50:
-                self.particles.remove(p)
-        
-        for s in self.smoke_particles[:]:
+                continue
+            particles[kept] = p
+            kept += 1
+        del particles[kept:]
+        
+        smoke_particles = self.smoke_particles
+        kept = 0
+        for s in smoke_particles:
             s['x'] += s['vx']
             s['y'] += s['vy']
             s['life'] -= dt
             s['size'] += 0.5
             
             if s['life'] <= 0 or s['y'] < -50:
-                self.smoke_particles.remove(s)
+                continue
+            smoke_particles[kept] = s
+            kept += 1
+        del smoke_particles[kept:]
     
     def _update_bubbles(self, dt):
-        for b in self.bubbles[:]:
+        bubbles = self.bubbles
+        kept = 0
+        for b in bubbles:
             b['radius'] += b['growth_speed'] * dt
             b['life'] -= dt
             b['y'] -= 0.5
             
             if b['life'] <= 0 or b['radius'] >= b['max_radius']:
                 self._explode_bubble(b)
-                self.bubbles.remove(b)
+                continue
+            bubbles[kept] = b
+            kept += 1
+        del bubbles[kept:]
     
     def _explode_bubble(self, bubble):
         for _ in range(5):
@@ -6,10 +6,12 @@ import pygame
 import math
 from objects.constants import *
 from objects.utils import lerp, clamp
+from objects.assets import asset_cache
+from objects.event_log import event_log
+from objects.quality import quality
 
-# Constants
-JUMP_FORCE = -15  # Fuerza de salto (valor negativo para moverse hacia arriba)
-GRAVITY = 0.5  # Aceleración de la gravedad (ajusta según sea necesario)
+# La física (PLAYER_JUMP_FORCE, PLAYER_GRAVITY, PLAYER_RUN_SPEED...) está en
+# constants.py: la generación de niveles calcula el alcance con ella
 # player.py - cerca de las otras importaciones
 # Añade después de los imports:
 PLAYER_LIVES = 3  # Vidas por defecto
@@ -17,7 +19,7 @@ PLAYER_LIVES = 3  # Vidas por defecto
 # Clase SpriteSheet simple
 class SpriteSheet:
     def __init__(self, image_path, sprite_width=32, sprite_height=32):
-        self.sprite_sheet = pygame.image.load(image_path).convert_alpha()
+        self.sprite_sheet = asset_cache.image(image_path)
         self.sprite_width = sprite_width
         self.sprite_height = sprite_height
     
@@ -106,38 +108,24 @@ class Player:
         self.last_keys = None
 
     def load_frog_animations(self):
-        """Carga sprites de la ranita"""
+        """Carga sprites de la ranita (compartidos desde la caché de assets)"""
         try:
-            # IDLE - 11 frames
-            self.idle_length = 11
-            idle_sheet = SpriteSheet("./Assets/Player/player_idle.png")
-            self.idle = [idle_sheet.get_frame(x) for x in range(self.idle_length)]
+            size = (self.width, self.height)
             
-            # Escalar al tamaño del jugador
-            for x in range(len(self.idle)):
-                self.idle[x] = pygame.transform.scale(self.idle[x], (self.width, self.height))
+            # IDLE - 11 frames
+            self.idle = list(asset_cache.frames("./Assets/Player/player_idle.png", 32, 32, 11, size))
+            self.idle_length = len(self.idle)
 
             # RUN - 12 frames
-            self.run_length = 12
-            run_sheet = SpriteSheet("./Assets/Player/player_run.png")
-            self.run = [run_sheet.get_frame(x) for x in range(self.run_length)]
-            
-            # Escalar al tamaño del jugador
-            for x in range(len(self.run)):
-                self.run[x] = pygame.transform.scale(self.run[x], (self.width, self.height))
+            self.run = list(asset_cache.frames("./Assets/Player/player_run.png", 32, 32, 12, size))
+            self.run_length = len(self.run)
 
             # JUMP / FALL
-            self.player_jump = pygame.transform.scale(
-                pygame.image.load("./Assets/Player/player_jump.png").convert_alpha(), 
-                (self.width, self.height)
-            )
-            self.player_fall = pygame.transform.scale(
-                pygame.image.load("./Assets/Player/player_fall.png").convert_alpha(), 
-                (self.width, self.height)
-            )
+            self.player_jump = asset_cache.image("./Assets/Player/player_jump.png", size)
+            self.player_fall = asset_cache.image("./Assets/Player/player_fall.png", size)
 
         except Exception as e:
-            print(f"[Player] Error cargando sprites: {e}")
+            event_log.error('Player', "Error cargando sprites: %s", e)
             self.create_default_sprites()
 
     def create_default_sprites(self):
@@ -185,7 +173,7 @@ class Player:
     def handle_input(self, keys):
         """Maneja entrada del jugador"""
         # Velocidad base - VALOR FIJO y manejable
-        base_speed = 7  # Píxeles por frame (ajusta este valor según necesites)
+        base_speed = PLAYER_RUN_SPEED  # Píxeles por frame
         
         if self.speed_boost:
             base_speed *= self.speed_multiplier
@@ -219,7 +207,7 @@ class Player:
             can_jump = (self.on_ground or self.coyote_timer > 0 or self.jump_count < self.max_jumps)
             
             if can_jump:
-                self.vel_y = JUMP_FORCE  # Valor negativo en tus constantes
+                self.vel_y = PLAYER_JUMP_FORCE  # Valor negativo en tus constantes
                 self.on_ground = False
                 self.coyote_timer = 0
                 self.jump_count += 1
@@ -251,14 +239,14 @@ class Player:
             self.coyote_timer -= dt
         
         # Gravedad
-        self.vel_y += GRAVITY
+        self.vel_y += PLAYER_GRAVITY
         
         # Limitar velocidad vertical
         if self.vel_y > TERMINAL_VELOCITY:
             self.vel_y = TERMINAL_VELOCITY
         
         # Movimiento horizontal con fricción en el aire (suavizado)
-        air_friction = 0.95 if not self.on_ground else 1.0
+        air_friction = PLAYER_AIR_FRICTION if not self.on_ground else 1.0
         self.vel_x *= air_friction
 
         # Actualizar posición primero en X
@@ -317,20 +305,20 @@ class Player:
             self.shield_timer -= dt
             if self.shield_timer <= 0:
                 self.shield_active = False
-                print("[Player] Escudo desactivado")
+                event_log.debug('Player', "Escudo desactivado")
         
         if self.speed_boost:
             self.speed_timer -= dt
             if self.speed_timer <= 0:
                 self.speed_boost = False
-                print("[Player] Velocidad desactivada")
+                event_log.debug('Player', "Velocidad desactivada")
         
         if self.zoom_active:
             self.zoom_timer -= dt
             if self.zoom_timer <= 0:
                 self.zoom_active = False
                 self.zoom_scale = lerp(self.zoom_scale, 1.0, 0.1)
-                print("[Player] Zoom desactivado")
+                event_log.debug('Player', "Zoom desactivado")
             else:
                 # Efecto de pulso para el zoom
                 pulse = 0.03 * math.sin(self.game_time * 10)
@@ -363,12 +351,12 @@ class Player:
                 # Desactivar escudo si lo tiene para asegurar que muera
                 if self.shield_active:
                     self.shield_active = False
-                    print("[Player] Escudo desactivado por caída")
+                    event_log.debug('Player', "Escudo desactivado por caída")
                 
                 # Aplicar daño fatal
                 damage_to_apply = max(self.health, 1000)  # Asegurar muerte
                 self.take_damage(damage_to_apply)
-                print("[Player] Muerte por caída")
+                event_log.info('Player', "Muerte por caída")
     
     def draw(self, surface, camera_offset=0):
         """Dibuja la ranita - CON EFECTOS COMPLETOS DE POWER-UPS"""
@@ -467,16 +455,17 @@ class Player:
                 surface.blit(rotated_shield, rot_rect)
             
             # Efecto interior brillante
-            inner_surf = pygame.Surface((shield_radius_pulsed, shield_radius_pulsed), pygame.SRCALPHA)
-            inner_color = (255, 255, 200, 30)
-            pygame.draw.circle(inner_surf, inner_color, 
-                             (shield_radius_pulsed//2, shield_radius_pulsed//2), 
-                             shield_radius_pulsed//2 - 5)
-            surface.blit(inner_surf, (screen_x - shield_radius_pulsed//2, screen_y - shield_radius_pulsed//2))
+            if quality.current['glow']:
+                inner_surf = pygame.Surface((shield_radius_pulsed, shield_radius_pulsed), pygame.SRCALPHA)
+                inner_color = (255, 255, 200, 30)
+                pygame.draw.circle(inner_surf, inner_color, 
+                                 (shield_radius_pulsed//2, shield_radius_pulsed//2), 
+                                 shield_radius_pulsed//2 - 5)
+                surface.blit(inner_surf, (screen_x - shield_radius_pulsed//2, screen_y - shield_radius_pulsed//2))
         
         # Rastro de velocidad - EFECTO MEJORADO
         if self.speed_boost and abs(self.vel_x) > 0 and sprite:
-            trail_length = 5
+            trail_length = quality.current['trail_length']
             for i in range(trail_length):
                 alpha = 150 - i * 30
                 size_factor = 1.0 - i * 0.1
@@ -613,21 +602,21 @@ class Player:
         
         if self.shield_active:
             self.shield_active = False
-            print("[Player] Escudo destruido por daño")
+            event_log.debug('Player', "Escudo destruido por daño")
             return False
         
         if self.combo > 0:
             self.combo = 0
             self.combo_timer = 0
-            print("[Player] Combo perdido por daño")
+            event_log.debug('Player', "Combo perdido por daño")
         
         self.health -= damage
-        print(f"[Player] Daño recibido: {damage}, Salud restante: {self.health}")
+        event_log.debug('Player', "Daño recibido: %s, salud restante: %s", damage, self.health)
         
         if self.health <= 0:
             self.health = 0
             self.lives -= 1
-            print(f"[Player] Vida perdida. Vidas restantes: {self.lives}")
+            event_log.info('Player', "Vida perdida. Vidas restantes: %d", self.lives)
             
             if self.lives > 0:
                 self.health = PLAYER_MAX_HEALTH
@@ -639,36 +628,36 @@ class Player:
                 self.x = SCREEN_WIDTH // 2    # Centro horizontal
                 self.velocity_y = 0           # Detener caída
                 
-                print("[Player] Reviviendo con invulnerabilidad")
+                event_log.debug('Player', "Reviviendo con invulnerabilidad")
                 return True
             else:
                 self.alive = False
-                print("[Player] Jugador eliminado")
+                event_log.info('Player', "Jugador eliminado")
                 return True
         else:
             self.invulnerable = True
             self.invuln_timer = 1.0
-            print("[Player] Invulnerabilidad activada")
+            event_log.debug('Player', "Invulnerabilidad activada")
             return False
     
     def activate_powerup(self, powerup_type):
         """Activa un power-up con todos los efectos"""
-        print(f"[Player] Activando power-up: {powerup_type}")
+        event_log.debug('Player', "Activando power-up: %s", powerup_type)
         
         if powerup_type == 'shield':
             self.shield_active = True
             self.shield_timer = POWERUP_DURATION * 2.0
-            print(f"[Player] Escudo activado por {self.shield_timer:.1f}s")
+            event_log.debug('Player', "Escudo activado por %.1fs", self.shield_timer)
             
         elif powerup_type == 'speed':
             self.speed_boost = True
             self.speed_timer = POWERUP_DURATION * 1.5
-            print(f"[Player] Velocidad activada por {self.speed_timer:.1f}s")
+            event_log.debug('Player', "Velocidad activada por %.1fs", self.speed_timer)
             
         elif powerup_type == 'zoom':
             self.zoom_active = True
             self.zoom_timer = POWERUP_DURATION * 1.8
-            print(f"[Player] Zoom activado por {self.zoom_timer:.1f}s")
+            event_log.debug('Player', "Zoom activado por %.1fs", self.zoom_timer)
         
         # Puntos por recoger power-up
         points = POINTS_POWERUP * self.combo_multiplier
@@ -676,7 +665,7 @@ class Player:
         self.stats['powerups_collected'] += 1
         self.add_combo()
         
-        print(f"[Player] +{int(points)} puntos por power-up")
+        event_log.debug('Player', "+%d puntos por power-up", int(points))
         return True
     
     def draw_hud(self, surface):
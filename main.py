@@ -5,13 +5,19 @@ Proyecto de Informática Gráfica
 
 import pygame
 import sys
-import json
 import os
-from datetime import datetime
+import argparse
 from objects.constants import *
 from objects.game import Game
-from objects.audio import init_audio, play_music, stop_music, toggle_mute, is_muted, toggle_mute, is_muted
+from objects.audio import init_audio, ensure_audio, prepare_audio, play_music, stop_music, toggle_mute, is_muted, toggle_mute, is_muted
 from objects.utils import draw_text, lerp
+from objects.assets import asset_cache, PRELOAD_MANIFEST
+from objects.score_store import score_store
+from objects.run_history import run_history
+from objects.capture import capture
+from objects.benchmark import run_benchmark
+from objects.quality import quality
+from objects.loader import AssetLoader, run_loading_screen
 from Models.lava import Lava
 from objects.platforms import Platform, MovingPlatform
 
@@ -24,50 +30,12 @@ class MenuState:
     CREDITS = "credits"
 
 def load_high_scores():
-    """Cargar puntuaciones altas desde archivo"""
-    try:
-        if os.path.exists("high_scores.json"):
-            with open("high_scores.json", "r") as f:
-                return json.load(f)
-    except:
-        pass
-    # Puntuaciones por defecto
-    return {
-        "easy": [
-            {"name": "PRO", "score": 15000, "date": "2024-01-01"},
-            {"name": "MASTER", "score": 12000, "date": "2024-01-01"},
-            {"name": "SKILL", "score": 10000, "date": "2024-01-01"},
-        ],
-        "normal": [
-            {"name": "LEGEND", "score": 20000, "date": "2024-01-01"},
-            {"name": "HERO", "score": 15000, "date": "2024-01-01"},
-            {"name": "CHAMP", "score": 12000, "date": "2024-01-01"},
-        ],
-        "hard": [
-            {"name": "GOD", "score": 30000, "date": "2024-01-01"},
-            {"name": "TITAN", "score": 25000, "date": "2024-01-01"},
-            {"name": "DEMON", "score": 20000, "date": "2024-01-01"},
-        ]
-    }
+    """Puntuaciones altas (del almacén compartido; el archivo se lee una vez)"""
+    return score_store.as_dict()
 
 def save_high_score(difficulty, name, score):
     """Guardar nueva puntuación alta"""
-    try:
-        high_scores = load_high_scores()
-        high_scores[difficulty].append({
-            "name": name[:3].upper(),
-            "score": score,
-            "date": datetime.now().strftime("%Y-%m-%d")
-        })
-        # Ordenar y mantener solo top 10
-        high_scores[difficulty].sort(key=lambda x: x["score"], reverse=True)
-        high_scores[difficulty] = high_scores[difficulty][:10]
-        
-        with open("high_scores.json", "w") as f:
-            json.dump(high_scores, f, indent=2)
-        return True
-    except:
-        return False
+    return score_store.add(difficulty, name[:3].upper(), score) is not None
 
 def draw_gradient_background(screen, color_top, color_bottom):
     """Dibujar fondo degradado"""
@@ -140,8 +108,21 @@ def draw_menu_option(screen, x, y, width, height, text, font, color,
 
 def show_high_scores_menu(screen, clock, font_title, font_subtitle, font_normal, difficulty):
     """Mostrar menú de puntuaciones altas"""
-    high_scores = load_high_scores()
-    scores = high_scores.get(difficulty, [])
+    scores = score_store.top(difficulty)
+    
+    # Vista: récords (top 10) o historial de partidas paginado (TAB)
+    show_history = False
+    page = 0
+    has_next_page = False
+    
+    def history_page():
+        """Una página del historial con el formato de la tabla de récords"""
+        nonlocal has_next_page
+        # Una fila de más solo para saber si existe la página siguiente
+        rows = run_history.history(difficulty, RUN_HISTORY_PAGE_SIZE + 1, page * RUN_HISTORY_PAGE_SIZE)
+        has_next_page = len(rows) > RUN_HISTORY_PAGE_SIZE
+        return [{"name": f"Nv{run['level']} {'OK' if run['outcome'] == 'complete' else 'X'}",
+                 "score": run["score"], "date": run["played_at"][5:]} for run in rows[:RUN_HISTORY_PAGE_SIZE]]
     
     # Partículas para fondo animado
     particles = []
@@ -165,20 +146,32 @@ def show_high_scores_menu(screen, clock, font_title, font_subtitle, font_normal,
                     return True
                 elif event.key in [pygame.K_1, pygame.K_KP1, pygame.K_e]:
                     difficulty = "easy"
-                    scores = high_scores.get(difficulty, [])
+                    page = 0
                 elif event.key in [pygame.K_2, pygame.K_KP2, pygame.K_n]:
                     difficulty = "normal"
-                    scores = high_scores.get(difficulty, [])
+                    page = 0
                 elif event.key in [pygame.K_3, pygame.K_KP3, pygame.K_h]:
                     difficulty = "hard"
-                    scores = high_scores.get(difficulty, [])
+                    page = 0
+                elif event.key == pygame.K_TAB and run_history.enabled:
+                    show_history = not show_history
+                    page = 0
+                elif event.key == pygame.K_RIGHT and show_history and has_next_page:
+                    page += 1
+                elif event.key == pygame.K_LEFT and show_history and page > 0:
+                    page -= 1
+                else:
+                    continue
+                # Solo se consulta al cambiar de dificultad, vista o página
+                scores = history_page() if show_history else score_store.top(difficulty)
         
         # Dibujar fondo con partículas
         draw_gradient_background(screen, (5, 5, 15), (15, 10, 40))
         draw_particle_background(screen, particles)
         
         # Título con sombra manual
-        draw_text_with_shadow(screen, "🏆 PUNTUACIONES ALTAS", SCREEN_WIDTH // 2, 60,
+        title = f"📜 HISTORIAL (pág. {page + 1})" if show_history else "🏆 PUNTUACIONES ALTAS"
+        draw_text_with_shadow(screen, title, SCREEN_WIDTH // 2, 60,
                              font_title, (255, 215, 0), center=True)
         
         # Selector de dificultad
@@ -209,7 +202,8 @@ def show_high_scores_menu(screen, clock, font_title, font_subtitle, font_normal,
                         2, border_radius=10)
         
         # Encabezados de la tabla
-        headers = ["POS", "NOMBRE", "PUNTUACIÓN", "FECHA"]
+        headers = ["#", "NIVEL", "PUNTUACIÓN", "FECHA"] if show_history else ["POS", "NOMBRE", "PUNTUACIÓN", "FECHA"]
+        first_rank = page * RUN_HISTORY_PAGE_SIZE if show_history else 0
         header_x = [SCREEN_WIDTH//2 - 220, SCREEN_WIDTH//2 - 120, 
                    SCREEN_WIDTH//2 + 30, SCREEN_WIDTH//2 + 180]
         
@@ -233,7 +227,10 @@ def show_high_scores_menu(screen, clock, font_title, font_subtitle, font_normal,
                 screen.blit(row_surface, (SCREEN_WIDTH//2 - 240, y_pos - 12))
             
             # Posición con medalla para top 3
-            if i == 0:
+            if show_history:
+                pos_text = f"{first_rank + i + 1}"
+                pos_color = (200, 200, 200)
+            elif i == 0:
                 pos_text = "1st"
                 pos_color = (255, 215, 0)  # Oro
             elif i == 1:
@@ -264,7 +261,10 @@ def show_high_scores_menu(screen, clock, font_title, font_subtitle, font_normal,
                          font_normal, (100, 100, 100), center=True)
         
         # Instrucciones
-        draw_text(screen, "ESC o ENTER para volver",
+        instructions = "ESC o ENTER para volver"
+        if run_history.enabled:
+            instructions += "  |  TAB: historial" + ("  <- ->: páginas" if show_history else "")
+        draw_text(screen, instructions,
                  SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60,
                  font_normal, (200, 200, 200), center=True)
         
@@ -417,8 +417,41 @@ def show_credits_menu(screen, clock, font_title, font_normal):
         
         pygame.display.flip()
 
-def main():
+def parse_args(argv=None):
+    """Opciones de lanzamiento (capturas de rendimiento y benchmark)"""
+    parser = argparse.ArgumentParser(description="SkyRunner - Runner Vertical 2D")
+    parser.add_argument("--profile", action="store_true",
+                        help="Guardar un perfil de cProfile (.prof) de cada nivel jugado")
+    parser.add_argument("--tracemalloc", type=int, nargs="?", const=CAPTURE_TRACEMALLOC_FRAMES,
+                        default=0, metavar="MARCOS",
+                        help="Comparar la memoria al empezar y terminar cada nivel "
+                             f"(marcos por traza, por defecto {CAPTURE_TRACEMALLOC_FRAMES})")
+    parser.add_argument("--capture-dir", default=CAPTURE_DIR,
+                        help=f"Carpeta de las capturas (por defecto {CAPTURE_DIR})")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=BENCHMARK_FRAMES, default=0,
+                        metavar="FRAMES",
+                        help="Jugar cada nivel sin menú durante FRAMES frames y guardar tiempos "
+                             f"y memoria en JSON (por defecto {BENCHMARK_FRAMES})")
+    parser.add_argument("--benchmark-output", default=BENCHMARK_FILE,
+                        help=f"JSON del benchmark (por defecto {BENCHMARK_FILE})")
+    parser.add_argument("--difficulty", choices=list(DIFFICULTY_SETTINGS), default="normal",
+                        help="Dificultad del benchmark")
+    parser.add_argument("--endless", action="store_true",
+                        help="Medir el ascenso infinito en lugar de los niveles")
+    parser.add_argument("--quality", choices=[tier['name'] for tier in QUALITY_TIERS],
+                        help="Fijar el nivel de calidad en lugar de ajustarlo según el tiempo de frame")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Punto de entrada principal del juego"""
+    args = parse_args(argv)
+    capture.configure(profile=args.profile, tracemalloc_frames=args.tracemalloc,
+                      directory=args.capture_dir)
+    if args.quality:
+        names = [tier['name'] for tier in QUALITY_TIERS]
+        quality.set_tier(names.index(args.quality), locked=True)
+    
     # Inicializar Pygame
     pygame.init()
     try:
@@ -431,25 +464,47 @@ def main():
     pygame.display.set_caption("SkyRunner - Runner Vertical 2D")
     clock = pygame.time.Clock()
 
-    # Inicializar audio
-    init_audio()
-    
-    # Iniciar música de menú
-    play_music('menu', loops=-1)
-
-    # Fuentes para menú
+    # Fuentes para menú (también las usa la pantalla de carga)
     font_title = pygame.font.Font(None, FONT_SIZE_TITLE)
     font_subtitle = pygame.font.Font(None, FONT_SIZE_SUBTITLE)
     font_normal = pygame.font.Font(None, FONT_SIZE_HUD)
+
+    # Carga asíncrona: PNG y síntesis de audio en segundo plano mientras
+    # se dibuja la pantalla de carga. Si existe el bundle empaquetado se
+    # usa en lugar de los PNG sueltos. Igual que con las imágenes, el hilo
+    # de carga solo produce datos (PCM): el AudioManager y los Sound del
+    # mixer se crean en el hilo principal.
+    asset_cache.use_bundle()
+    loader = AssetLoader()
+    loader.submit_manifest(PRELOAD_MANIFEST)
+    audio = ensure_audio(synthesize=False)
+    loader.submit_task("Audio", prepare_audio, audio, ('menu', 'game'),
+                       on_done=audio.adopt_sounds if audio else None)
+    if not run_loading_screen(screen, clock, loader, font_title, font_normal):
+        pygame.quit()
+        sys.exit()
+    loader.shutdown()
+    
+    if args.benchmark:
+        run_benchmark(screen, args.benchmark, args.difficulty,
+                      GAME_MODE_ENDLESS if args.endless else GAME_MODE_LEVELS,
+                      args.benchmark_output)
+        pygame.quit()
+        return
+    
+    # Iniciar música de menú
+    play_music('menu', loops=-1)
     
     # Estado del menú
     menu_state = MenuState.MAIN
     selected_option = 0
     difficulty = "normal"
+    game_mode = GAME_MODE_LEVELS
     
     # Opciones del menú principal
     main_options = [
         ("🎮 COMENZAR JUEGO", MenuState.MAIN),
+        ("♾️ ASCENSO INFINITO", MenuState.MAIN),
         ("🏆 PUNTUACIONES ALTAS", MenuState.HIGH_SCORES),
         ("⚙️ CONTROLES", MenuState.CONTROLS),
         ("🌟 CRÉDITOS", MenuState.CREDITS),
@@ -490,6 +545,12 @@ def main():
                             if option_text == "🎮 COMENZAR JUEGO":
                                 menu_state = MenuState.MAIN
                                 # Salir del menú para comenzar juego
+                                game_mode = GAME_MODE_LEVELS
+                                running = False
+                                start_game = True
+                            elif option_text == "♾️ ASCENSO INFINITO":
+                                menu_state = MenuState.MAIN
+                                game_mode = GAME_MODE_ENDLESS
                                 running = False
                                 start_game = True
                             elif option_text == "🏆 PUNTUACIONES ALTAS":
@@ -568,7 +629,7 @@ def main():
                     draw_menu_option(
                         screen,
                         SCREEN_WIDTH//2 - 200,
-                        y_start + i*80 - 20,
+                        y_start + i*70 - 20,
                         400,
                         60,
                         option_text,
@@ -611,7 +672,7 @@ def main():
                     play_music('game', loops=-1)
                     
                     # Crear instancia del juego con dificultad seleccionada, pasando la pantalla existente
-                    game = Game(difficulty, screen)
+                    game = Game(difficulty, screen, mode=game_mode)
                     
                     # Ejecutar el juego
                     game.run()
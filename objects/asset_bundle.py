@@ -0,0 +1,297 @@
+"""
+asset_bundle.py - Empaquetado de sprites en atlas y cargador del bundle
+
+Paso offline (una vez tras cambiar los PNG):
+    python -m objects.asset_bundle
+
+Empaqueta todos los sprites del manifiesto en uno o pocos atlas RGBA,
+con los frames YA escalados al tamaño que usa el juego, y los guarda en un
+único archivo. En tiempo de ejecución el archivo se mapea en memoria y cada
+página del atlas se convierte solo cuando se pide uno de sus sprites.
+
+Formato del archivo:
+    MAGIC (8 bytes) | longitud del índice (uint32 LE) | índice JSON | páginas RGBA
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import pygame
+
+BUNDLE_MAGIC = b"SKYBNDL1"
+BUNDLE_PATH = "./Assets/sprites.bundle"
+ATLAS_MAX_SIZE = 1024   # Tamaño máximo de cada página del atlas
+ATLAS_PADDING = 1       # Separación entre frames para evitar sangrado
+
+
+def canonical_path(path):
+    """Normaliza una ruta de asset: sin './', con '/' y en minúsculas"""
+    path = os.path.normpath(path).replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path.lower()
+
+
+def bundle_key(path, size=None, frame_size=None, count=None):
+    """
+    Clave de una variante de sprite dentro del bundle.
+
+    Args:
+        path: Ruta del PNG original
+        size: (ancho, alto) final o None
+        frame_size: (ancho, alto) de cada frame si es spritesheet
+        count: Número máximo de frames
+    """
+    key = canonical_path(path)
+    if size:
+        key += f"|{int(size[0])}x{int(size[1])}"
+    if frame_size:
+        key += f"|frames:{frame_size[0]}x{frame_size[1]}:{count if count is not None else '*'}"
+    return key
+
+
+def bundle_manifest():
+    """
+    Manifiesto del bundle: la precarga más los sprites que aún no usa el
+    código, escalados a un tamaño de juego razonable (el original de Roca
+    ocuparía por sí solo una página de 2048 px).
+    """
+    from objects.assets import PRELOAD_MANIFEST
+    from objects.constants import ROCK_SIZE
+    return list(PRELOAD_MANIFEST) + [
+        {'path': "./Assets/Enemies/Roca.png", 'size': (ROCK_SIZE, ROCK_SIZE)},
+        {'path': "./Assets/Castle/Castillo.png", 'size': (256, 223)},
+        {'path': "./Assets/Collectables/kiwirep.png"},
+    ]
+
+
+# ============================================
+# 🏗️ CONSTRUCCIÓN OFFLINE
+# ============================================
+
+def _entry_frames(cache, entry):
+    """Frames ya escalados de una entrada del manifiesto (sin convert)"""
+    real_path = cache.resolve(entry['path'])
+    if real_path is None:
+        raise FileNotFoundError(entry['path'])
+    sheet = pygame.image.load(real_path)
+    size = entry.get('size')
+    size = (int(size[0]), int(size[1])) if size else None
+
+    if 'frame_size' in entry:
+        frame_w, frame_h = entry['frame_size']
+        available = sheet.get_width() // frame_w
+        count = entry.get('count')
+        total = available if count is None else min(count, available)
+        frames = [sheet.subsurface(pygame.Rect(i * frame_w, 0, frame_w, frame_h))
+                  for i in range(total)]
+    else:
+        frames = [sheet]
+
+    if size:
+        frames = [pygame.transform.scale(frame, size) for frame in frames]
+    return frames
+
+
+def _pack_shelves(sizes):
+    """
+    Empaquetado por estantes: ordena por altura y llena filas de izquierda
+    a derecha; abre una página nueva cuando no cabe en la actual.
+
+    Args:
+        sizes: Lista de (ancho, alto)
+
+    Returns:
+        (posiciones [(página, x, y)], tamaños de página [(ancho, alto)])
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    pages = []
+    x = y = shelf_h = 0
+
+    for i in order:
+        w, h = sizes[i]
+        w += ATLAS_PADDING
+        h += ATLAS_PADDING
+        if not pages:
+            pages.append([0, 0])
+        if x + w > ATLAS_MAX_SIZE:
+            # Siguiente estante
+            y += shelf_h
+            x = shelf_h = 0
+        if y + h > ATLAS_MAX_SIZE:
+            # Siguiente página
+            pages.append([0, 0])
+            x = y = shelf_h = 0
+
+        page = len(pages) - 1
+        positions[i] = (page, x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+        pages[page][0] = max(pages[page][0], x)
+        pages[page][1] = max(pages[page][1], y + shelf_h)
+
+    return positions, [tuple(p) for p in pages]
+
+
+def build_bundle(output_path=BUNDLE_PATH, manifest=None):
+    """
+    Construye el bundle de sprites (no necesita ventana).
+
+    Returns:
+        dict: Resumen con número de sprites, páginas y bytes escritos
+    """
+    from objects.assets import AssetCache
+
+    manifest = bundle_manifest() if manifest is None else manifest
+    cache = AssetCache()
+
+    # 1. Recopilar frames de todas las entradas
+    keys = []
+    entry_frames = []
+    for entry in manifest:
+        try:
+            frames = _entry_frames(cache, entry)
+        except Exception as e:
+            print(f"[Bundle] Omitido {entry['path']}: {e}")
+            continue
+        keys.append(bundle_key(entry['path'], entry.get('size'),
+                               entry.get('frame_size'), entry.get('count')))
+        entry_frames.append(frames)
+
+    flat = [frame for frames in entry_frames for frame in frames]
+    positions, page_sizes = _pack_shelves([f.get_size() for f in flat])
+
+    # 2. Dibujar páginas
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for page in pages:
+        page.fill((0, 0, 0, 0))
+    for frame, (page, x, y) in zip(flat, positions):
+        pages[page].blit(frame, (x, y))
+
+    # 3. Índice de frames por clave
+    entries = {}
+    cursor = 0
+    for key, frames in zip(keys, entry_frames):
+        rects = []
+        for frame in frames:
+            page, x, y = positions[cursor]
+            cursor += 1
+            rects.append([page, x, y, frame.get_width(), frame.get_height()])
+        entries[key] = rects
+
+    # 4. Páginas en bruto; los offsets son relativos al inicio de los píxeles
+    blobs = [pygame.image.tobytes(page, "RGBA") for page in pages]
+    page_info = []
+    offset = 0
+    for (w, h), blob in zip(page_sizes, blobs):
+        page_info.append({'w': w, 'h': h, 'offset': offset, 'length': len(blob)})
+        offset += len(blob)
+
+    index = {'version': 1, 'pages': page_info, 'entries': entries}
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+    with open(output_path, "wb") as f:
+        f.write(BUNDLE_MAGIC)
+        f.write(struct.pack("<I", len(index_bytes)))
+        f.write(index_bytes)
+        for blob in blobs:
+            f.write(blob)
+
+    total_bytes = len(BUNDLE_MAGIC) + 4 + len(index_bytes) + offset
+    summary = {'sprites': len(keys), 'frames': len(flat),
+               'pages': len(pages), 'bytes': total_bytes}
+    print(f"[Bundle] {output_path}: {summary['sprites']} sprites, "
+          f"{summary['frames']} frames, {summary['pages']} páginas, "
+          f"{summary['bytes'] / 1024:.0f} KB")
+    return summary
+
+
+# ============================================
+# 📂 CARGADOR EN TIEMPO DE EJECUCIÓN
+# ============================================
+
+class AssetBundle:
+    """
+    Bundle de sprites mapeado en memoria.
+
+    Las páginas del atlas se convierten (convert_alpha) la primera vez que
+    se pide un sprite que vive en ellas; los frames son subsuperficies.
+    """
+
+    def __init__(self, path=BUNDLE_PATH):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.data[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} no es un bundle de sprites válido")
+
+        start = len(BUNDLE_MAGIC)
+        (index_len,) = struct.unpack_from("<I", self.data, start)
+        start += 4
+        index = json.loads(bytes(self.data[start:start + index_len]).decode("utf-8"))
+        self.data_start = start + index_len
+
+        self.pages_info = index['pages']
+        self.entries = index['entries']
+        self.pages = [None] * len(self.pages_info)
+        self.frames_cache = {}
+
+    @classmethod
+    def open(cls, path=BUNDLE_PATH):
+        """Abre el bundle si existe; devuelve None si no hay bundle"""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except Exception as e:
+            print(f"[Bundle] No se pudo abrir {path}: {e}")
+            return None
+
+    def _page(self, index):
+        """Página convertida (se crea al primer uso)"""
+        page = self.pages[index]
+        if page is None:
+            info = self.pages_info[index]
+            start = self.data_start + info['offset']
+            # frombuffer no copia: lee directamente del mapeo; convert_alpha copia
+            view = memoryview(self.data)[start:start + info['length']]
+            page = pygame.image.frombuffer(view, (info['w'], info['h']), "RGBA").convert_alpha()
+            self.pages[index] = page
+        return page
+
+    def get(self, key):
+        """
+        Frames de una variante del bundle.
+
+        Returns:
+            tuple de pygame.Surface, o None si la clave no está en el bundle
+        """
+        cached = self.frames_cache.get(key)
+        if cached is not None:
+            return cached
+
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        frames = tuple(self._page(page).subsurface(pygame.Rect(x, y, w, h))
+                       for page, x, y, w, h in entry)
+        self.frames_cache[key] = frames
+        return frames
+
+    def close(self):
+        """Libera el mapeo de memoria"""
+        try:
+            self.data.close()
+        finally:
+            self.file.close()
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else BUNDLE_PATH
+    build_bundle(output)
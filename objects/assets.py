@@ -0,0 +1,414 @@
+"""
+assets.py - Caché centralizada de imágenes
+Resuelve cada ruta una sola vez y carga, convierte y escala cada asset
+una única vez. Las entidades comparten las superficies resultantes.
+
+IMPORTANTE: las superficies devueltas son COMPARTIDAS. No modificarlas
+(set_alpha, fill, draw...) sin hacer antes un .copy().
+"""
+
+import os
+import pygame
+from objects.constants import PLAYER_WIDTH, PLAYER_HEIGHT, POWERUP_SIZE
+from objects.memory_ledger import memory_ledger
+
+# Raíz del proyecto (para resolver rutas aunque el cwd sea otro)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ============================================
+# 📦 MANIFIESTO DE PRECARGA
+# ============================================
+# Cada entrada describe exactamente la variante que usan las entidades:
+#   path        -> ruta del PNG
+#   frame_size  -> (ancho, alto) de cada frame si es un spritesheet
+#   count       -> número máximo de frames
+#   size        -> tamaño final al que se escala (None = original)
+POWERUP_SPRITE_SIZE = (int(POWERUP_SIZE * 1.5), int(POWERUP_SIZE * 1.5))
+DRONE_SPRITE_SIZE = (40, 30)
+
+# Tilesets (los archivos reales están en minúsculas)
+BLUE_TILESET_PATH = "./Assets/Terrain/blue.png"
+TERRAIN_TILESET_PATH = "./Assets/Terrain/terrain.png"
+
+PRELOAD_MANIFEST = [
+    # Jugador (ranita)
+    {'path': "./Assets/Player/player_idle.png", 'frame_size': (32, 32), 'count': 11,
+     'size': (PLAYER_WIDTH, PLAYER_HEIGHT)},
+    {'path': "./Assets/Player/player_run.png", 'frame_size': (32, 32), 'count': 12,
+     'size': (PLAYER_WIDTH, PLAYER_HEIGHT)},
+    {'path': "./Assets/Player/player_jump.png", 'size': (PLAYER_WIDTH, PLAYER_HEIGHT)},
+    {'path': "./Assets/Player/player_fall.png", 'size': (PLAYER_WIDTH, PLAYER_HEIGHT)},
+
+    # Enemigos
+    {'path': "./Assets/Enemies/drone.png", 'size': DRONE_SPRITE_SIZE},
+
+    # Power-ups (kiwi)
+    {'path': "./Assets/Collectables/kiwi.png", 'frame_size': (32, 32), 'count': 6,
+     'size': POWERUP_SPRITE_SIZE},
+    {'path': "./Assets/Collectables/collected.png", 'frame_size': (32, 32), 'count': 4,
+     'size': POWERUP_SPRITE_SIZE},
+
+    # Tilesets
+    {'path': BLUE_TILESET_PATH},
+    {'path': TERRAIN_TILESET_PATH},
+]
+
+
+class AssetCache:
+    """
+    Caché de imágenes con resolución de rutas, conversión y escalado únicos.
+    """
+
+    def __init__(self):
+        self.paths = {}      # ruta pedida -> ruta real (o None si no existe)
+        self.listings = {}   # directorio -> {nombre en minúsculas: nombre real}
+        self.images = {}     # (ruta real, alpha) -> superficie convertida
+        self.scaled = {}     # (ruta real, tamaño, alpha) -> superficie escalada
+        self.sheets = {}     # (ruta real, frame, count, tamaño) -> tupla de frames
+        self.bundle = None   # AssetBundle mapeado en memoria (opcional)
+        self.bundled = {}    # (ruta pedida, variante) -> superficie(s) del bundle
+        self.stats = {'loads': 0, 'hits': 0, 'misses': 0, 'bundled': 0}
+
+    # ============================================
+    # 📂 BUNDLE DE SPRITES
+    # ============================================
+
+    def use_bundle(self, path=None):
+        """
+        Activa el bundle de sprites empaquetado (si existe).
+        Las variantes que estén en el bundle ya no tocan los PNG sueltos.
+
+        Returns:
+            bool: True si el bundle se abrió
+        """
+        from objects.asset_bundle import AssetBundle, BUNDLE_PATH
+
+        bundle_path = path or BUNDLE_PATH
+        real_path = self.resolve(bundle_path)
+        self.bundle = AssetBundle.open(real_path) if real_path else None
+        if self.bundle:
+            print(f"[Assets] Bundle cargado: {real_path} "
+                  f"({len(self.bundle.entries)} sprites, {len(self.bundle.pages_info)} páginas)")
+        return self.bundle is not None
+
+    def _from_bundle(self, key, path, size=None, frame_size=None, count=None):
+        """Busca una variante en el bundle (None si no está)"""
+        found = self.bundled.get(key)
+        if found is None and key not in self.bundled:
+            from objects.asset_bundle import bundle_key
+            found = self.bundle.get(bundle_key(path, size, frame_size, count))
+            self.bundled[key] = found
+            if found is not None:
+                self.stats['bundled'] += 1
+        return found
+
+    # ============================================
+    # 🔍 RESOLUCIÓN DE RUTAS
+    # ============================================
+
+    def _match_case(self, path):
+        """Busca la ruta ignorando mayúsculas (Blue.png -> blue.png)"""
+        parts = os.path.normpath(path).split(os.sep)
+        current = os.sep if os.path.isabs(path) else "."
+
+        for part in parts:
+            if part in ("", "."):
+                continue
+            candidate = os.path.join(current, part)
+            if os.path.exists(candidate):
+                current = candidate
+                continue
+
+            listing = self.listings.get(current)
+            if listing is None:
+                try:
+                    listing = {name.lower(): name for name in os.listdir(current)}
+                except OSError:
+                    listing = {}
+                self.listings[current] = listing
+
+            real_name = listing.get(part.lower())
+            if real_name is None:
+                return None
+            current = os.path.join(current, real_name)
+
+        return current
+
+    def resolve(self, path):
+        """
+        Resuelve la ruta real de un asset (una sola vez por ruta).
+
+        Args:
+            path: Ruta relativa al proyecto o absoluta
+
+        Returns:
+            str: Ruta existente, o None si no se encuentra
+        """
+        if path in self.paths:
+            return self.paths[path]
+
+        resolved = None
+        candidates = [path]
+        if not os.path.isabs(path):
+            candidates.append(os.path.join(PROJECT_ROOT, path))
+
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                resolved = candidate
+                break
+
+        if resolved is None:
+            for candidate in candidates:
+                resolved = self._match_case(candidate)
+                if resolved is not None:
+                    break
+
+        self.paths[path] = resolved
+        return resolved
+
+    # ============================================
+    # 🖼️ CARGA DE IMÁGENES
+    # ============================================
+
+    def image(self, path, size=None, alpha=True):
+        """
+        Devuelve la imagen convertida (y escalada si se pide), compartida.
+
+        Args:
+            path: Ruta del PNG
+            size: (ancho, alto) final o None para el tamaño original
+            alpha: True para convert_alpha(), False para convert()
+
+        Returns:
+            pygame.Surface compartida
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+
+        if self.bundle is not None:
+            found = self._from_bundle((path, size), path, size)
+            if found is not None:
+                if alpha:
+                    return found[0]
+                opaque_key = (path, size, False)
+                surface = self.images.get(opaque_key)
+                if surface is None:
+                    surface = found[0].convert()
+                    self.images[opaque_key] = surface
+                return surface
+
+        real_path = self.resolve(path)
+        if real_path is None:
+            self.stats['misses'] += 1
+            raise FileNotFoundError(f"Asset no encontrado: {path}")
+
+        key = (real_path, alpha)
+        surface = self.images.get(key)
+        if surface is None:
+            loaded = pygame.image.load(real_path)
+            surface = loaded.convert_alpha() if alpha else loaded.convert()
+            self.images[key] = surface
+            self.stats['loads'] += 1
+        else:
+            self.stats['hits'] += 1
+
+        if size is None:
+            return surface
+
+        scaled_key = (real_path, size, alpha)
+        scaled = self.scaled.get(scaled_key)
+        if scaled is None:
+            scaled = pygame.transform.scale(surface, size)
+            self.scaled[scaled_key] = scaled
+        return scaled
+
+    def frames(self, path, frame_width, frame_height, count=None, size=None):
+        """
+        Corta un spritesheet horizontal en frames (una sola vez).
+
+        Args:
+            path: Ruta del spritesheet
+            frame_width: Ancho de cada frame
+            frame_height: Alto de cada frame
+            count: Máximo de frames (None = todos los que quepan)
+            size: (ancho, alto) al que escalar cada frame
+
+        Returns:
+            tuple de pygame.Surface compartidas
+        """
+        size = (int(size[0]), int(size[1])) if size else None
+
+        if self.bundle is not None:
+            found = self._from_bundle((path, size, frame_width, frame_height, count),
+                                      path, size, (frame_width, frame_height), count)
+            if found is not None:
+                return found
+
+        real_path = self.resolve(path)
+        key = (real_path, frame_width, frame_height, count, size)
+        cached = self.sheets.get(key)
+        if cached is not None:
+            self.stats['hits'] += 1
+            return cached
+
+        sheet = self.image(path)
+        available = sheet.get_width() // frame_width
+        total = available if count is None else min(count, available)
+
+        result = []
+        for i in range(total):
+            rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
+            frame = sheet.subsurface(rect)
+            if size:
+                frame = pygame.transform.scale(frame, size)
+            else:
+                frame = frame.copy()
+            result.append(frame)
+
+        cached = tuple(result)
+        self.sheets[key] = cached
+        return cached
+
+    # ============================================
+    # 📦 PRECARGA
+    # ============================================
+
+    def load_entry(self, entry):
+        """Carga una entrada del manifiesto"""
+        if 'frame_size' in entry:
+            frame_w, frame_h = entry['frame_size']
+            return self.frames(entry['path'], frame_w, frame_h,
+                               entry.get('count'), entry.get('size'))
+        return self.image(entry['path'], entry.get('size'), entry.get('alpha', True))
+
+    def has_image(self, real_path, alpha=True):
+        """True si la imagen original ya está convertida en la caché"""
+        return (real_path, alpha) in self.images
+
+    def has_entry(self, entry):
+        """True si la variante exacta de una entrada del manifiesto ya está lista"""
+        path = entry['path']
+        size = entry.get('size')
+        size = (int(size[0]), int(size[1])) if size else None
+
+        if 'frame_size' in entry:
+            frame_w, frame_h = entry['frame_size']
+            count = entry.get('count')
+            if self.bundled.get((path, size, frame_w, frame_h, count)) is not None:
+                return True
+            return (self.resolve(path), frame_w, frame_h, count, size) in self.sheets
+
+        if self.bundled.get((path, size)) is not None:
+            return True
+        real_path = self.resolve(path)
+        alpha = entry.get('alpha', True)
+        if size is None:
+            return (real_path, alpha) in self.images
+        return (real_path, size, alpha) in self.scaled
+
+    def adopt(self, real_path, raw_surface, alpha=True):
+        """
+        Registra una imagen decodificada en otro hilo y la convierte aquí
+        (convert/convert_alpha solo pueden hacerse en el hilo principal).
+        """
+        key = (real_path, alpha)
+        if key not in self.images:
+            self.images[key] = raw_surface.convert_alpha() if alpha else raw_surface.convert()
+            self.stats['loads'] += 1
+        return self.images[key]
+
+    def preload(self, manifest=None):
+        """
+        Carga todas las entradas del manifiesto (requiere display inicializado).
+
+        Returns:
+            int: Número de entradas cargadas correctamente
+        """
+        manifest = PRELOAD_MANIFEST if manifest is None else manifest
+        loaded = 0
+        for entry in manifest:
+            try:
+                self.load_entry(entry)
+                loaded += 1
+            except Exception as e:
+                print(f"[Assets] No se pudo precargar {entry.get('path')}: {e}")
+
+        print(f"[Assets] Precarga: {loaded}/{len(manifest)} assets")
+        return loaded
+
+    def clear(self):
+        """Vacía la caché (las superficies siguen vivas mientras alguien las use)"""
+        self.images.clear()
+        self.scaled.clear()
+        self.sheets.clear()
+
+
+class SpriteFlyweight:
+    """
+    Almacén de sprites compartidos (patrón flyweight).
+    
+    La clave describe completamente el sprite, p. ej. (tileset, tile_id, tamaño),
+    así que dos tiles iguales reciben la misma superficie y el coste de
+    construcción depende de los tiles distintos, no de los colocados.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+        self.stats = {'created': 0, 'shared': 0}
+
+    def get(self, key, factory):
+        """
+        Devuelve el sprite de la clave, creándolo con factory() la primera vez.
+
+        Args:
+            key: Tupla hashable que identifica el sprite
+            factory: Función sin argumentos que crea la superficie
+        """
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = factory()
+            self.sprites[key] = sprite
+            self.stats['created'] += 1
+        else:
+            self.stats['shared'] += 1
+        return sprite
+
+    def clear(self):
+        """Olvida todos los sprites"""
+        self.sprites.clear()
+
+    def __len__(self):
+        return len(self.sprites)
+
+
+# Instancias globales
+asset_cache = AssetCache()
+tile_sprites = SpriteFlyweight()
+rotation_sprites = SpriteFlyweight()
+fallback_sprites = SpriteFlyweight()   # Sprites de respaldo dibujados por código
+memory_ledger.track('assets', asset_cache, 'images', 'scaled', 'sheets', 'bundled')
+memory_ledger.track('assets', fallback_sprites, 'sprites')
+memory_ledger.track('tiles', tile_sprites, 'sprites')
+memory_ledger.track('rotation', rotation_sprites, 'sprites')
+
+
+def rotated(key, angle, step, factory):
+    """
+    Sprite rotado compartido (rotation_sprites).
+
+    El ángulo se redondea a múltiplos de step grados, así que cada clave
+    guarda como mucho 360 / step rotaciones y un sprite que gira deja de
+    llamar a pygame.transform.rotate en cada frame.
+
+    Args:
+        key: Tupla que describe el sprite sin rotar, p. ej. ('bat', ancho, alto)
+        angle: Ángulo en grados
+        step: Resolución en grados (quality.current['rotation_step'])
+        factory: Función sin argumentos que crea el sprite sin rotar
+    """
+    angle = int(round(angle / step) * step) % 360
+    return rotation_sprites.get((key, angle), lambda: pygame.transform.rotate(
+        rotation_sprites.get(key, factory), angle))
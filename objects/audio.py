@@ -6,15 +6,207 @@ Con música de fondo, efectos temáticos y sonidos legendarios
 import pygame
 import math
 import random
+import time
 from objects.constants import ENABLE_SOUND
+from objects.memory_ledger import memory_ledger
+
+# ============================================
+# 🎚️ PRIORIDADES DE VOCES
+# ============================================
+# Mayor número = más importante. Una voz solo puede robar el canal
+# de otra con prioridad igual o menor.
+VOICE_PRIORITY_UI = 4
+VOICE_PRIORITY_DEATH = 3
+VOICE_PRIORITY_DAMAGE = 2
+VOICE_PRIORITY_SFX = 1
+VOICE_PRIORITY_AMBIENCE = 0
+
+# Prefijo del nombre del sonido -> prioridad (se evalúa en orden)
+SOUND_PRIORITY_PREFIXES = (
+    ('ui_', VOICE_PRIORITY_UI),
+    ('death', VOICE_PRIORITY_DEATH),
+    ('game_over', VOICE_PRIORITY_DEATH),
+    ('level_complete', VOICE_PRIORITY_DEATH),
+    ('damage', VOICE_PRIORITY_DAMAGE),
+)
+
+# Intervalo mínimo (segundos) entre dos disparos del mismo sonido
+SOUND_MIN_INTERVAL = {
+    'default': 0.03,
+    'damage': 0.08,
+    'powerup': 0.05,
+    'land': 0.06,
+    'platform_touch': 0.06,
+}
+
+
+class VoiceManager:
+    """
+    Asigna canales del mixer a los sonidos con prioridades.
+    
+    Mantiene los handles de cada canal para no tener que recorrer el mixer,
+    roba la voz menos importante (y más antigua) cuando no quedan canales
+    libres y descarta repeticiones del mismo sonido en el mismo frame.
+    """
+    
+    def __init__(self, num_channels):
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        # Por canal: (nombre, prioridad, instante de inicio) o None si está libre
+        self.voices = [None] * num_channels
+        self.free = list(range(num_channels - 1, -1, -1))
+        self.by_sound = {}          # nombre -> set de índices de canal
+        self.priority_cache = {}    # nombre -> prioridad ya resuelta
+        self.frame_sounds = set()   # sonidos ya disparados en este frame
+        self.last_played = {}       # nombre -> instante del último disparo
+        self.stats = {
+            'played': 0,
+            'stolen': 0,
+            'coalesced': 0,
+            'rate_limited': 0,
+            'dropped': 0
+        }
+    
+    def priority_for(self, sound_name):
+        """Prioridad de un sonido según su nombre (con caché)"""
+        priority = self.priority_cache.get(sound_name)
+        if priority is None:
+            priority = VOICE_PRIORITY_SFX
+            for prefix, value in SOUND_PRIORITY_PREFIXES:
+                if sound_name.startswith(prefix):
+                    priority = value
+                    break
+            self.priority_cache[sound_name] = priority
+        return priority
+    
+    def begin_frame(self):
+        """Marca el inicio de un frame: se permiten de nuevo todos los sonidos"""
+        if self.frame_sounds:
+            self.frame_sounds.clear()
+    
+    def _release(self, index):
+        """Devuelve un canal a la lista de libres"""
+        voice = self.voices[index]
+        if voice is not None:
+            indices = self.by_sound.get(voice[0])
+            if indices is not None:
+                indices.discard(index)
+                if not indices:
+                    del self.by_sound[voice[0]]
+            self.voices[index] = None
+            self.free.append(index)
+    
+    def _reclaim_finished(self):
+        """Recupera los canales cuyas voces ya terminaron"""
+        for index, voice in enumerate(self.voices):
+            if voice is not None and not self.channels[index].get_busy():
+                self._release(index)
+    
+    def _allocate(self, priority):
+        """
+        Obtiene un canal para una voz de la prioridad dada.
+        
+        Returns:
+            int: Índice del canal, o None si todas las voces son más importantes
+        """
+        if not self.free:
+            self._reclaim_finished()
+        if self.free:
+            return self.free.pop()
+        
+        # Sin canales libres: robar la voz menos importante y más antigua
+        victim = None
+        for index, voice in enumerate(self.voices):
+            if victim is None or (voice[1], voice[2]) < (self.voices[victim][1], self.voices[victim][2]):
+                victim = index
+        
+        if victim is None or self.voices[victim][1] > priority:
+            return None
+        
+        self.channels[victim].stop()
+        self._release(victim)
+        self.stats['stolen'] += 1
+        return self.free.pop()
+    
+    def play(self, sound_name, sound, volume=None, loops=0, priority=None):
+        """
+        Reproduce un sonido en un canal gestionado.
+        
+        Args:
+            sound_name: Nombre lógico del sonido (para coalescer y detener)
+            sound: pygame.mixer.Sound a reproducir
+            volume: Volumen del canal (None = volumen propio del sonido)
+            loops: Repeticiones adicionales (-1 = infinito)
+            priority: Prioridad explícita (None = según el nombre)
+        
+        Returns:
+            pygame.mixer.Channel o None si el sonido se descartó
+        """
+        # Coalescer disparos idénticos dentro del mismo frame
+        if sound_name in self.frame_sounds:
+            self.stats['coalesced'] += 1
+            return None
+        
+        now = time.monotonic()
+        
+        # Limitar la frecuencia de repetición de un mismo sonido
+        min_interval = SOUND_MIN_INTERVAL.get(sound_name, SOUND_MIN_INTERVAL['default'])
+        last = self.last_played.get(sound_name)
+        if last is not None and loops == 0 and now - last < min_interval:
+            self.stats['rate_limited'] += 1
+            return None
+        
+        if priority is None:
+            priority = self.priority_for(sound_name)
+        
+        index = self._allocate(priority)
+        if index is None:
+            self.stats['dropped'] += 1
+            return None
+        
+        channel = self.channels[index]
+        channel.play(sound, loops=loops)
+        channel.set_volume(1.0 if volume is None else volume)
+        
+        self.voices[index] = (sound_name, priority, now)
+        self.by_sound.setdefault(sound_name, set()).add(index)
+        self.frame_sounds.add(sound_name)
+        self.last_played[sound_name] = now
+        self.stats['played'] += 1
+        return channel
+    
+    def stop(self, sound_name):
+        """Detiene todas las voces de un sonido sin recorrer el mixer"""
+        for index in list(self.by_sound.get(sound_name, ())):
+            self.channels[index].stop()
+            self._release(index)
+    
+    def stop_all(self):
+        """Detiene y libera todas las voces"""
+        for index, voice in enumerate(self.voices):
+            if voice is not None:
+                self.channels[index].stop()
+                self._release(index)
+    
+    def active_voices(self):
+        """Número de voces sonando actualmente"""
+        return sum(1 for index, voice in enumerate(self.voices)
+                   if voice is not None and self.channels[index].get_busy())
+
 
 class AudioManager:
     """
     Gestor de audio ÉPICO con música procedural y efectos inmersivos.
     """
     
-    def __init__(self):
-        """Inicializa el sistema de audio CON TODO EL SAZÓN"""
+    def __init__(self, synthesize=True):
+        """
+        Inicializa el sistema de audio CON TODO EL SAZÓN.
+        
+        Args:
+            synthesize: False para crear solo el mixer y los canales; los
+                        sonidos llegan después con render_sounds() (hilo de
+                        carga) y adopt_sounds() (hilo principal)
+        """
         self.enabled = ENABLE_SOUND
         
         if not self.enabled:
@@ -30,6 +222,9 @@ class AudioManager:
             # Configurar canales para mezcla profesional
             pygame.mixer.set_num_channels(16)  # Más canales para efectos simultáneos
             
+            # Asignador de voces: prioridades, robo de canal y coalescencia
+            self.voices = VoiceManager(16)
+            
             # ============================================
             # 🔊 VOLÚMENES ÉPICOS
             # ============================================
@@ -60,12 +255,10 @@ class AudioManager:
             # ============================================
             self.sounds = {}
             self.music_tracks = {}
+            self.music_buffers = {}     # pista -> WAV sintetizado (bytes)
             self.ambience_sounds = {}
-            
-            self._create_sfx()          # Efectos de sonido
-            self._create_music()        # Música de fondo
-            self._create_ambience()     # Sonidos ambientales
-            self._create_ui_sounds()    # Sonidos de interfaz
+            memory_ledger.track('audio', self, 'sounds', 'music_tracks',
+                                'music_buffers', 'ambience_sounds')
             
             # ============================================
             # 🔊 SISTEMA DE MEZCLA DINÁMICA
@@ -74,13 +267,8 @@ class AudioManager:
             self.reverb_active = False
             self.pitch_variation = 0.1
             
-            print(f"AUDIO Audio ÉPICO inicializado:")
-            print(f"   - {len(self.sounds)} efectos de sonido")
-            print(f"   - {len(self.music_tracks)} pistas musicales")
-            print(f"   - {len(self.ambience_sounds)} sonidos ambientales")
-            print(f"   - {len(self._create_ui_sounds.__code__.co_names)} sonidos de UI")
-            print(f"   - Volumen SFX: {self.sfx_volume}")
-            print(f"   - Volumen Música: {self.music_volume}")
+            if synthesize:
+                self.adopt_sounds(self.render_sounds())
             
         except Exception as e:
             print(f"ERROR Error al inicializar audio: {e}")
@@ -92,7 +280,43 @@ class AudioManager:
     # 🎮 CREACIÓN DE SONIDOS ÉPICOS
     # ============================================
     
-    def _create_sfx(self):
+    def render_sounds(self):
+        """
+        Sintetiza con NumPy los efectos, pistas y ambientes como PCM.
+        No toca el mixer, así que puede llamarse desde un hilo de carga.
+        
+        Returns:
+            dict: banco ('sounds', 'music_tracks', 'ambience_sounds') -> {nombre: PCM}
+        """
+        bank = {'sounds': {}, 'music_tracks': {}, 'ambience_sounds': {}}
+        self._create_sfx(bank['sounds'])                # Efectos de sonido
+        self._create_music(bank['music_tracks'])        # Música de fondo
+        self._create_ambience(bank['ambience_sounds'])  # Sonidos ambientales
+        self._create_ui_sounds(bank['sounds'])          # Sonidos de interfaz
+        return bank
+    
+    def adopt_sounds(self, bank):
+        """
+        Convierte en pygame.mixer.Sound el PCM de render_sounds().
+        Crea objetos del mixer: solo desde el hilo principal.
+        """
+        if not self.enabled or not bank:
+            return
+        for bank_name, pcm_sounds in bank.items():
+            target = getattr(self, bank_name)
+            for name, pcm in pcm_sounds.items():
+                if pcm is not None:
+                    target[name] = self._pcm_to_sound(pcm)
+        
+        print(f"AUDIO Audio ÉPICO inicializado:")
+        print(f"   - {len(self.sounds)} efectos de sonido")
+        print(f"   - {len(self.music_tracks)} pistas musicales")
+        print(f"   - {len(self.ambience_sounds)} sonidos ambientales")
+        print(f"   - {len(self._create_ui_sounds.__code__.co_names)} sonidos de UI")
+        print(f"   - Volumen SFX: {self.sfx_volume}")
+        print(f"   - Volumen Música: {self.music_volume}")
+    
+    def _create_sfx(self, sounds):
         """
         Crea efectos de sonido ÉPICOS para el gameplay.
         """
@@ -103,70 +327,70 @@ class AudioManager:
             # 🏃 SONIDOS DEL JUGADOR
             # ============================================
             # Salto (con variaciones)
-            self.sounds['jump'] = self._create_jump_sound()
-            self.sounds['jump_double'] = self._create_jump_sound(pitch=1.2)
-            self.sounds['jump_power'] = self._create_jump_sound(pitch=1.5, duration=0.15)
+            sounds['jump'] = self._create_jump_sound()
+            sounds['jump_double'] = self._create_jump_sound(pitch=1.2)
+            sounds['jump_power'] = self._create_jump_sound(pitch=1.5, duration=0.15)
             
             # Aterrizaje
-            self.sounds['land'] = self._create_land_sound()
-            self.sounds['land_hard'] = self._create_land_sound(pitch=0.8, duration=0.2)
+            sounds['land'] = self._create_land_sound()
+            sounds['land_hard'] = self._create_land_sound(pitch=0.8, duration=0.2)
             
             # ============================================
             # ⚔️ SONIDOS DE COMBATE
             # ============================================
             # Daño recibido
-            self.sounds['damage'] = self._create_damage_sound()
-            self.sounds['damage_shield'] = self._create_shield_hit()
-            self.sounds['damage_critical'] = self._create_critical_hit()
+            sounds['damage'] = self._create_damage_sound()
+            sounds['damage_shield'] = self._create_shield_hit()
+            sounds['damage_critical'] = self._create_critical_hit()
             
             # Muerte
-            self.sounds['death'] = self._create_death_sound()
-            self.sounds['death_fall'] = self._create_fall_sound()
+            sounds['death'] = self._create_death_sound()
+            sounds['death_fall'] = self._create_fall_sound()
             
             # ============================================
             # ⚡ SONIDOS DE POWER-UPS
             # ============================================
-            self.sounds['powerup_shield'] = self._create_powerup_sound(base_freq=440, type='shield')
-            self.sounds['powerup_speed'] = self._create_powerup_sound(base_freq=660, type='speed')
-            self.sounds['powerup_zoom'] = self._create_powerup_sound(base_freq=550, type='zoom')
-            self.sounds['powerup_combo'] = self._create_powerup_sound(base_freq=880, type='combo')
-            self.sounds['powerup_collect'] = self._create_collect_sound()
+            sounds['powerup_shield'] = self._create_powerup_sound(base_freq=440, type='shield')
+            sounds['powerup_speed'] = self._create_powerup_sound(base_freq=660, type='speed')
+            sounds['powerup_zoom'] = self._create_powerup_sound(base_freq=550, type='zoom')
+            sounds['powerup_combo'] = self._create_powerup_sound(base_freq=880, type='combo')
+            sounds['powerup_collect'] = self._create_collect_sound()
             
             # ============================================
             # 🎯 SONIDOS DE GAMEPLAY
             # ============================================
-            self.sounds['platform_touch'] = self._create_platform_sound()
-            self.sounds['combo_bonus'] = self._create_combo_sound()
-            self.sounds['score_bonus'] = self._create_score_sound()
-            self.sounds['level_complete'] = self._create_victory_fanfare()
-            self.sounds['game_over'] = self._create_game_over_sound()
+            sounds['platform_touch'] = self._create_platform_sound()
+            sounds['combo_bonus'] = self._create_combo_sound()
+            sounds['score_bonus'] = self._create_score_sound()
+            sounds['level_complete'] = self._create_victory_fanfare()
+            sounds['game_over'] = self._create_game_over_sound()
             
             # ============================================
             # 🦇 SONIDOS DE ENEMIGOS
             # ============================================
-            self.sounds['enemy_spawn'] = self._create_enemy_spawn()
-            self.sounds['enemy_hit'] = self._create_enemy_hit()
-            self.sounds['bat_flap'] = self._create_bat_sound()
-            self.sounds['rock_fall'] = self._create_rock_sound()
-            self.sounds['lightning_strike'] = self._create_lightning_sound()
+            sounds['enemy_spawn'] = self._create_enemy_spawn()
+            sounds['enemy_hit'] = self._create_enemy_hit()
+            sounds['bat_flap'] = self._create_bat_sound()
+            sounds['rock_fall'] = self._create_rock_sound()
+            sounds['lightning_strike'] = self._create_lightning_sound()
             
             # ============================================
             # 🌋 SONIDOS DE LAVA
             # ============================================
-            self.sounds['lava_bubble'] = self._create_lava_bubble()
-            self.sounds['lava_splash'] = self._create_lava_splash()
-            self.sounds['lava_rise'] = self._create_lava_rise()
+            sounds['lava_bubble'] = self._create_lava_bubble()
+            sounds['lava_splash'] = self._create_lava_splash()
+            sounds['lava_rise'] = self._create_lava_rise()
             
-            print(f"OK {len(self.sounds)} efectos de sonido creados")
+            print(f"OK {len(sounds)} efectos de sonido creados")
             
         except ImportError:
             print("ERROR NumPy no disponible - Usando sonidos básicos")
-            self._create_basic_sounds()
+            self._create_basic_sounds(sounds)
         except Exception as e:
             print(f"ERROR Error al crear SFX: {e}")
-            self._create_basic_sounds()
+            self._create_basic_sounds(sounds)
     
-    def _create_music(self):
+    def _create_music(self, tracks):
         """
         Crea música procedural para cada nivel.
         """
@@ -177,27 +401,27 @@ class AudioManager:
             # MÚSICA POR NIVEL
             # ============================================
             # Nivel 1 - Bosque (melodía tranquila)
-            self.music_tracks['level_1'] = self._create_forest_music()
+            tracks['level_1'] = self._create_forest_music()
             
             # Nivel 2 - Caverna (ritmo misterioso)
-            self.music_tracks['level_2'] = self._create_cavern_music()
+            tracks['level_2'] = self._create_cavern_music()
             
             # Nivel 3 - Tormenta (tensión épica)
-            self.music_tracks['level_3'] = self._create_storm_music()
+            tracks['level_3'] = self._create_storm_music()
             
             # ============================================
             # 🎮 MÚSICA DE MENÚ
             # ============================================
-            self.music_tracks['menu'] = self._create_menu_music()
-            self.music_tracks['boss'] = self._create_boss_music()
-            self.music_tracks['victory'] = self._create_ending_music()
+            # (menú y juego van por prepare_music: WAV en music_buffers)
+            tracks['boss'] = self._create_boss_music()
+            tracks['victory'] = self._create_ending_music()
             
-            print(f"OK {len(self.music_tracks)} pistas musicales creadas")
+            print(f"OK {len(tracks)} pistas musicales creadas")
             
         except Exception as e:
             print(f"ERROR Error al crear música: {e}")
     
-    def _create_ambience(self):
+    def _create_ambience(self, ambience):
         """
         Crea sonidos ambientales para inmersión.
         """
@@ -205,45 +429,45 @@ class AudioManager:
             import numpy as np
             
             # Ambiente de bosque (viento, pájaros)
-            self.ambience_sounds['forest_wind'] = self._create_wind_sound()
-            self.ambience_sounds['forest_birds'] = self._create_birds_sound()
+            ambience['forest_wind'] = self._create_wind_sound()
+            ambience['forest_birds'] = self._create_birds_sound()
             
             # Ambiente de caverna (goteo, ecos)
-            self.ambience_sounds['cavern_drip'] = self._create_drip_sound()
-            self.ambience_sounds['cavern_echo'] = self._create_echo_sound()
+            ambience['cavern_drip'] = self._create_drip_sound()
+            ambience['cavern_echo'] = self._create_echo_sound()
             
             # Ambiente de tormenta (viento fuerte, truenos)
-            self.ambience_sounds['storm_wind'] = self._create_storm_wind()
-            self.ambience_sounds['thunder'] = self._create_thunder_sound()
+            ambience['storm_wind'] = self._create_storm_wind()
+            ambience['thunder'] = self._create_thunder_sound()
             
             # Ambiente general
-            self.ambience_sounds['heartbeat'] = self._create_heartbeat()
-            self.ambience_sounds['tension'] = self._create_tension_sound()
+            ambience['heartbeat'] = self._create_heartbeat()
+            ambience['tension'] = self._create_tension_sound()
             
-            print(f"OK {len(self.ambience_sounds)} sonidos ambientales creados")
+            print(f"OK {len(ambience)} sonidos ambientales creados")
             
         except Exception as e:
             print(f"ERROR Error al crear ambience: {e}")
     
-    def _create_ui_sounds(self):
+    def _create_ui_sounds(self, sounds):
         """
         Crea sonidos para la interfaz de usuario.
         """
         try:
             import numpy as np
             
-            self.sounds['ui_select'] = self._create_ui_sound(freq=440, duration=0.1)
-            self.sounds['ui_confirm'] = self._create_ui_sound(freq=660, duration=0.15)
-            self.sounds['ui_back'] = self._create_ui_sound(freq=330, duration=0.1)
-            self.sounds['ui_hover'] = self._create_ui_sound(freq=550, duration=0.08)
-            self.sounds['ui_error'] = self._create_ui_sound(freq=220, duration=0.2, wave='square')
+            sounds['ui_select'] = self._create_ui_sound(freq=440, duration=0.1)
+            sounds['ui_confirm'] = self._create_ui_sound(freq=660, duration=0.15)
+            sounds['ui_back'] = self._create_ui_sound(freq=330, duration=0.1)
+            sounds['ui_hover'] = self._create_ui_sound(freq=550, duration=0.08)
+            sounds['ui_error'] = self._create_ui_sound(freq=220, duration=0.2, wave='square')
             
             print(f"OK Sonidos de UI creados")
             
         except Exception as e:
             print(f"ERROR Error al crear UI sounds: {e}")
     
-    def _create_basic_sounds(self):
+    def _create_basic_sounds(self, sounds):
         """
         Crea sonidos básicos como fallback.
         """
@@ -256,7 +480,7 @@ class AudioManager:
             'level_complete': self._simple_beep(880, 0.25),
         }
         
-        self.sounds.update(basic_sounds)
+        sounds.update(basic_sounds)
         print(f"WARNING Sonidos básicos creados como fallback")
     
     # ============================================
@@ -294,7 +518,7 @@ class AudioManager:
         noise = np.random.normal(0, 0.1, samples)
         wave = wave * 0.8 + noise * 0.2
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _create_land_sound(self, pitch=1.0, duration=0.15):
         """Crea sonido de aterrizaje (impacto suave)"""
@@ -321,7 +545,7 @@ class AudioManager:
         impact_noise = np.random.normal(0, 0.3, samples) * np.exp(-t * 30)
         wave = wave + impact_noise * 0.5
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _create_damage_sound(self):
         """Crea sonido de daño (desagradable)"""
@@ -356,7 +580,7 @@ class AudioManager:
         
         wave = wave * envelope * 0.7
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _create_powerup_sound(self, base_freq=440, type='shield'):
         """Crea sonido de power-up épico"""
@@ -409,7 +633,7 @@ class AudioManager:
         harmonics = np.sin(phase * 2) * 0.3 + np.sin(phase * 3) * 0.2
         wave = wave * 0.7 + harmonics
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _create_victory_fanfare(self):
         """Crea fanfarria de victoria"""
@@ -457,7 +681,7 @@ class AudioManager:
                 noise = np.random.normal(0, 0.5, len(kick_env))
                 wave[kick_sample:kick_sample + len(kick_env)] += noise * kick_env * 0.4
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _create_forest_music(self):
         """Crea música tranquila para el bosque"""
@@ -540,7 +764,7 @@ class AudioManager:
         # Normalizar
         wave = wave / np.max(np.abs(wave)) * 0.5
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _create_wind_sound(self):
         """Crea sonido de viento ambiental"""
@@ -572,7 +796,7 @@ class AudioManager:
         
         wind = wind * envelope * 0.3
         
-        return self._numpy_to_sound(wind)
+        return self._numpy_to_pcm(wind)
     
     def _create_heartbeat(self):
         """Crea sonido de latido para tensión"""
@@ -606,7 +830,7 @@ class AudioManager:
                 
                 wave[beat_sample:beat_sample + beat_samples] += beat_wave * (0.8 if i == 0 else 0.6)
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _simple_beep(self, freq, duration):
         """Crea un beep simple (fallback)"""
@@ -624,7 +848,7 @@ class AudioManager:
             wave[:fade] *= np.linspace(0, 1, fade)
             wave[-fade:] *= np.linspace(1, 0, fade)
         
-        return self._numpy_to_sound(wave)
+        return self._numpy_to_pcm(wave)
     
     def _butter_lowpass(self, cutoff, fs, order=4):
         """Diseña un filtro paso bajo Butterworth"""
@@ -635,8 +859,8 @@ class AudioManager:
         b, a = signal.butter(order, normal_cutoff, btype='low', analog=False)
         return b, a
     
-    def _numpy_to_sound(self, wave):
-        """Convierte array numpy a pygame Sound"""
+    def _numpy_to_pcm(self, wave):
+        """Convierte una onda NumPy en PCM estéreo de 16 bits (sin mixer)"""
         import numpy as np
         
         # Normalizar
@@ -648,12 +872,12 @@ class AudioManager:
         wave_16bit = (wave * 32767).astype(np.int16)
         
         # Estereo
-        stereo = np.column_stack((wave_16bit, wave_16bit))
-        
-        # Crear Sound
-        sound = pygame.mixer.Sound(buffer=stereo)
+        return np.column_stack((wave_16bit, wave_16bit))
+    
+    def _pcm_to_sound(self, pcm):
+        """Crea el pygame Sound de un PCM (hilo principal)"""
+        sound = pygame.mixer.Sound(buffer=pcm)
         sound.set_volume(self.sfx_volume)
-        
         return sound
     
     # ============================================
@@ -666,9 +890,12 @@ class AudioManager:
         
         Args:
             sound_name: Nombre del sonido
-            channel: Canal específico (0-15)
+            channel: Canal específico (0-15), lo decide el gestor de voces
             volume: Volumen específico (0.0-1.0)
             pitch_variation: Variación aleatoria de pitch
+        
+        Returns:
+            pygame.mixer.Channel usado, o None si se descartó
         """
         if not self.enabled or sound_name not in self.sounds:
             return
@@ -682,22 +909,12 @@ class AudioManager:
             
             # Aplicar variación de pitch si está activada
             if pitch_variation and self.pitch_variation > 0:
-                import random
                 pitch = 1.0 + random.uniform(-self.pitch_variation, self.pitch_variation)
                 # Nota: pygame no soporta cambio de pitch directamente
                 # Podrías implementar resampling si es crítico
             
-            # Volumen específico o por defecto
-            if volume is not None:
-                current_volume = sound.get_volume()
-                sound.set_volume(volume)
-                sound.play()
-                sound.set_volume(current_volume)  # Restaurar
-            else:
-                sound.play()
-            
-            # Debug opcional
-            # print(f"AUDIO Reproduciendo: {sound_name}")
+            # El canal lo elige el gestor de voces (channel se ignora)
+            return self.voices.play(sound_name, sound, volume=volume)
             
         except Exception as e:
             print(f"ERROR Error al reproducir {sound_name}: {e}")
@@ -795,7 +1012,46 @@ class AudioManager:
         
         return self.is_muted
     
+    def prepare_music(self, track_name):
+        """
+        Sintetiza (una sola vez) el WAV de una pista y lo guarda en memoria.
+        Solo usa NumPy, así que puede llamarse desde un hilo de carga.
+        
+        Returns:
+            bytes del WAV, o None si la pista no existe o falló
+        """
+        if track_name not in self.music_buffers:
+            renderer = {
+                'menu': self._render_menu_music,
+                'game': self._render_game_music
+            }.get(track_name)
+            if renderer is None:
+                return None
+            self.music_buffers[track_name] = renderer()
+        return self.music_buffers[track_name]
+    
+    def _load_music_buffer(self, track_name):
+        """Carga en pygame.mixer.music una pista ya sintetizada"""
+        import io
+        buffer = self.prepare_music(track_name)
+        if buffer:
+            pygame.mixer.music.load(io.BytesIO(buffer), 'wav')
+    
     def _create_menu_music(self):
+        """Carga la música de menú (sintetizada solo la primera vez)"""
+        try:
+            self._load_music_buffer('menu')
+        except Exception as e:
+            print(f"ERROR al cargar música de menú: {e}")
+    
+    def _create_game_music(self):
+        """Carga la música de juego (sintetizada solo la primera vez)"""
+        try:
+            self._load_music_buffer('game')
+        except Exception as e:
+            print(f"ERROR al cargar música de juego: {e}")
+    
+    def _render_menu_music(self):
         """Crea música épica de guerra para el menú"""
         try:
             import numpy as np
@@ -894,13 +1150,12 @@ class AudioManager:
                 wav_file.setframerate(sample_rate)
                 wav_file.writeframes(audio_data.tobytes())
             
-            wav_io.seek(0)
-            pygame.mixer.music.load(wav_io, 'wav')
+            return wav_io.getvalue()
             
         except Exception as e:
             print(f"ERROR al crear música de menú: {e}")
     
-    def _create_game_music(self):
+    def _render_game_music(self):
         """Crea música de batalla intensa para el juego"""
         try:
             import numpy as np
@@ -1020,8 +1275,7 @@ class AudioManager:
                 wav_file.setframerate(sample_rate)
                 wav_file.writeframes(audio_data.tobytes())
             
-            wav_io.seek(0)
-            pygame.mixer.music.load(wav_io, 'wav')
+            return wav_io.getvalue()
             
         except Exception as e:
             print(f"ERROR al crear música de juego: {e}")
@@ -1043,7 +1297,8 @@ class AudioManager:
             
             # Reproducir en loop si se especifica
             if loops != 0:
-                sound.play(loops=loops)
+                self.voices.play(ambience_name, sound, loops=loops,
+                                 priority=VOICE_PRIORITY_AMBIENCE)
             
         except Exception as e:
             print(f"ERROR Error al reproducir ambience {ambience_name}: {e}")
@@ -1054,6 +1309,7 @@ class AudioManager:
             return
         
         try:
+            self.voices.stop_all()
             pygame.mixer.stop()
             pygame.mixer.music.stop()
         except:
@@ -1065,11 +1321,8 @@ class AudioManager:
             return
         
         try:
-            # Buscar canal donde se está reproduciendo
-            for channel in range(pygame.mixer.get_num_channels()):
-                if pygame.mixer.Channel(channel).get_busy():
-                    if pygame.mixer.Channel(channel).get_sound() == self.sounds[sound_name]:
-                        pygame.mixer.Channel(channel).stop()
+            # Los canales del sonido ya están registrados en el gestor de voces
+            self.voices.stop(sound_name)
         except:
             pass
     
@@ -1137,6 +1390,9 @@ class AudioManager:
         
         self.music_timer += dt
         
+        # Nuevo frame: se permiten de nuevo los sonidos ya disparados
+        self.voices.begin_frame()
+        
         # Cambios dinámicos basados en gameplay podrían ir aquí
         # Ej: subir tempo cuando sube la lava, etc.
 
@@ -1148,17 +1404,40 @@ class AudioManager:
 # Instancia global
 _audio_manager = None
 
-def init_audio():
+def init_audio(synthesize=True):
     """Inicializa el gestor de audio global"""
     global _audio_manager
     try:
-        _audio_manager = AudioManager()
+        _audio_manager = AudioManager(synthesize)
         return _audio_manager
     except Exception as e:
         print(f"ERROR Audio no disponible: {e}")
         _audio_manager = None
         return None
 
+def ensure_audio(synthesize=True):
+    """Inicializa el audio solo si aún no existe (reutiliza sonidos y música)"""
+    if _audio_manager is None:
+        return init_audio(synthesize)
+    return _audio_manager
+
+def prepare_audio(manager, tracks=('menu',)):
+    """
+    Sintetiza efectos, ambientes y las pistas indicadas para un gestor
+    creado con ensure_audio(synthesize=False). Pensado para el hilo de
+    carga: solo NumPy; el resultado se entrega a manager.adopt_sounds en
+    el hilo principal.
+    
+    Returns:
+        El banco PCM de render_sounds(), o None si el audio está apagado
+    """
+    if not manager or not manager.enabled:
+        return None
+    bank = manager.render_sounds()
+    for track_name in tracks:
+        manager.prepare_music(track_name)
+    return bank
+
 def play_sound(sound_name, **kwargs):
     """
     Función auxiliar para reproducir sonidos.
@@ -1168,11 +1447,16 @@ def play_sound(sound_name, **kwargs):
         **kwargs: Argumentos adicionales para play()
     """
     if _audio_manager:
-        _audio_manager.play(sound_name, **kwargs)
+        return _audio_manager.play(sound_name, **kwargs)
     else:
         # Fallback silencioso
         pass
 
+def update_audio(dt):
+    """Avanza el audio un frame (llamar una vez por frame desde el bucle)"""
+    if _audio_manager and _audio_manager.enabled:
+        _audio_manager.update(dt)
+
 def play_music(track_name, loops=-1, volume=None):
     """Reproduce música"""
     if _audio_manager:
@@ -0,0 +1,150 @@
+"""
+benchmark.py - Modo benchmark (python main.py --benchmark [FRAMES])
+
+Juega cada nivel durante BENCHMARK_FRAMES frames sin menú ni entrada del
+jugador y guarda en BENCHMARK_FILE, por nivel:
+  - tiempos de frame (media, p95, máximo) y por fase (update, draw, flip);
+  - colecciones del GC durante el nivel;
+  - el informe de memory_ledger al terminar el nivel (totales por
+    subsistema), para ver qué recortar si no cabe en MEMORY_BUDGET_MB.
+
+Los frames no esperan al reloj (dt fijo de 1/FPS), así que el tiempo
+medido es solo trabajo. El gobernador de calidad no actúa: se mide el
+nivel de calidad actual (main.py --quality para elegirlo). El jugador
+no se mueve: es invulnerable y la lava se mantiene a
+BENCHMARK_LAVA_MARGIN píxeles por debajo, para que el nivel no termine
+antes de tiempo y las partículas sigan activas.
+"""
+
+import json
+import platform
+from datetime import datetime
+import pygame
+from objects.constants import (FPS, LEVELS_CONFIG, STATE_LOADING, STATE_PLAYING, GAME_MODE_LEVELS,
+                               GAME_MODE_ENDLESS, BENCHMARK_FRAMES, BENCHMARK_FILE,
+                               BENCHMARK_LAVA_MARGIN)
+from objects.game import Game
+from objects.profiler import profiler
+from objects.gc_policy import gc_policy
+from objects.capture import capture
+from objects.quality import quality
+from objects.memory_ledger import memory_ledger
+from objects.event_log import event_log
+
+PHASES = ('events', 'update', 'draw', 'flip')
+
+
+def _wait_for_level(game):
+    """Avanza la pantalla de carga hasta que el nivel esté construido"""
+    while game.state == STATE_LOADING:
+        pygame.event.pump()
+        game.update(0)
+        pygame.time.wait(5)
+
+
+def _keep_alive(game):
+    """Sin jugador humano: nadie muere y la lava no alcanza al jugador"""
+    player, lava = game.player, game.lava
+    if not player:
+        return
+    player.invulnerable = True
+    player.invuln_timer = 1.0
+    if lava.y - player.y < BENCHMARK_LAVA_MARGIN:
+        lava.y = lava.target_y = player.y + BENCHMARK_LAVA_MARGIN
+
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+
+def benchmark_level(game, frames):
+    """Juega el nivel actual y devuelve su resultado"""
+    dt = 1.0 / FPS
+    frame_ms = []
+    phase_ms = {phase: 0.0 for phase in PHASES}
+    gc_before = list(profiler.gc_counts)
+
+    for _ in range(frames):
+        if game.state != STATE_PLAYING:
+            break
+        _keep_alive(game)
+        profiler.begin_frame()
+        pygame.event.pump()
+        profiler.mark('events')
+        game.update(dt)
+        profiler.mark('update')
+        game.draw()
+        profiler.mark('draw')
+        pygame.display.flip()
+        profiler.mark('flip')
+        frame_ms.append(profiler.end_frame())
+        for phase, ms in profiler.phases.items():
+            phase_ms[phase] += ms
+
+    played = len(frame_ms)
+    ordered = sorted(frame_ms)
+    return {
+        'level': game.current_level_number,
+        'frames': played,
+        'final_state': game.state,
+        'frame_ms': {
+            'avg': round(sum(frame_ms) / played, 3) if played else 0.0,
+            'p50': round(_percentile(ordered, 0.50), 3),
+            'p95': round(_percentile(ordered, 0.95), 3),
+            'max': round(ordered[-1], 3) if ordered else 0.0,
+            'over_budget': sum(1 for ms in frame_ms if ms > 1000.0 / FPS),
+        },
+        'phase_ms_avg': {phase: round(total / played, 3) if played else 0.0
+                         for phase, total in phase_ms.items()},
+        'gc_collections': [after - before for before, after in zip(gc_before, profiler.gc_counts)],
+        'enemies': len(game.level.enemies) if game.level else 0,
+        'quality': quality.current['name'],
+        'memory': memory_ledger.report(),
+    }
+
+
+def run_benchmark(screen, frames=BENCHMARK_FRAMES, difficulty="normal", mode=GAME_MODE_LEVELS,
+                  output=BENCHMARK_FILE):
+    """
+    Ejecuta el benchmark de todos los niveles y escribe el JSON.
+
+    Args:
+        screen: Superficie de la ventana
+        frames: Frames por nivel
+        difficulty: Dificultad de los niveles
+        mode: GAME_MODE_ENDLESS para medir el ascenso infinito (un solo tramo)
+        output: Ruta del JSON
+
+    Returns:
+        dict con los resultados
+    """
+    game = Game(difficulty, screen, mode)
+    levels = [1] if mode == GAME_MODE_ENDLESS else sorted(LEVELS_CONFIG)
+    results = []
+    for number in levels:
+        if number != game.current_level_number:
+            # Sin record_run: el benchmark no entra en el historial de partidas
+            game.start_level(number)
+        _wait_for_level(game)
+        result = benchmark_level(game, frames)
+        results.append(result)
+        event_log.info('Benchmark', "Nivel %s: %d frames, media %.2f ms, p95 %.2f ms, memoria %.1f MB",
+                       number, result['frames'], result['frame_ms']['avg'],
+                       result['frame_ms']['p95'], result['memory']['total_bytes'] / (1024 * 1024))
+    gc_policy.set_state(None)
+    capture.level_ended("benchmark")
+
+    data = {
+        'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'difficulty': difficulty,
+        'mode': mode,
+        'frames_per_level': frames,
+        'fps_target': FPS,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'levels': results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    event_log.info('Benchmark', "Resultados guardados en %s", output)
+    return data
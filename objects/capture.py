@@ -0,0 +1,121 @@
+"""
+capture.py - Capturas de cProfile y tracemalloc por nivel
+
+Se activan al lanzar el juego (python main.py --profile / --tracemalloc),
+sin tocar el código. Cada intento de nivel es una captura:
+  - --profile: cProfile activo desde que empieza el nivel hasta que
+    termina; se guarda en profile_L<nivel>_<dificultad>_<final>_<hora>.prof;
+  - --tracemalloc: instantánea al empezar y al terminar el nivel; se
+    guardan las dos (.tmsnap, para el resumen) y un informe de texto con
+    las líneas que más memoria han ganado (alloc_..._<hora>.txt).
+
+Los archivos van a CAPTURE_DIR; el resumen de todas las capturas está en
+capture_report.py.
+"""
+
+import os
+import cProfile
+import tracemalloc
+from datetime import datetime
+from objects.constants import CAPTURE_DIR, CAPTURE_REPORT_TOP, GAME_MODE_ENDLESS
+from objects.event_log import event_log
+
+
+class CaptureSession:
+    """Abre y cierra las capturas al empezar y terminar cada nivel"""
+
+    def __init__(self):
+        self.profile = False
+        self.tracemalloc_frames = 0
+        self.directory = CAPTURE_DIR
+        self.label = None
+        self._profiler = None
+        self._start_snapshot = None
+
+    @property
+    def enabled(self):
+        return self.profile or self.tracemalloc_frames > 0
+
+    def configure(self, profile=False, tracemalloc_frames=0, directory=CAPTURE_DIR):
+        """Modos elegidos al lanzar (main.py)"""
+        self.profile = profile
+        self.tracemalloc_frames = tracemalloc_frames
+        self.directory = directory
+        if tracemalloc_frames and not tracemalloc.is_tracing():
+            tracemalloc.start(tracemalloc_frames)
+        if self.enabled:
+            os.makedirs(directory, exist_ok=True)
+            event_log.info('Capture', "Capturas activas (cProfile: %s, tracemalloc: %s) en %s",
+                           'sí' if profile else 'no', tracemalloc_frames or 'no', directory)
+
+    # ============================================
+    # 🎬 INICIO Y FIN DE NIVEL
+    # ============================================
+
+    def level_started(self, level, difficulty, mode):
+        if not self.enabled:
+            return
+        if self.label is not None:
+            # Reintento sin terminar el anterior
+            self.level_ended("restart")
+        self.label = f"L{level}_{difficulty}" + ("_endless" if mode == GAME_MODE_ENDLESS else "")
+        if self.tracemalloc_frames:
+            self._start_snapshot = tracemalloc.take_snapshot()
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def level_ended(self, outcome):
+        """Cierra las capturas del nivel en curso (no hace nada si no hay)"""
+        if self.label is None:
+            return
+        if self._profiler is not None:
+            self._profiler.disable()
+        name = f"{self.label}_{outcome}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.label = None
+
+        try:
+            # La instantánea final antes de volcar el perfil, que también reserva memoria
+            if self._start_snapshot is not None:
+                self._write_allocations(name, self._start_snapshot, tracemalloc.take_snapshot())
+            if self._profiler is not None:
+                path = os.path.join(self.directory, f"profile_{name}.prof")
+                self._profiler.dump_stats(path)
+                event_log.info('Capture', "Perfil guardado en %s", path)
+        except Exception as e:
+            event_log.error('Capture', "Error guardando captura %s: %s", name, e)
+        finally:
+            self._profiler = None
+            self._start_snapshot = None
+
+    def _write_allocations(self, name, start, end):
+        """Guarda las dos instantáneas y el informe de diferencias"""
+        filters = (tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, cProfile.__file__),
+                   tracemalloc.Filter(False, "<frozen importlib._bootstrap>"))
+        start = start.filter_traces(filters)
+        end = end.filter_traces(filters)
+        start.dump(os.path.join(self.directory, f"alloc_{name}_start.tmsnap"))
+        end.dump(os.path.join(self.directory, f"alloc_{name}_end.tmsnap"))
+
+        path = os.path.join(self.directory, f"alloc_{name}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(format_allocation_diff(start, end, name))
+        event_log.info('Capture', "Informe de memoria guardado en %s", path)
+
+
+def format_allocation_diff(start, end, title, top=CAPTURE_REPORT_TOP):
+    """Texto con las líneas que más memoria ganaron entre dos instantáneas"""
+    stats = end.compare_to(start, 'lineno')
+    total = sum(stat.size_diff for stat in stats)
+    lines = [f"=== Memoria {title} ===",
+             f"Diferencia total: {total / 1024:+.1f} KiB en {len(stats)} líneas", ""]
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} bloques  "
+                     f"{frame.filename}:{frame.lineno}")
+    return "\n".join(lines) + "\n"
+
+
+# Sesión compartida por main.py y el juego
+capture = CaptureSession()
@@ -0,0 +1,81 @@
+"""
+capture_report.py - Resumen de las capturas de cProfile y tracemalloc
+
+Lee lo que deja capture.py en CAPTURE_DIR (o en las rutas indicadas):
+  - .prof: funciones con más tiempo acumulado, de cada captura y de
+    todas juntas;
+  - pares alloc_*_start.tmsnap / alloc_*_end.tmsnap: líneas que más
+    memoria ganaron durante el nivel (p. ej. superficies creadas en
+    Lava.draw o partículas en diccionarios).
+
+Uso:
+    python -m objects.capture_report [archivos o carpetas] [--top N]
+"""
+
+import os
+import sys
+import glob
+import pstats
+import argparse
+import tracemalloc
+from objects.constants import CAPTURE_DIR, CAPTURE_REPORT_TOP
+from objects.capture import format_allocation_diff
+
+SNAPSHOT_START = "_start.tmsnap"
+SNAPSHOT_END = "_end.tmsnap"
+
+
+def collect_files(paths):
+    """(perfiles .prof, pares de instantáneas) de las rutas indicadas"""
+    files = []
+    for path in paths or [CAPTURE_DIR]:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*"))))
+        elif os.path.exists(path):
+            files.append(path)
+    profiles = [path for path in files if path.endswith(".prof")]
+    pairs = []
+    for path in files:
+        if path.endswith(SNAPSHOT_START):
+            end = path[:-len(SNAPSHOT_START)] + SNAPSHOT_END
+            if os.path.exists(end):
+                pairs.append((path, end))
+    return profiles, pairs
+
+
+def print_profiles(profiles, top):
+    for path in profiles:
+        print(f"\n=== {os.path.basename(path)} ===")
+        pstats.Stats(path).strip_dirs().sort_stats('cumulative').print_stats(top)
+    if len(profiles) > 1:
+        print(f"\n=== Todos los perfiles ({len(profiles)}) ===")
+        pstats.Stats(*profiles).strip_dirs().sort_stats('cumulative').print_stats(top)
+
+
+def print_allocations(pairs, top):
+    for start_path, end_path in pairs:
+        name = os.path.basename(start_path)[len("alloc_"):-len(SNAPSHOT_START)]
+        start = tracemalloc.Snapshot.load(start_path)
+        end = tracemalloc.Snapshot.load(end_path)
+        print()
+        print(format_allocation_diff(start, end, name, top), end="")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resumen de capturas de cProfile y tracemalloc")
+    parser.add_argument("paths", nargs="*", help=f"Archivos o carpetas (por defecto {CAPTURE_DIR})")
+    parser.add_argument("--top", type=int, default=CAPTURE_REPORT_TOP,
+                        help="Filas por informe")
+    args = parser.parse_args(argv)
+
+    profiles, pairs = collect_files(args.paths)
+    if not profiles and not pairs:
+        print(f"[CaptureReport] No hay capturas en {args.paths or CAPTURE_DIR}")
+        return 1
+    print_profiles(profiles, args.top)
+    print_allocations(pairs, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
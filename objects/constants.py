@@ -22,10 +22,20 @@ PLAYER_SPEED = 300
 PLAYER_LIVES = 3  # <-- Añadida esta línea
 PLAYER_COLOR = (0, 200, 255)
 
+# Física que ejecuta Player (por frame). Levels/reachability.py calcula el
+# alcance de salto con estos mismos valores, así que los niveles generados
+# se adaptan solos si cambian
+PLAYER_JUMP_FORCE = -15        # Negativo: hacia arriba
+PLAYER_GRAVITY = 0.5
+PLAYER_RUN_SPEED = 7           # Píxeles por frame
+PLAYER_AIR_FRICTION = 0.95     # vel_x se multiplica por esto cada frame en el aire
+
 # ============= PLATAFORMAS =============
 PLATFORM_WIDTH = 120
 PLATFORM_HEIGHT = 20
 PLATFORM_VERTICAL_SPACING = 80
+# Distancia mínima entre el spawn y los enemigos generados
+SPAWN_SAFE_RADIUS = 250
 
 # ============= ENEMIGOS =============
 BAT_WIDTH = 35
@@ -38,6 +48,7 @@ TRAP_ROTATION_SPEED = 2
 
 ROCK_SIZE = 30
 ROCK_FALL_SPEED = 3
+ROCK_GRAVITY = 2.0
 
 LIGHTNING_WIDTH = 15
 LIGHTNING_HEIGHT = 100
@@ -210,6 +221,34 @@ LEVELS_CONFIG = {
     3: {'name': 'Tormenta Eléctrica', 'platforms': 15, 'bats': 3, 'traps': 2, 'rocks': 2, 'lightning': 2, 'powerups': 6}
 }
 
+# Modo infinito: el nivel se genera por segmentos por encima del jugador
+# y los segmentos que quedan bajo la lava se liberan
+GAME_MODE_LEVELS = 'levels'
+GAME_MODE_ENDLESS = 'endless'
+ENDLESS_CHUNK_PLATFORMS = 10                 # Plataformas por segmento
+ENDLESS_GENERATE_AHEAD = SCREEN_HEIGHT * 2   # Altura pre-generada sobre el jugador
+ENDLESS_RETIRE_MARGIN = 200                  # Margen bajo la lava antes de liberar
+ENDLESS_MAX_BELOW_PLAYER = SCREEN_HEIGHT * 3 # Nunca se conserva más de esto bajo el jugador
+ENDLESS_CHUNKS_PER_ZONE = 5                  # Segmentos por zona (bosque, caverna, tormenta)
+
+# Ciclo de vida de enemigos: se retiran los que quedan muy por debajo de
+# la cámara o bajo la lava, y los generados durante la partida tienen
+# además una edad máxima y un máximo de instancias vivas por tipo
+DESPAWN_BELOW_CAMERA = SCREEN_HEIGHT * 2     # Distancia bajo el jugador
+DESPAWN_BELOW_LAVA = 100                     # Margen bajo la superficie de la lava
+ENEMY_MAX_AGES = {                           # Segundos (None = sin límite)
+    'FallingRock': 8.0,
+    'Lightning': None,                       # Ya se apaga solo
+    'Bat': 45.0,
+    'SurveillanceDrone': 60.0,
+}
+ENEMY_SPAWN_CAPS = {                         # Generados vivos a la vez por tipo
+    'FallingRock': 12,
+    'Lightning': 6,
+    'Bat': 8,
+    'SurveillanceDrone': 4,
+}
+
 # Puntuación
 POINTS_PLATFORM = 10
 POINTS_POWERUP = 50
@@ -234,12 +273,80 @@ STATE_PAUSED = 'paused'
 STATE_GAME_OVER = 'game_over'
 STATE_LEVEL_COMPLETE = 'level_complete'
 STATE_VICTORY = 'victory'
+STATE_LOADING = 'loading'
 STATE_HIGH_SCORES = 'high_scores'
 STATE_DIFFICULTY_SELECT = 'difficulty_select'
 
 # High scores
 HIGH_SCORES_FILE = 'highscores.json'
 MAX_HIGH_SCORES = 10
+SCORE_STORE_FILE = 'high_scores.json'   # Archivo del almacén único (score_store.py)
+SCORE_JOURNAL_COMPACT_EVERY = 16        # Registros del diario antes de compactar
+
+# Historial de partidas en SQLite (objects/run_history.py)
+RUN_HISTORY_ENABLED = True
+RUN_HISTORY_FILE = 'run_history.db'
+RUN_HISTORY_PAGE_SIZE = 10              # Filas por página en el menú
+
+# Telemetría por intento en columnas NumPy (objects/telemetry.py)
+TELEMETRY_ENABLED = True
+TELEMETRY_RATE = 20                     # Muestras por segundo
+TELEMETRY_CAPACITY = 20 * 60 * 10       # Muestras preasignadas (10 min a 20 Hz)
+TELEMETRY_DIR = 'telemetry'             # Un .npz por intento
+
+# Registro de eventos (objects/event_log.py)
+EVENT_LOG_LEVEL = 'INFO'                # DEBUG, INFO, WARNING, ERROR u OFF
+EVENT_LOG_CATEGORIES = {}               # Nivel por categoría, p. ej. {'Drone': 'DEBUG'}
+EVENT_LOG_FILE = None                   # None = stdout
+EVENT_LOG_CAPACITY = 4096               # Eventos en el buffer circular
+EVENT_LOG_FLUSH_INTERVAL = 0.25         # Segundos entre volcados
+
+# Recolector de basura y perfilador (objects/gc_policy.py, objects/profiler.py)
+GC_POLICY_ENABLED = True
+GC_PLAYING_GEN2_THRESHOLD = 1000        # Colecciones de gen 1 antes de una gen 2 en partida (normal: 10)
+PROFILER_WINDOW = 240                   # Frames recientes en el overlay (F3)
+PROFILER_GC_EVENTS = 32                 # Pausas del GC recientes guardadas
+
+# Detector de picos de frame (objects/watchdog.py)
+SPIKE_WATCHDOG_ENABLED = True
+SPIKE_THRESHOLD_MS = 1000 / FPS * 1.5   # Frame más lento que esto = pico
+SPIKE_LOG_FILE = 'spike_log.jsonl'
+SPIKE_SAMPLE_INTERVAL = 0.002           # Segundos entre muestras de pila
+SPIKE_MAX_SAMPLES = 50                  # Muestras por frame como máximo
+SPIKE_STACK_DEPTH = 25                  # Marcos por muestra
+
+# Capturas de cProfile / tracemalloc (main.py --profile / --tracemalloc)
+CAPTURE_DIR = 'captures'
+CAPTURE_TRACEMALLOC_FRAMES = 10         # Marcos por traza de tracemalloc
+CAPTURE_REPORT_TOP = 25                 # Filas de cada informe
+
+# Contabilidad de memoria y benchmark (objects/memory_ledger.py, objects/benchmark.py)
+MEMORY_LEDGER_ENABLED = True
+MEMORY_LEDGER_REFRESH = 1.0             # Segundos entre recuentos en el overlay (F3)
+MEMORY_LEDGER_ORDER = ('assets', 'rotation', 'audio', 'tiles', 'powerups', 'drones',
+                       'lava', 'parallax', 'entities')   # Quién se queda lo compartido
+MEMORY_BUDGET_MB = 512                  # Memoria del kiosco
+BENCHMARK_FRAMES = 600                  # Frames por nivel (main.py --benchmark)
+BENCHMARK_FILE = 'benchmark.json'
+BENCHMARK_LAVA_MARGIN = 300             # La lava no se acerca más que esto al jugador
+
+# Calidad adaptativa (objects/quality.py); el primer nivel es el de más calidad
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_WINDOW = 60                     # Frames de la media móvil
+QUALITY_DOWNGRADE_RATIO = 0.9           # Bajar si la media pasa del 90 % del presupuesto
+QUALITY_UPGRADE_RATIO = 0.5             # Subir si se queda por debajo del 50 %...
+QUALITY_UPGRADE_WINDOWS = 3             # ...durante estas ventanas seguidas
+QUALITY_TIERS = (
+    {'name': 'alta', 'particles': 1.0, 'sparkles': 1.0, 'trail_length': 5, 'glow': True,
+     'scan_cones': True, 'parallax_stride': 1, 'rotation_step': 3},
+    {'name': 'media', 'particles': 0.6, 'sparkles': 0.5, 'trail_length': 3, 'glow': True,
+     'scan_cones': True, 'parallax_stride': 1, 'rotation_step': 6},
+    {'name': 'baja', 'particles': 0.35, 'sparkles': 0.25, 'trail_length': 1, 'glow': False,
+     'scan_cones': False, 'parallax_stride': 2, 'rotation_step': 12},
+    {'name': 'mínima', 'particles': 0.15, 'sparkles': 0.0, 'trail_length': 0, 'glow': False,
+     'scan_cones': False, 'parallax_stride': 4, 'rotation_step': 20},
+)
+LAVA_PARTICLE_CAP = 150                 # Partículas de lava con calidad alta (se escala)
 
 # Audio
 ENABLE_SOUND = True
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+event_log.py - Registro de eventos con niveles, categorías y buffer circular
+
+Sustituye a los print() de las rutas que se ejecutan durante la partida
+(spawns, muertes, power-ups, generación de niveles...). Cada llamada solo
+añade una tupla a un buffer circular en memoria; el texto se formatea y se
+escribe (a stdout o a EVENT_LOG_FILE) desde un hilo aparte cada
+EVENT_LOG_FLUSH_INTERVAL segundos, así que el diagnóstico puede ir
+activado sin tirones en el frame.
+
+    event_log.info('Game', "Vida perdida - vidas restantes: %d", lives)
+
+Los argumentos se formatean con % en el hilo de escritura, no al llamar.
+Un mensaje por debajo del nivel de su categoría (EVENT_LOG_LEVEL, o el de
+EVENT_LOG_CATEGORIES) se descarta con una sola comparación. Si el buffer
+se llena antes de vaciarse se pierden los más antiguos (se cuentan en
+dropped).
+"""
+
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+from objects.constants import (EVENT_LOG_LEVEL, EVENT_LOG_CATEGORIES, EVENT_LOG_FILE,
+                               EVENT_LOG_CAPACITY, EVENT_LOG_FLUSH_INTERVAL)
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVELS = {'DEBUG': DEBUG, 'INFO': INFO, 'WARNING': WARNING, 'ERROR': ERROR, 'OFF': OFF}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+
+def _as_level(level):
+    """Acepta el número o el nombre ('debug', 'INFO'...)"""
+    return LEVELS[level.upper()] if isinstance(level, str) else int(level)
+
+
+class EventLog:
+    """Buffer circular de eventos con un hilo que lo vuelca"""
+
+    def __init__(self, level=EVENT_LOG_LEVEL, categories=EVENT_LOG_CATEGORIES, path=EVENT_LOG_FILE,
+                 capacity=EVENT_LOG_CAPACITY, flush_interval=EVENT_LOG_FLUSH_INTERVAL):
+        self.default_level = _as_level(level)
+        self.levels = {category: _as_level(value) for category, value in categories.items()}
+        self.path = path
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self._drain_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._writer = None
+        self._stream = None
+
+    # ============================================
+    # ⚙️ CONFIGURACIÓN
+    # ============================================
+
+    def set_level(self, level, category=None):
+        """Nivel mínimo global o de una categoría ('OFF' la desactiva)"""
+        if category is None:
+            self.default_level = _as_level(level)
+        else:
+            self.levels[category] = _as_level(level)
+
+    def enabled(self, category, level=DEBUG):
+        """True si se guardaría un mensaje de ese nivel (para evitar cálculos caros)"""
+        return level >= self.levels.get(category, self.default_level)
+
+    # ============================================
+    # 📝 REGISTRO (hilo principal)
+    # ============================================
+
+    def log(self, level, category, message, *args):
+        if level >= self.levels.get(category, self.default_level):
+            self._append(level, category, message, args)
+
+    # Atajos con la comprobación en línea: un mensaje descartado no paga
+    # más que esta comparación
+
+    def debug(self, category, message, *args):
+        if DEBUG >= self.levels.get(category, self.default_level):
+            self._append(DEBUG, category, message, args)
+
+    def info(self, category, message, *args):
+        if INFO >= self.levels.get(category, self.default_level):
+            self._append(INFO, category, message, args)
+
+    def warning(self, category, message, *args):
+        if WARNING >= self.levels.get(category, self.default_level):
+            self._append(WARNING, category, message, args)
+
+    def error(self, category, message, *args):
+        if ERROR >= self.levels.get(category, self.default_level):
+            self._append(ERROR, category, message, args)
+
+    def _append(self, level, category, message, args):
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append((time.time(), level, category, message, args))
+        if self._writer is None:
+            self._start()
+
+    def recent(self, limit=20):
+        """Últimos eventos aún en el buffer, ya formateados"""
+        return [self._format(record) for record in list(self.buffer)[-limit:]]
+
+    # ============================================
+    # 🧵 VOLCADO (hilo de escritura)
+    # ============================================
+
+    def _start(self):
+        self._writer = threading.Thread(target=self._write_loop, name="event-log", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def _write_loop(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Vuelca lo pendiente; válido desde cualquier hilo"""
+        with self._drain_lock:
+            lines = []
+            buffer = self.buffer
+            while buffer:
+                try:
+                    lines.append(self._format(buffer.popleft()))
+                except IndexError:
+                    break
+            if not lines:
+                return
+            try:
+                stream = self._open_stream()
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except Exception as e:
+                sys.__stderr__.write(f"[EventLog] Error escribiendo registro: {e}\n")
+
+    def _open_stream(self):
+        if self.path is None:
+            return sys.stdout
+        if self._stream is None:
+            self._stream = open(self.path, "a", encoding="utf-8")
+        return self._stream
+
+    @staticmethod
+    def _format(record):
+        timestamp, level, category, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+        prefix = "" if level == INFO else f"{LEVEL_NAMES.get(level, level)} "
+        return f"{clock}.{int(timestamp % 1 * 1000):03d} {prefix}[{category}] {message}"
+
+
+# Registro compartido por todo el juego
+event_log = EventLog()
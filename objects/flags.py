@@ -47,13 +47,18 @@ class VictoryFlag:
                 self.create_sparkle()
         
         # Actualizar partículas
-        for p in self.particles[:]:
+        particles = self.particles
+        kept = 0
+        for p in particles:
             p['x'] += p['vx'] * dt * 60
             p['y'] += p['vy'] * dt * 60
             p['life'] -= dt
             
             if p['life'] <= 0:
-                self.particles.remove(p)
+                continue
+            particles[kept] = p
+            kept += 1
+        del particles[kept:]
         
         # Temporizador de brillo
         self.sparkle_timer += dt
@@ -6,19 +6,32 @@ import pygame
 import random
 import math
 import time
-import json
 import os
-from datetime import datetime
+import gc
 from objects.constants import *
 from Models.player import Player
-from Levels.level import Level
+from Levels.level import Level, level_config_for
+from Levels.layout import load_level_pack
+from Levels.endless import EndlessLevel
 from objects.powerup import PowerUp, CollectionEffect
 from objects.utils import lerp, draw_text
-from objects.audio import init_audio, play_sound, toggle_mute, is_muted
+from objects.audio import ensure_audio, play_sound, update_audio, toggle_mute, is_muted
 from Models.lava import Lava
+from objects.assets import PRELOAD_MANIFEST
+from objects.loader import AssetLoader, draw_loading_screen
+from objects.score_store import score_store
+from objects.run_history import run_history
+from objects.telemetry import telemetry
+from objects.event_log import event_log
+from objects.profiler import profiler
+from objects.gc_policy import gc_policy
+from objects.watchdog import watchdog
+from objects.capture import capture
+from objects.memory_ledger import memory_ledger
+from objects.quality import quality
 
 class Game:
-    def __init__(self, difficulty="normal", screen=None):
+    def __init__(self, difficulty="normal", screen=None, mode=GAME_MODE_LEVELS):
         # Pantalla - usar la pantalla existente o crear una nueva
         if screen is None:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -27,13 +40,17 @@ class Game:
         self.clock = pygame.time.Clock()
         self.running = True
         self.return_to_menu = False  # Nueva bandera para volver al menú
+        gc_policy.install()
         
         # Dificultad
         self.difficulty = difficulty
         self.settings = DIFFICULTY_SETTINGS[difficulty]
         
-        # Inicializar audio
-        init_audio()
+        # Modo de juego: niveles 1-3 o ascenso infinito
+        self.mode = mode
+        
+        # Inicializar audio (reutiliza el del menú si ya existe)
+        ensure_audio()
         
         # Estado del juego
         self.state = STATE_PLAYING
@@ -75,61 +92,87 @@ class Game:
         self.drone_spawn_interval = 8.0  # Segundos entre spawns
         self.last_drone_spawn_height = 0
         
+        # Carga en segundo plano de assets que falten al cambiar de nivel
+        self.loader = None
+        self.pending_level = None
+        self.pending_restart = False
+        
+        # Layouts de los niveles ya generados: reiniciar no vuelve a generar
+        self.layouts = {}
+        
+        # Siguiente nivel pre-generado en segundo plano: (número, future)
+        self.next_level = None
+        
         # Comenzar juego
         self.start_level(1)
     
     def load_high_scores(self):
-        """Cargar puntuaciones altas desde archivo"""
-        try:
-            if os.path.exists("high_scores.json"):
-                with open("high_scores.json", "r") as f:
-                    return json.load(f)
-        except:
-            pass
-        return {
-            "easy": [],
-            "normal": [],
-            "hard": []
-        }
+        """Puntuaciones altas (del almacén compartido; sin leer el disco)"""
+        return score_store.as_dict()
     
     def get_current_high_score(self):
         """Obtener el récord actual de la dificultad seleccionada"""
-        scores = self.high_scores.get(self.difficulty, [])
-        if scores:
-            return max(score["score"] for score in scores)
-        return 0
+        return score_store.best(self.difficulty)
     
     def is_high_score(self, score):
         """Verificar si la puntuación es un nuevo récord"""
-        scores = self.high_scores.get(self.difficulty, [])
-        if len(scores) < 10:
-            return True
-        return score > min(score["score"] for score in scores)
+        return score_store.qualifies(self.difficulty, score)
     
     def save_high_score(self, name, score):
         """Guardar nueva puntuación alta"""
-        try:
-            self.high_scores[self.difficulty].append({
-                "name": name[:3].upper(),
-                "score": score,
-                "date": datetime.now().strftime("%Y-%m-%d")
-            })
-            # Ordenar y mantener solo top 10
-            self.high_scores[self.difficulty].sort(key=lambda x: x["score"], reverse=True)
-            self.high_scores[self.difficulty] = self.high_scores[self.difficulty][:10]
-            
-            with open("high_scores.json", "w") as f:
-                json.dump(self.high_scores, f, indent=2)
-            
-            # Actualizar récord actual
-            self.current_high_score = self.get_current_high_score()
-            return True
-        except Exception as e:
-            print(f"[HighScore] Error al guardar: {e}")
+        if score_store.add(self.difficulty, name[:3].upper(), score) is None:
             return False
+        self.high_scores = self.load_high_scores()
+        # Actualizar récord actual
+        self.current_high_score = self.get_current_high_score()
+        return True
     
-    def start_level(self, level_number):
+    def record_run(self, outcome):
+        """Guarda el intento actual en el historial (una sola vez por intento)"""
+        if not self.player or getattr(self, 'run_recorded', True):
+            return
+        self.run_recorded = True
+        run_history.record_run(
+            self.difficulty, self.current_level_number, outcome,
+            self.player.score, self.elapsed_time,
+            deaths=self.run_start_lives - self.player.lives,
+            max_height=max(0, self.run_start_y - self.player.stats['max_height']),
+            stats=self.player.stats, mode=self.mode)
+        telemetry.flush(outcome)
+        if capture.enabled:
+            # Guardar la captura del nivel cuesta un tirón esperado
+            capture.level_ended(outcome)
+            watchdog.expect_hitch()
+    
+    def start_level(self, level_number, restart=False):
+        """
+        Inicia un nivel; si faltan assets, pasa antes por la pantalla de carga.
+        
+        Args:
+            level_number: Número del nivel
+            restart: True para repetir el mismo layout en lugar de generar uno nuevo
+        """
         self.current_level_number = level_number
+        self.pending_restart = restart
+        
+        # Normalmente el menú ya precargó todo y no se encola nada
+        if self.loader is None:
+            self.loader = AssetLoader()
+        if self.loader.submit_manifest(PRELOAD_MANIFEST) or not self.loader.done:
+            self.loader.reset_progress()
+            self.pending_level = level_number
+            self.state = STATE_LOADING
+            return
+        
+        self._build_level(level_number, restart)
+    
+    def _build_level(self, level_number, restart=False):
+        """Construye el nivel y el jugador (los assets ya están en caché)"""
+        self.pending_level = None
+        
+        # Los enemigos del nivel anterior vuelven a sus pools
+        if self.level:
+            self.level.release_enemies()
         
         # Resetear sistema de drones
         self.drone_spawn_timer = 0
@@ -142,21 +185,28 @@ class Game:
             "hard": 5.0
         }.get(self.difficulty, 8.0)
         
-        # Ajustar configuración según dificultad
-        level_config = LEVELS_CONFIG[level_number].copy()
-        
-        for enemy_type in ['bats', 'traps', 'rocks', 'lightning']:
-            if enemy_type in level_config:
-                level_config[enemy_type] = int(
-                    level_config[enemy_type] * self.settings["enemy_rate"]
-                )
-        
-        if 'powerups' in level_config:
-            level_config['powerups'] = int(
-                level_config['powerups'] * self.settings["powerup_rate"]
-            )
-        
-        self.level = Level(level_number, level_config, difficulty=self.difficulty)
+        if self.mode == GAME_MODE_ENDLESS:
+            # El nivel infinito ajusta cada zona por dificultad al generarla
+            self.level = EndlessLevel(self.difficulty)
+        else:
+            # Ruta rápida: layout del pack curado o del último intento
+            layout = self.layouts.get(level_number) if restart else None
+            if layout is None:
+                layout = load_level_pack(level_number, self.difficulty)
+            
+            if layout is not None:
+                self.level = Level.from_layout(layout)
+            else:
+                # Pre-generado durante el nivel anterior: solo falta crear superficies
+                self.level = self._take_pregenerated_level(level_number)
+                if self.level is None:
+                    # Generar (configuración ajustada según dificultad)
+                    level_config = level_config_for(level_number, self.difficulty)
+                    self.level = Level(level_number, level_config, difficulty=self.difficulty)
+            self.layouts[level_number] = self.level.to_layout()
+            
+            # Mientras se juega este nivel, generar los datos del siguiente
+            self._pregenerate_level(level_number + 1)
         self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150, self.settings)
         
         # Inicializar lava
@@ -170,9 +220,53 @@ class Game:
         # Iniciar temporizador
         self.start_time = time.time()
         
+        # Datos del intento para el historial de partidas
+        self.run_start_lives = self.player.lives
+        self.run_start_y = self.player.y
+        self.run_recorded = False
+        telemetry.begin(self.current_level_number, self.difficulty, self.mode)
+        
+        # Recoger lo del nivel anterior y congelar lo recién cargado
+        gc_policy.after_load()
+        watchdog.expect_hitch()
+        quality.expect_hitch()
+        capture.level_started(self.current_level_number, self.difficulty, self.mode)
+        
         # Cambiar estado
         self.state = STATE_PLAYING
     
+    def _pregenerate_level(self, level_number):
+        """Lanza la fase de datos del nivel indicado en el pool del loader"""
+        if level_number not in LEVELS_CONFIG:
+            return
+        if self.next_level and self.next_level[0] == level_number:
+            return
+        if load_level_pack(level_number, self.difficulty) is not None:
+            return
+        
+        level_config = level_config_for(level_number, self.difficulty)
+        future = self.loader.run_in_background(Level, level_number, level_config,
+                                               difficulty=self.difficulty, materialize=False)
+        self.next_level = (level_number, future)
+    
+    def _take_pregenerated_level(self, level_number):
+        """
+        Recoge el nivel pre-generado (si es el pedido) y crea sus objetos
+        en el hilo principal. Devuelve None si no hay uno disponible.
+        """
+        if not self.next_level or self.next_level[0] != level_number:
+            return None
+        
+        _, future = self.next_level
+        self.next_level = None
+        try:
+            # Normalmente ya terminó hace rato; si no, se espera lo que falte
+            level = future.result()
+        except Exception as e:
+            event_log.error('Game', "Error pre-generando nivel %s: %s", level_number, e)
+            return None
+        return level.materialize()
+    
     def update_camera(self):
         if not self.player:
             return
@@ -185,8 +279,8 @@ class Game:
         if not self.level or not self.player:
             return
         
-        # Solo spawnear en niveles 2 y 3
-        if self.current_level_number < 2:
+        # Solo spawnear en niveles 2 y 3 (o zonas equivalentes del modo infinito)
+        if self.level.number < 2:
             return
         
         try:
@@ -213,7 +307,7 @@ class Game:
             patrol_range = 150
             detection_range = 200
             
-            if self.current_level_number == 3:
+            if self.level.number == 3:
                 detection_range = 300
             
             # Ajustar según dificultad
@@ -223,17 +317,19 @@ class Game:
             elif self.difficulty == "easy":
                 detection_range -= 50
             
-            drone = SurveillanceDrone(x, y, patrol_range=patrol_range, detection_range=detection_range)
+            drone = self.level.spawn_enemy(SurveillanceDrone, x, y, patrol_range=patrol_range,
+                                           detection_range=detection_range)
+            if drone is None:
+                return
             
             # Mejorar según nivel
-            if self.current_level_number == 3:
+            if self.level.number == 3:
                 drone.speed = 2.5
             
-            self.level.enemies.append(drone)
-            print(f"[Drone Spawn] Nuevo drone en ({x}, {y}) - Difficulty: {self.difficulty}")
+            event_log.debug('Drone', "Nuevo drone en (%s, %s) - dificultad: %s", x, y, self.difficulty)
             
         except Exception as e:
-            print(f"[Drone Spawn] Error: {e}")
+            event_log.error('Drone', "Error generando drone: %s", e)
     
     def check_collisions(self):
         if not self.player or not self.level:
@@ -282,7 +378,7 @@ class Game:
         
         # Verificar colisión con bandera
         if self.level.check_flag_collision(self.player.get_rect()):
-            print(f"[Game] ¡NIVEL {self.current_level_number} COMPLETADO!")
+            event_log.info('Game', "¡NIVEL %s COMPLETADO!", self.current_level_number)
             
             # Calcular puntos - VERSIÓN SIMPLIFICADA
             time_taken = self.elapsed_time
@@ -305,10 +401,12 @@ class Game:
             old_score = self.player.score
             self.player.score += total_points
             
-            print(f"[Game] Puntos añadidos: {total_points} (Score: {old_score} -> {self.player.score})")
+            event_log.info('Game', "Puntos añadidos: %d (Score: %d -> %d)", total_points, old_score,
+                           self.player.score)
             
             # Cambiar estado
             self.state = STATE_LEVEL_COMPLETE
+            self.record_run('complete')
             self.level_complete_data = {
                 'points': total_points,
                 'time': time_taken,
@@ -321,7 +419,7 @@ class Game:
             try:
                 play_sound('level_complete')
             except:
-                print("[Audio] No se pudo reproducir sonido de victoria")
+                event_log.warning('Audio', "No se pudo reproducir sonido de victoria")
             
             self.screen_shake_magnitude = 12
             self.screen_shake_duration = 2.0
@@ -382,6 +480,13 @@ class Game:
 
     def update(self, dt):
         self.game_time += dt
+        gc_policy.set_state(self.state)
+        update_audio(dt)
+        
+        if self.state == STATE_LOADING:
+            if self.loader.poll():
+                self._build_level(self.pending_level, self.pending_restart)
+            return
         
         if self.state == STATE_PLAYING:
             self.elapsed_time = time.time() - self.start_time
@@ -389,9 +494,9 @@ class Game:
             if self.player and self.player.alive:
                 keys = pygame.key.get_pressed()
                 self.player.handle_input(keys)
-                self.player.update(dt, self.level.platforms)
+                self.player.update(dt, self.level.get_all_platforms_for_player(self.player.get_rect()))
             
-            self.level.update(dt, self.player.y if self.player else 0)
+            self.level.update(dt, self.player.y if self.player else 0, lava_y=self.lava.y)
             
             # Actualizar lava
             if self.player and self.player.alive:
@@ -403,12 +508,12 @@ class Game:
                 )
                 
                 if player_died:
-                    print("[Game] Jugador tocó la lava")
+                    event_log.info('Lava', "Jugador tocó la lava")
                     
                     # Desactivar escudo si lo tiene para asegurar que pierda vida
                     if self.player.shield_active:
                         self.player.shield_active = False
-                        print("[Player] Escudo desactivado por lava")
+                        event_log.debug('Player', "Escudo desactivado por lava")
                     
                     # Aplicar daño letal para activar el sistema de vidas
                     vidas_antes = self.player.lives
@@ -416,15 +521,22 @@ class Game:
                     
                     if lost_life and self.player.lives > 0:
                         # Si perdió una vida pero le quedan vidas, reiniciar lava
-                        print(f"[Game] Vida perdida por lava - Vidas restantes: {self.player.lives}")
-                        print("[Game] Reiniciando lava para nueva vida")
+                        event_log.info('Lava', "Vida perdida por lava - vidas restantes: %d; reiniciando lava",
+                                       self.player.lives)
                         self.lava.reset(self.player.y)
                         self.player_death("lava")  # Animación de muerte
                     else:
                         # Si no tiene vidas, muerte definitiva
-                        print("[Game] Sin vidas - muerte definitiva por lava")
+                        event_log.info('Lava', "Sin vidas - muerte definitiva por lava")
                         self.player_death("lava")
             
+            # Modo infinito: generar por arriba y liberar bajo la lava
+            if self.mode == GAME_MODE_ENDLESS and self.player:
+                self.level.stream(self.player.y, self.lava.y)
+            
+            # Muestra de telemetría (solo escribe a TELEMETRY_RATE por segundo)
+            telemetry.sample(dt, self.player, self.lava, self.level)
+            
             self.update_camera()
             self.check_collisions()
             self.check_level_complete()
@@ -437,8 +549,9 @@ class Game:
             
             # Verificar si el jugador murió completamente (sin vidas)
             if self.player and not self.player.alive and self.player.lives <= 0:
-                print("[Game] Cambiando a STATE_GAME_OVER - jugador sin vidas")
+                event_log.info('Game', "Cambiando a STATE_GAME_OVER - jugador sin vidas")
                 self.state = STATE_GAME_OVER
+                self.record_run('game_over')
             
             if self.screen_shake_duration > 0:
                 self.screen_shake_duration -= dt
@@ -493,14 +606,19 @@ class Game:
         
         self.death_timer -= dt
         
-        for p in self.death_animation['particles'][:]:
+        particles = self.death_animation['particles']
+        kept = 0
+        for p in particles:
             p['x'] += p['vx']
             p['y'] += p['vy']
             p['vy'] += 0.5
             p['life'] -= dt
             
             if p['life'] <= 0:
-                self.death_animation['particles'].remove(p)
+                continue
+            particles[kept] = p
+            kept += 1
+        del particles[kept:]
         
         # Solo limpiar la animación cuando termine, NO reiniciar nivel automáticamente
         if self.death_timer <= 0 or not self.death_animation['particles']:
@@ -513,7 +631,11 @@ class Game:
             shake_x = random.randint(-self.screen_shake_magnitude, self.screen_shake_magnitude)
             shake_y = random.randint(-self.screen_shake_magnitude, self.screen_shake_magnitude)
         
-        if self.state == STATE_PLAYING:
+        if self.state == STATE_LOADING:
+            draw_loading_screen(self.screen, self.loader.progress, self.font_title,
+                                self.font_small, self.loader.label)
+        
+        elif self.state == STATE_PLAYING:
             self.level.draw_background(self.screen, self.camera_y)
             
             temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -566,6 +688,52 @@ class Game:
         
         elif self.state == STATE_VICTORY:
             self.draw_victory()
+        
+        if profiler.visible:
+            self.draw_profiler_overlay()
+    
+    def spike_snapshot(self):
+        """Estado y recuento de entidades y partículas para el log de picos"""
+        snapshot = {
+            'state': self.state,
+            'level': self.current_level_number,
+            'difficulty': self.difficulty,
+            'mode': self.mode,
+            'lava_particles': len(self.lava.particles),
+            'lava_smoke': len(self.lava.smoke_particles),
+            'lava_bubbles': len(self.lava.bubbles),
+            'death_particles': len(self.death_animation['particles'])
+                               if getattr(self, 'death_animation', None) else 0,
+        }
+        if self.level:
+            enemies = {}
+            particles = 0
+            for enemy in self.level.enemies:
+                name = type(enemy).__name__
+                enemies[name] = enemies.get(name, 0) + 1
+                particles += len(getattr(enemy, 'particles', ()))
+            for powerup in self.level.powerups:
+                particles += len(getattr(powerup, 'sparkle_particles', ()))
+            snapshot.update({
+                'enemies': enemies,
+                'batched_enemies': len(self.level.enemy_batches),
+                'powerups': len(self.level.powerups),
+                'effects': len(self.level.effects),
+                'platforms': len(self.level.platforms) + len(self.level.tile_platforms),
+                'entity_particles': particles,
+            })
+        return snapshot
+    
+    def draw_profiler_overlay(self):
+        """Overlay de rendimiento (F3)"""
+        enemies = len(self.level.enemies) if self.level else 0
+        counts = gc.get_count()
+        profiler.draw(self.screen, self.font_small, (
+            f"enemigos {enemies}  gc pendientes {counts[0]}/{counts[1]}/{counts[2]}",
+            f"congelados {gc.get_freeze_count()}  gen2 aplazada: {'sí' if gc_policy.holding else 'no'}",
+            quality.overlay_line(),
+            *memory_ledger.overlay_lines(),
+        ))
     
     def draw_level_info_hud(self):
         """Dibuja la información del nivel, tiempo y dificultad en la parte superior central"""
@@ -577,6 +745,9 @@ class Game:
         # Obtener nombre del nivel
         level_names = {1: "Bosque Místico", 2: "Caverna Oscura", 3: "Tormenta Eléctrica"}
         level_name = level_names.get(self.current_level_number, f"Nivel {self.current_level_number}")
+        if self.mode == GAME_MODE_ENDLESS and self.player:
+            climbed = int(self.level.climbed_height(self.player.y) / 10)
+            level_name = f"Ascenso infinito - {climbed} m"
         
         # Configuración
         panel_width = 500
@@ -818,27 +989,31 @@ class Game:
                 if event.key == pygame.K_F1:
                     pygame.display.toggle_fullscreen()
                 
+                # F3: overlay de rendimiento
+                if event.key == pygame.K_F3:
+                    profiler.toggle()
+                
                 # M para silenciar/activar audio (funciona en cualquier estado)
                 if event.key == pygame.K_m:
                     muted = toggle_mute()
-                    print(f"[AUDIO] {'Silenciado' if muted else 'Activado'}")
+                    event_log.info('Audio', "Silenciado" if muted else "Activado")
                 
                 if self.state == STATE_PLAYING:
                     if event.key == pygame.K_ESCAPE:
                         self.state = STATE_PAUSED
                         self.lava.pause()
                     elif event.key == pygame.K_r:
-                        self.start_level(self.current_level_number)
+                        self.start_level(self.current_level_number, restart=True)
                 
                 elif self.state == STATE_PAUSED:
                     if event.key == pygame.K_ESCAPE:
                         self.state = STATE_PLAYING
                         self.lava.resume()
                     elif event.key == pygame.K_r:
-                        self.start_level(self.current_level_number)
+                        self.start_level(self.current_level_number, restart=True)
                     elif event.key == pygame.K_q:
                         # Volver al menú principal
-                        print("[DEBUG] Q presionada en PAUSED - volviendo al menú")
+                        event_log.debug('Game', "Q presionada en PAUSED - volviendo al menú")
                         self.return_to_menu = True
                         self.running = False
                 
@@ -847,7 +1022,7 @@ class Game:
                         self.reset_game()  # Reiniciar completamente el juego
                     elif event.key == pygame.K_q:
                         # Volver al menú principal
-                        print("[DEBUG] Q presionada en GAME_OVER - volviendo al menú")
+                        event_log.debug('Game', "Q presionada en GAME_OVER - volviendo al menú")
                         self.return_to_menu = True
                         self.running = False
                 
@@ -866,7 +1041,7 @@ class Game:
                             name = self.player_name if len(self.player_name) == 3 else self.player_name + "___"[:3-len(self.player_name)]
                             if self.player:
                                 self.save_high_score(name, self.player.score)
-                                print(f"[HighScore] Guardado: {name} - {self.player.score}")
+                                event_log.info('HighScore', "Guardado: %s - %d", name, self.player.score)
                             self.entering_name = False
                             self.player_name = ""
                         elif event.key == pygame.K_BACKSPACE:
@@ -878,7 +1053,7 @@ class Game:
                             self.reset_game()
                         elif event.key == pygame.K_q:
                             # Volver al menú principal
-                            print("[DEBUG] Q presionada en VICTORY - volviendo al menú")
+                            event_log.debug('Game', "Q presionada en VICTORY - volviendo al menú")
                             self.return_to_menu = True
                             self.running = False
     
@@ -900,20 +1075,37 @@ class Game:
         # Reiniciar lava
         self.lava = Lava(self.difficulty)
         
-        # Comenzar nivel 1
-        self.start_level(1)
+        # Comenzar nivel 1 (mismo layout que el intento anterior)
+        self.start_level(1, restart=True)
     
     def run(self):
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
+            profiler.begin_frame()
+            watchdog.begin_frame()
             
             self.handle_events()
+            profiler.mark('events')
             
             # Si running se volvió False, salir del loop
             if not self.running:
                 break
                 
             self.update(dt)
+            profiler.mark('update')
             self.draw()
+            profiler.mark('draw')
             
-            pygame.display.flip()
\ No newline at end of file
+            pygame.display.flip()
+            profiler.mark('flip')
+            frame_ms = profiler.end_frame()
+            if self.state == STATE_PLAYING:
+                # Calidad adaptativa: solo cuentan los frames de partida
+                quality.observe(frame_ms)
+            watchdog.end_frame(frame_ms, self.spike_snapshot)
+        
+        # De vuelta al menú: umbrales normales del GC y captura sin terminar
+        gc_policy.set_state(None)
+        capture.level_ended("quit")
+        if self.loader is not None:
+            self.loader.shutdown()
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+gc_policy.py - Control de las pausas del recolector de basura
+
+El bucle de juego genera mucha basura de vida corta (partículas, Rects,
+superficies temporales) y las colecciones completas (generación 2)
+recorren todos los objetos vivos: son las que coinciden con los peores
+picos de frame. La política:
+
+  - tras cargar un nivel: colección completa y gc.freeze(), para que
+    sprites, tiles y niveles ya cargados no vuelvan a recorrerse;
+  - durante STATE_PLAYING: umbral de generación 2 muy alto
+    (GC_PLAYING_GEN2_THRESHOLD), las generaciones jóvenes siguen igual;
+  - al salir de STATE_PLAYING (pausa, fin de nivel, game over, carga):
+    umbrales normales y la colección completa aplazada.
+
+Cada pausa del GC se mide con gc.callbacks y se envía al perfilador.
+"""
+
+import gc
+import time
+from objects.constants import STATE_PLAYING, GC_POLICY_ENABLED, GC_PLAYING_GEN2_THRESHOLD
+from objects.profiler import profiler
+
+
+class GCPolicy:
+    """Aplaza la generación 2 durante la partida y mide todas las pausas"""
+
+    def __init__(self, enabled=GC_POLICY_ENABLED, playing_gen2_threshold=GC_PLAYING_GEN2_THRESHOLD,
+                 frame_profiler=profiler):
+        self.enabled = enabled
+        self.playing_gen2_threshold = playing_gen2_threshold
+        self.profiler = frame_profiler
+        self.default_threshold = gc.get_threshold()
+        self.holding = False
+        self.state = None
+        self._gc_start = None
+
+    def install(self):
+        """Registra el callback que mide las pausas (una sola vez)"""
+        if self._on_gc not in gc.callbacks:
+            gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            ms = (time.perf_counter() - self._gc_start) * 1000
+            self._gc_start = None
+            self.profiler.record_gc(info["generation"], ms, info.get("collected", 0))
+
+    # ============================================
+    # 🔄 TRANSICIONES
+    # ============================================
+
+    def after_load(self):
+        """Tras construir un nivel: recoge lo del anterior y congela lo cargado"""
+        if not self.enabled:
+            return
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+
+    def set_state(self, state):
+        """Se llama cada frame; solo actúa cuando cambia el estado"""
+        if state == self.state:
+            return
+        self.state = state
+        if state == STATE_PLAYING:
+            self.hold()
+        else:
+            self.release()
+
+    def hold(self):
+        """Sube el umbral de la generación 2 (las jóvenes no cambian)"""
+        if not self.enabled or self.holding:
+            return
+        gen0, gen1, _ = self.default_threshold
+        gc.set_threshold(gen0, gen1, self.playing_gen2_threshold)
+        self.holding = True
+
+    def release(self):
+        """Umbrales normales y colección completa aplazada"""
+        if not self.holding:
+            return
+        gc.set_threshold(*self.default_threshold)
+        self.holding = False
+        gc.collect()
+
+
+# Política compartida por el bucle de juego
+gc_policy = GCPolicy()
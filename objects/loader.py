@@ -0,0 +1,228 @@
+"""
+loader.py - Carga asíncrona de assets con pantalla de progreso
+
+La lectura de archivos y la decodificación de PNG (y cualquier tarea pesada
+como la síntesis de audio) se ejecutan en un pool de hilos. El hilo
+principal sigue dibujando y, en cada frame, hace el convert()/convert_alpha()
+final de lo que ya terminó, con un presupuesto de tiempo acotado.
+"""
+
+import time
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from objects.constants import *
+from objects.assets import asset_cache
+from objects.event_log import event_log
+
+# Tiempo máximo por frame dedicado a finalizar cargas en el hilo principal
+LOADER_FRAME_BUDGET = 0.008
+
+
+def _decode_image(real_path):
+    """Lee y decodifica un PNG (sin convert: eso requiere el hilo principal)"""
+    return pygame.image.load(real_path)
+
+
+class AssetLoader:
+    """
+    Pipeline de carga: trabajos en segundo plano + finalización en el hilo principal.
+    """
+
+    def __init__(self, max_workers=4):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers,
+                                       thread_name_prefix="skyrunner-loader")
+        self.jobs = []        # [(future, on_done, etiqueta, id de la entrada o None)]
+        self.total = 0
+        self.completed = 0
+        self.label = ""
+        self.errors = []
+        self.in_flight = set()   # entradas del manifiesto ya encoladas
+
+    # ============================================
+    # 📥 ENCOLAR TRABAJOS
+    # ============================================
+
+    def submit_manifest(self, manifest):
+        """
+        Encola las entradas del manifiesto que aún no están en la caché.
+
+        Returns:
+            int: Número de entradas encoladas
+        """
+        queued = 0
+        for entry in manifest:
+            entry_id = id(entry)
+            if entry_id in self.in_flight or asset_cache.has_entry(entry):
+                continue
+            self.in_flight.add(entry_id)
+
+            real_path = asset_cache.resolve(entry['path'])
+            if asset_cache.bundle is not None or real_path is None:
+                # Del bundle (ya mapeado) o inexistente: se resuelve en el hilo principal
+                future = None
+            elif asset_cache.has_image(real_path):
+                future = None
+            else:
+                future = self.pool.submit(_decode_image, real_path)
+
+            self._add(future, self._finish_entry_callback(entry, real_path), entry['path'], entry_id)
+            queued += 1
+        return queued
+
+    def submit_task(self, label, function, *args, on_done=None):
+        """
+        Encola una tarea genérica (p. ej. sintetizar la música).
+
+        Args:
+            label: Texto que se muestra mientras se ejecuta
+            function: Función a ejecutar en el pool
+            on_done: Callback opcional en el hilo principal con el resultado
+        """
+        future = self.pool.submit(function, *args)
+        self._add(future, on_done, label)
+
+    def run_in_background(self, function, *args, **kwargs):
+        """
+        Ejecuta una tarea en el pool sin contarla en el progreso de carga
+        (p. ej. pre-generar el siguiente nivel mientras se juega).
+
+        Returns:
+            concurrent.futures.Future
+        """
+        return self.pool.submit(function, *args, **kwargs)
+
+    def _add(self, future, on_done, label, entry_id=None):
+        self.jobs.append((future, on_done, label, entry_id))
+        self.total += 1
+
+    def _finish_entry_callback(self, entry, real_path):
+        """Callback que convierte la imagen decodificada y crea la variante"""
+        def finish(raw_surface):
+            if raw_surface is not None:
+                asset_cache.adopt(real_path, raw_surface)
+            asset_cache.load_entry(entry)
+        return finish
+
+    # ============================================
+    # 🔄 AVANCE POR FRAME (hilo principal)
+    # ============================================
+
+    def poll(self, budget=LOADER_FRAME_BUDGET):
+        """
+        Finaliza trabajos terminados sin exceder el presupuesto de tiempo.
+
+        Returns:
+            bool: True si ya no quedan trabajos
+        """
+        deadline = time.perf_counter() + budget
+        pending = []
+
+        for index, job in enumerate(self.jobs):
+            if time.perf_counter() > deadline:
+                pending.extend(self.jobs[index:])
+                break
+            future, on_done, label, entry_id = job
+            if future is not None and not future.done():
+                pending.append(job)
+                continue
+
+            self.label = label
+            try:
+                result = future.result() if future is not None else None
+                if on_done:
+                    on_done(result)
+            except Exception as e:
+                self.errors.append((label, e))
+                event_log.error('Loader', "Error cargando %s: %s", label, e)
+            finally:
+                # También si falla: una entrada atascada no se volvería a encolar
+                self.in_flight.discard(entry_id)
+            self.completed += 1
+
+        self.jobs = pending
+        return not self.jobs
+
+    @property
+    def done(self):
+        return not self.jobs
+
+    @property
+    def progress(self):
+        """Progreso entre 0.0 y 1.0"""
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    def reset_progress(self):
+        """Reinicia el contador de progreso para una nueva tanda"""
+        self.total = len(self.jobs)
+        self.completed = 0
+
+    def shutdown(self):
+        """Cierra el pool de hilos"""
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ============================================
+# 🖥️ PANTALLA DE CARGA
+# ============================================
+
+def draw_loading_screen(surface, progress, font_title, font_small, label=""):
+    """
+    Dibuja la pantalla de carga con barra de progreso.
+
+    Args:
+        surface: Superficie destino
+        progress: Progreso (0.0 - 1.0)
+        font_title: Fuente del título
+        font_small: Fuente del texto de estado
+        label: Texto del elemento que se está cargando
+    """
+    surface.fill((15, 15, 30))
+
+    # Título con pulso suave
+    pulse = abs((pygame.time.get_ticks() % 1200) - 600) / 600
+    title_color = (int(150 + 105 * pulse), int(150 + 105 * pulse), 255)
+    title = font_title.render("CARGANDO...", True, title_color)
+    surface.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60)))
+
+    # Barra de progreso
+    bar_width = 500
+    bar_height = 24
+    bar_x = SCREEN_WIDTH // 2 - bar_width // 2
+    bar_y = SCREEN_HEIGHT // 2
+
+    pygame.draw.rect(surface, (40, 40, 60), (bar_x, bar_y, bar_width, bar_height), border_radius=6)
+    fill_width = int(bar_width * max(0.0, min(1.0, progress)))
+    if fill_width > 0:
+        pygame.draw.rect(surface, CYAN, (bar_x, bar_y, fill_width, bar_height), border_radius=6)
+    pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2, border_radius=6)
+
+    # Porcentaje y elemento actual
+    percent = font_small.render(f"{int(progress * 100)}%", True, WHITE)
+    surface.blit(percent, percent.get_rect(center=(SCREEN_WIDTH // 2, bar_y + bar_height + 20)))
+    if label:
+        status = font_small.render(str(label), True, LIGHT_GRAY)
+        surface.blit(status, status.get_rect(center=(SCREEN_WIDTH // 2, bar_y + bar_height + 45)))
+
+
+def run_loading_screen(screen, clock, loader, font_title, font_small):
+    """
+    Bucle de carga: dibuja el progreso hasta que el loader termina.
+
+    Returns:
+        bool: False si el usuario cerró la ventana durante la carga
+    """
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                loader.shutdown()
+                return False
+
+        finished = loader.poll()
+        draw_loading_screen(screen, loader.progress, font_title, font_small, loader.label)
+        pygame.display.flip()
+        clock.tick(FPS)
+
+        if finished:
+            return True
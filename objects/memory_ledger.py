@@ -0,0 +1,203 @@
+"""
+memory_ledger.py - Contabilidad de memoria por subsistema
+
+Cada subsistema registra qué atributos suyos ocupan memoria
+(memory_ledger.track) y el libro mayor los recorre al pedir un informe:
+  - superficies: ancho × alto × bytes por píxel;
+  - arrays de NumPy: nbytes;
+  - sonidos del mixer: duración × frecuencia × canales × bytes por muestra;
+  - buffers (bytes, p. ej. los WAV sintetizados de la música);
+  - registros (diccionarios de partículas o elementos de parallax) y
+    entidades (objetos de una lista: enemigos, power-ups, plataformas),
+    con sys.getsizeof.
+
+Una superficie compartida cuenta una sola vez, para el primer subsistema
+que la encuentra en el orden de MEMORY_LEDGER_ORDER: las cachés de
+assets.py van primero, así que los frames y sprites compartidos aparecen
+en 'assets' y en cada subsistema queda solo lo suyo (p. ej. el sprite
+propio de un dron).
+
+Los dueños se guardan con referencias débiles: un nivel o una lava que
+ya no se usa deja de contar sin tener que darlo de baja. El informe se
+muestra en el overlay de rendimiento (F3) y en el JSON del modo
+benchmark; sirve para decidir qué recortar para que quepa en
+MEMORY_BUDGET_MB.
+"""
+
+import sys
+import time
+import weakref
+import threading
+from collections import deque
+import pygame
+from objects.constants import (MEMORY_LEDGER_ENABLED, MEMORY_LEDGER_REFRESH, MEMORY_LEDGER_ORDER,
+                               MEMORY_BUDGET_MB)
+from objects.event_log import event_log
+
+try:
+    import numpy as np
+    _ARRAY_TYPES = (np.ndarray,)
+except ImportError:
+    _ARRAY_TYPES = ()
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MB = 1024 * 1024
+
+# Columnas del informe de cada subsistema
+_FIELDS = ('surfaces', 'surface_count', 'arrays', 'audio', 'buffers',
+           'records', 'record_count', 'entities', 'entity_count')
+
+
+def format_mb(size):
+    return f"{size / MB:.1f} MB"
+
+
+class MemoryLedger:
+    """Memoria de superficies, buffers y entidades agrupada por subsistema"""
+
+    def __init__(self, refresh=MEMORY_LEDGER_REFRESH, budget_mb=MEMORY_BUDGET_MB,
+                 enabled=MEMORY_LEDGER_ENABLED):
+        self.enabled = enabled
+        self.refresh = refresh
+        self.budget = budget_mb * MB
+        self._owners = {}           # subsistema -> WeakKeyDictionary(dueño -> atributos)
+        self._lock = threading.Lock()
+        self._report = None
+        self._report_time = 0.0
+
+    def track(self, subsystem, owner, *attrs):
+        """
+        Registra atributos de un objeto que ocupan memoria.
+
+        Args:
+            subsystem: Nombre del grupo en el informe ('tiles', 'audio'...)
+            owner: Objeto dueño (se guarda con una referencia débil)
+            attrs: Nombres de atributos; admiten rutas con puntos
+                   ('tilemap.layers')
+        """
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                owners = self._owners.setdefault(subsystem, weakref.WeakKeyDictionary())
+                owners[owner] = attrs
+        except TypeError as e:
+            event_log.debug('Memory', "No se puede registrar %s en %s: %s",
+                            type(owner).__name__, subsystem, e)
+
+    # ============================================
+    # 📊 INFORME
+    # ============================================
+
+    def report(self):
+        """Recorre todo lo registrado y devuelve el informe (dict serializable)"""
+        with self._lock:
+            groups = [(subsystem, list(owners.items())) for subsystem, owners in self._owners.items()]
+        order = {subsystem: index for index, subsystem in enumerate(MEMORY_LEDGER_ORDER)}
+        groups.sort(key=lambda group: order.get(group[0], len(order)))
+
+        seen = set()
+        subsystems = {}
+        for subsystem, owners in groups:
+            row = dict.fromkeys(_FIELDS, 0)
+            row['owners'] = len(owners)
+            for owner, attrs in owners:
+                for attr in attrs:
+                    value = owner
+                    for part in attr.split('.'):
+                        value = getattr(value, part, None)
+                    if value is not None:
+                        self._measure(value, row, seen)
+            row['bytes'] = (row['surfaces'] + row['arrays'] + row['audio'] + row['buffers']
+                            + row['records'] + row['entities'])
+            subsystems[subsystem] = row
+
+        total = sum(row['bytes'] for row in subsystems.values())
+        report = {
+            'total_bytes': total,
+            'budget_bytes': self.budget,
+            'subsystems': subsystems,
+        }
+        if resource is not None:
+            # ru_maxrss: KiB en Linux, bytes en macOS
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            report['process_peak_bytes'] = peak if sys.platform == 'darwin' else peak * 1024
+        self._report = report
+        self._report_time = time.perf_counter()
+        return report
+
+    def summary(self):
+        """Último informe, rehecho como mucho cada MEMORY_LEDGER_REFRESH segundos"""
+        if self._report is None or time.perf_counter() - self._report_time >= self.refresh:
+            return self.report()
+        return self._report
+
+    def overlay_lines(self, top=4):
+        """Líneas para el overlay de rendimiento"""
+        if not self.enabled:
+            return ()
+        report = self.summary()
+        rows = sorted(report['subsystems'].items(), key=lambda item: item[1]['bytes'], reverse=True)
+        lines = [f"memoria {format_mb(report['total_bytes'])} de {format_mb(report['budget_bytes'])}"
+                 + (f"  (pico proceso {format_mb(report['process_peak_bytes'])})"
+                    if 'process_peak_bytes' in report else "")]
+        lines.append("  ".join(f"{name} {format_mb(row['bytes'])}" for name, row in rows[:top]))
+        return lines
+
+    # ============================================
+    # 📏 MEDIDA
+    # ============================================
+
+    def _measure(self, value, row, seen, nested=False):
+        """
+        Suma value a la fila. Dentro de una entidad (nested) solo se siguen
+        superficies, arrays y contenedores: no otros objetos, que suelen ser
+        referencias al nivel, al jugador o a otras entidades.
+        """
+        if id(value) in seen:
+            return
+        if isinstance(value, (str, int, float, bool)):
+            return
+        seen.add(id(value))
+
+        if isinstance(value, pygame.Surface):
+            row['surfaces'] += value.get_width() * value.get_height() * value.get_bytesize()
+            row['surface_count'] += 1
+        elif _ARRAY_TYPES and isinstance(value, _ARRAY_TYPES):
+            row['arrays'] += value.nbytes
+        elif isinstance(value, pygame.mixer.Sound):
+            row['audio'] += self._sound_bytes(value)
+        elif isinstance(value, (bytes, bytearray)):
+            row['buffers'] += len(value)
+        elif isinstance(value, dict):
+            if value and all(isinstance(key, str) for key in value):
+                # Registro: partícula, elemento de parallax...
+                row['records'] += sys.getsizeof(value)
+                row['record_count'] += 1
+            for item in list(value.values()):
+                self._measure(item, row, seen, nested)
+        elif isinstance(value, (list, tuple, set, frozenset, deque)):
+            for item in list(value):
+                self._measure(item, row, seen, nested)
+        elif not nested and hasattr(value, '__dict__'):
+            attributes = vars(value)
+            row['entities'] += sys.getsizeof(value) + sys.getsizeof(attributes)
+            row['entity_count'] += 1
+            for item in list(attributes.values()):
+                self._measure(item, row, seen, True)
+
+    @staticmethod
+    def _sound_bytes(sound):
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return 0
+        frequency, size, channels = mixer
+        return int(sound.get_length() * frequency * channels * (abs(size) // 8))
+
+
+# Libro mayor compartido por todos los subsistemas
+memory_ledger = MemoryLedger()
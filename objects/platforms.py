@@ -1,20 +1,21 @@
 """
 platforms.py - Clases de Plataformas con Tilesets REALES
-Usa Blue.png y Terrain.png como gráficos
+Usa blue.png y terrain.png como gráficos
 """
 
 import pygame
 import random
 import math
-import os
 from objects.constants import *
+from objects.assets import asset_cache, tile_sprites, BLUE_TILESET_PATH, TERRAIN_TILESET_PATH
+from objects.event_log import event_log
 
 # ============================================
 # 🎨 TILESET MANAGER (PRIMERO - carga las imágenes)
 # ============================================
 
 class TilesetManager:
-    """Maneja la carga y extracción de tiles de Blue.png y Terrain.png"""
+    """Maneja la carga y extracción de tiles de blue.png y terrain.png"""
     
     def __init__(self):
         self.tilesets = {}
@@ -29,34 +30,16 @@ class TilesetManager:
     
     def load_tilesets(self):
         """Carga los tilesets desde los archivos"""
-        try:
-            # Cargar Blue.png
-            blue_path = "./Assets/Terrain/Blue.png"
-            if os.path.exists(blue_path):
-                # Usar convert() en lugar de convert_alpha() para evitar el error
-                self.tilesets['blue'] = pygame.image.load(blue_path).convert()
-                self.tilesets['blue'].set_colorkey(self.tilesets['blue'].get_at((0, 0)))
-
-                # Añadir transparencia manualmente si es necesario
-                self.tilesets['blue'].set_colorkey((0, 0, 0))  # Negro como transparente
-                print(f"[Tileset] Blue.png cargado: {blue_path}")
-            else:
-                print(f"[Tileset ERROR] No se encontró {blue_path}")
-                self.tilesets['blue'] = self.create_fallback_tileset('blue')
-            
-            # Cargar Terrain.png
-            terrain_path = "./Assets/Terrain/Terrain.png"
-            if os.path.exists(terrain_path):
-                self.tilesets['terrain'] = pygame.image.load(terrain_path).convert()
-                self.tilesets['terrain'].set_colorkey((0, 0, 0))
-                print(f"[Tileset] Terrain.png cargado: {terrain_path}")
-            else:
-                print(f"[Tileset ERROR] No se encontró {terrain_path}")
-                self.tilesets['terrain'] = self.create_fallback_tileset('terrain')
-                
-        except Exception as e:
-            print(f"[Tileset ERROR] Error cargando tilesets: {e}")
-            self.create_fallback_tilesets()
+        for name, path in (('blue', BLUE_TILESET_PATH), ('terrain', TERRAIN_TILESET_PATH)):
+            try:
+                # convert() + colorkey: copia propia porque el colorkey modifica la superficie
+                tileset = asset_cache.image(path, alpha=False).copy()
+                tileset.set_colorkey((0, 0, 0))  # Negro como transparente
+                self.tilesets[name] = tileset
+                event_log.info('Tileset', "%s cargado: %s", name, path)
+            except Exception as e:
+                event_log.error('Tileset', "No se pudo cargar %s: %s", path, e)
+                self.tilesets[name] = self.create_fallback_tileset(name)
     
     def create_fallback_tileset(self, tileset_name):
         """Crea tileset de emergencia si no se cargan los archivos"""
@@ -98,7 +81,7 @@ class TilesetManager:
         self.ensure_loaded()
         
         if tileset_name not in self.tilesets:
-            print(f"[Tileset ERROR] Tileset '{tileset_name}' no encontrado")
+            event_log.error('Tileset', "Tileset '%s' no encontrado", tileset_name)
             return self.create_simple_tile(width, height, tileset_name)
         
         tileset = self.tilesets[tileset_name]
@@ -111,24 +94,31 @@ class TilesetManager:
         # Verificar que esté dentro del tileset
         if (tile_x + self.tile_size > tileset.get_width() or 
             tile_y + self.tile_size > tileset.get_height()):
-            print(f"[Tileset WARN] Tile ID {tile_id} fuera de rango, usando tile 0")
+            event_log.warning('Tileset', "Tile ID %s fuera de rango, usando tile 0", tile_id)
             tile_x = 0
             tile_y = 0
         
-        # Extraer tile
+        # Extraer tile (compartido por (tileset, tile_id, tamaño))
         try:
-            tile_rect = pygame.Rect(tile_x, tile_y, self.tile_size, self.tile_size)
-            tile = tileset.subsurface(tile_rect).copy()
-            
-            # Escalar al tamaño deseado
-            if width != self.tile_size or height != self.tile_size:
-                tile = pygame.transform.scale(tile, (width, height))
-            
-            return tile
+            key = ('platform_tile', tileset_name, tile_id, (width, height))
+            return tile_sprites.get(
+                key,
+                lambda: self._extract_tile(tileset, tile_x, tile_y, width, height)
+            )
         except:
-            print(f"[Tileset ERROR] No se pudo extraer tile {tile_id}")
+            event_log.error('Tileset', "No se pudo extraer tile %s", tile_id)
             return self.create_simple_tile(width, height, tileset_name)
     
+    def _extract_tile(self, tileset, tile_x, tile_y, width, height):
+        """Recorta y escala un tile (solo la primera vez que se pide)"""
+        tile_rect = pygame.Rect(tile_x, tile_y, self.tile_size, self.tile_size)
+        tile = tileset.subsurface(tile_rect)
+        
+        # Escalar al tamaño deseado
+        if width != self.tile_size or height != self.tile_size:
+            return pygame.transform.scale(tile, (width, height))
+        return tile.copy()
+    
     def create_simple_tile(self, width, height, tileset_name):
         """Crea un tile simple de color como fallback"""
         surf = pygame.Surface((width, height))
@@ -199,7 +189,17 @@ class Platform:
         self.sprite = None
     
     def create_sprite(self):
-        """Crea un sprite compuesto de varios tiles del tileset"""
+        """
+        Devuelve el sprite compuesto de la plataforma.
+        Todas las plataformas con mismo tileset, tiles y tamaño lo comparten.
+        """
+        key = ('platform', self.tileset_name, self.tile_ids['left'],
+               self.tile_ids['middle'], self.tile_ids['right'],
+               self.width, self.height)
+        return tile_sprites.get(key, self._compose_sprite)
+    
+    def _compose_sprite(self):
+        """Compone el sprite a partir de varios tiles del tileset"""
         # Crear superficie
         sprite = pygame.Surface((self.width, self.height))
         
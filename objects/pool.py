@@ -0,0 +1,81 @@
+"""
+pool.py - Pools de objetos reutilizables
+
+Los peligros dinámicos (rocas, rayos, murciélagos, drones) aparecen y
+desaparecen continuamente durante la partida. En lugar de construir uno
+nuevo cada vez, las instancias desactivadas vuelven a su pool y se
+reinician con reset(x, y, ...), de modo que en régimen estable no se crea
+ningún objeto nuevo y el recolector de basura no provoca tirones.
+
+Solo se usa desde el hilo principal (la pre-generación en segundo plano
+trabaja con layouts, no con enemigos).
+"""
+
+# Instancias libres que se guardan como máximo por tipo
+POOL_MAX_FREE = 64
+
+
+class ObjectPool:
+    """
+    Instancias libres de una clase. La clase debe aceptar en reset() los
+    mismos argumentos que en su constructor.
+    """
+
+    def __init__(self, cls, max_free=POOL_MAX_FREE):
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        """Instancia lista para usar: reciclada si hay alguna libre, nueva si no"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        """Devuelve una instancia al pool (se descarta si ya está lleno)"""
+        if len(self.free) < self.max_free:
+            obj.active = False
+            self.free.append(obj)
+
+
+class PoolRegistry:
+    """Un ObjectPool por clase. Liberar una instancia de una clase sin pool no hace nada"""
+
+    def __init__(self):
+        self.pools = {}
+
+    def register(self, cls, max_free=POOL_MAX_FREE):
+        """Crea (si no existe) el pool de una clase y lo devuelve"""
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = self.pools[cls] = ObjectPool(cls, max_free)
+        return pool
+
+    def acquire(self, cls, *args, **kwargs):
+        """Instancia de cls reiniciada con los argumentos dados"""
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = self.register(cls)
+        return pool.acquire(*args, **kwargs)
+
+    def release(self, obj):
+        """Devuelve obj a su pool si su clase tiene uno"""
+        pool = self.pools.get(type(obj))
+        if pool is not None:
+            pool.release(obj)
+
+    def stats(self):
+        """{nombre de clase: (creadas, recicladas, libres)} para depuración"""
+        return {cls.__name__: (pool.created, pool.reused, len(pool.free))
+                for cls, pool in self.pools.items()}
+
+
+# Pools de los enemigos que se crean durante la partida
+enemy_pools = PoolRegistry()
@@ -9,6 +9,7 @@ import random
 import os
 from objects.constants import *
 from objects.utils import sine_wave
+from objects.event_log import event_log
 
 # Añade esta clase SpriteSheet al inicio del archivo
 class SpriteSheet:
@@ -33,14 +34,14 @@ class SpriteSheet:
             try:
                 if os.path.exists(path):
                     self.sprite_sheet = pygame.image.load(path).convert_alpha()
-                    print(f"[PowerUp] Sprite cargado desde: {path}")
+                    event_log.info('PowerUp', "Sprite cargado desde: %s", path)
                     break
             except Exception as e:
-                print(f"[PowerUp] Error cargando sprite {path}: {e}")
+                event_log.error('PowerUp', "Error cargando sprite %s: %s", path, e)
                 continue
         
         if self.sprite_sheet is None:
-            print(f"[PowerUp] No se pudo cargar sprite: {image_path}")
+            event_log.error('PowerUp', "No se pudo cargar sprite: %s", image_path)
             # Crear sprite simple como fallback
             self.sprite_sheet = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
             pygame.draw.circle(self.sprite_sheet, (0, 200, 0), 
@@ -157,7 +158,7 @@ class PowerUp:
         for _ in range(8):
             self.create_sparkle()
         
-        print(f"[PowerUp] Kiwi {powerup_type} creado en ({x}, {y})")
+        event_log.debug('PowerUp', "Kiwi %s creado en (%s, %s)", powerup_type, x, y)
 
     def load_kiwi_sprites(self):
         """Carga los sprites de kiwi animados"""
@@ -178,7 +179,7 @@ class PowerUp:
                         (int(self.size * 1.5), int(self.size * 1.5)))
                     self.kiwi_frames.append(scaled_frame)
                 
-                print(f"[PowerUp] Kiwi idle sprites cargados: {len(self.kiwi_frames)} frames")
+                event_log.info('PowerUp', "Kiwi idle sprites cargados: %s frames", len(self.kiwi_frames))
             
             # Intentar cargar animación de recolección
             try:
@@ -194,17 +195,18 @@ class PowerUp:
                             (int(self.size * 1.5), int(self.size * 1.5)))
                         self.collect_frames.append(scaled_frame)
                     
-                    print(f"[PowerUp] Kiwi collect sprites cargados: {len(self.collect_frames)} frames")
+                    event_log.info('PowerUp', "Kiwi collect sprites cargados: %s frames",
+                                   len(self.collect_frames))
             
             except Exception as e:
-                print(f"[PowerUp] No se pudieron cargar sprites de colección: {e}")
+                event_log.error('PowerUp', "No se pudieron cargar sprites de colección: %s", e)
                 self.collect_frames = []
             
             self.collect_frame_index = 0
             self.collect_animation_speed = 15  # Frames por segundo
             
         except Exception as e:
-            print(f"[PowerUp ERROR] No se pudieron cargar sprites de kiwi: {e}")
+            event_log.error('PowerUp', "No se pudieron cargar sprites de kiwi: %s", e)
             self.kiwi_frames = []
             self.collect_frames = []
     
@@ -552,7 +554,7 @@ class PowerUp:
             self.collect_animation = True
             self.collect_time = 0
             self.collect_frame_index = 0
-            print(f"[PowerUp] ¡KIWI {self.type.upper()} recogido!")
+            event_log.debug('PowerUp', "¡KIWI %s recogido!", self.type.upper())
             return True
         return False
     
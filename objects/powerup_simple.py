@@ -6,8 +6,11 @@ Versión simplificada pero funcional con todos los efectos
 import pygame
 import math
 import random
-import os
 from objects.constants import *
+from objects.assets import asset_cache, fallback_sprites, rotated, POWERUP_SPRITE_SIZE
+from objects.event_log import event_log
+from objects.memory_ledger import memory_ledger
+from objects.quality import quality
 
 # ============================================
 # SPRITE SHEET SIMPLIFICADO
@@ -19,35 +22,11 @@ class SpriteSheet:
         self.sprite_width = sprite_width
         self.sprite_height = sprite_height
         
-        # Intentar cargar la imagen
+        # Intentar cargar la imagen (la caché resuelve la ruta una sola vez)
         try:
-            # Rutas posibles
-            paths_to_try = [
-                image_path,
-                f"../{image_path}",
-                f"./{image_path}",
-                f"Assets/Collectables/{os.path.basename(image_path)}",
-                f"../Assets/Collectables/{os.path.basename(image_path)}"
-            ]
-            
-            for path in paths_to_try:
-                try:
-                    if os.path.exists(path):
-                        self.sprite_sheet = pygame.image.load(path).convert_alpha()
-                        print(f"[SpriteSheet] Cargado: {path}")
-                        break
-                except:
-                    continue
-            
-            # Si no se cargó, crear fallback
-            if self.sprite_sheet is None:
-                print(f"[SpriteSheet] No se pudo cargar: {image_path}")
-                self.sprite_sheet = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
-                pygame.draw.circle(self.sprite_sheet, (0, 200, 0), 
-                                 (sprite_width//2, sprite_height//2), 
-                                 sprite_width//2 - 2)
+            self.sprite_sheet = asset_cache.image(image_path)
         except Exception as e:
-            print(f"[SpriteSheet] Error: {e}")
+            event_log.error('SpriteSheet', "No se pudo cargar %s: %s", image_path, e)
             # Crear superficie simple
             self.sprite_sheet = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
             pygame.draw.circle(self.sprite_sheet, (0, 200, 0), 
@@ -94,30 +73,7 @@ class PowerUp:
         self.collect_animation = False
         self.collect_time = 0
         
-        print(f"[PowerUp] Kiwi {powerup_type} creado en ({x}, {y})")
-        
-        # ============================================
-        # 🎨 CARGAR/CREAR SPRITES DE KIWI
-        # ============================================
-        self.kiwi_frames = []
-        self.collect_frames = []
-        self._load_or_create_sprites()
-        
-        # Animación
-        self.animation_frame = 0
-        self.animation_speed = 0.15
-        self.animation_time = random.uniform(0, math.pi * 2)
-        
-        # ============================================
-        # 🌊 ANIMACIÓN FLOTANTE
-        # ============================================
-        self.float_time = random.uniform(0, math.pi * 2)
-        self.float_amplitude = 10
-        self.float_speed = 1.2
-        
-        # Rotación
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(0.3, 0.8)
+        event_log.debug('PowerUp', "Kiwi %s creado en (%s, %s)", powerup_type, x, y)
         
         # ============================================
         # 🎯 COLORES Y SÍMBOLOS
@@ -142,6 +98,31 @@ class PowerUp:
             'double_jump': '🪽'
         }
         
+        # ============================================
+        # 🎨 CARGAR/CREAR SPRITES DE KIWI
+        # ============================================
+        self.kiwi_frames = []
+        self.collect_frames = []
+        self.kiwi_frames_key = ('sheet', POWERUP_SPRITE_SIZE)   # Clave de las rotaciones
+        self._load_or_create_sprites()
+        memory_ledger.track('powerups', self, 'kiwi_frames', 'collect_frames')
+        
+        # Animación
+        self.animation_frame = 0
+        self.animation_speed = 0.15
+        self.animation_time = random.uniform(0, math.pi * 2)
+        
+        # ============================================
+        # 🌊 ANIMACIÓN FLOTANTE
+        # ============================================
+        self.float_time = random.uniform(0, math.pi * 2)
+        self.float_amplitude = 10
+        self.float_speed = 1.2
+        
+        # Rotación
+        self.rotation = random.uniform(0, 360)
+        self.rotation_speed = random.uniform(0.3, 0.8)
+        
         # ============================================
         # ✨ EFECTOS VISUALES
         # ============================================
@@ -156,36 +137,21 @@ class PowerUp:
     
     def _load_or_create_sprites(self):
         """Carga sprites o crea fallbacks"""
-        # Intentar cargar kiwi.png
+        # Intentar cargar kiwi.png (frames compartidos entre todos los kiwis)
         try:
-            kiwi_sheet = SpriteSheet("Assets/Collectables/kiwi.png", 32, 32)
-            
-            # Cargar frames de idle
-            max_frames = min(6, kiwi_sheet.sprite_sheet.get_width() // 32)
-            for i in range(max_frames):
-                frame = kiwi_sheet.get_frame(i)
-                scaled = pygame.transform.scale(frame, 
-                    (int(self.size * 1.5), int(self.size * 1.5)))
-                self.kiwi_frames.append(scaled)
-            
-            print(f"[PowerUp] {len(self.kiwi_frames)} frames de kiwi cargados")
+            self.kiwi_frames = list(asset_cache.frames(
+                "Assets/Collectables/kiwi.png", 32, 32, 6, POWERUP_SPRITE_SIZE))
             
             # Intentar cargar animación de colección
             try:
-                collect_sheet = SpriteSheet("Assets/Collectables/collected.png", 32, 32)
-                max_collect = min(4, collect_sheet.sprite_sheet.get_width() // 32)
-                for i in range(max_collect):
-                    frame = collect_sheet.get_frame(i)
-                    scaled = pygame.transform.scale(frame,
-                        (int(self.size * 1.5), int(self.size * 1.5)))
-                    self.collect_frames.append(scaled)
-                print(f"[PowerUp] {len(self.collect_frames)} frames de colección cargados")
+                self.collect_frames = list(asset_cache.frames(
+                    "Assets/Collectables/collected.png", 32, 32, 4, POWERUP_SPRITE_SIZE))
             except:
-                print(f"[PowerUp] No se pudieron cargar frames de colección")
+                event_log.error('PowerUp', "No se pudieron cargar frames de colección")
                 self._create_collect_fallback()
                 
         except Exception as e:
-            print(f"[PowerUp] Error cargando sprites: {e}")
+            event_log.error('PowerUp', "Error cargando sprites: %s", e)
             self._create_kiwi_fallback()
             self._create_collect_fallback()
         
@@ -199,8 +165,14 @@ class PowerUp:
         self.collect_animation_speed = 12
     
     def _create_kiwi_fallback(self):
-        """Crea kiwi simple animado"""
-        print("[PowerUp] Creando kiwi fallback")
+        """Kiwi simple animado (frames compartidos por tipo y tamaño)"""
+        self.kiwi_frames_key = ('fallback', self.type, self.size)
+        self.kiwi_frames = list(fallback_sprites.get(('kiwi',) + self.kiwi_frames_key[1:],
+                                                     self._build_kiwi_fallback))
+    
+    def _build_kiwi_fallback(self):
+        event_log.debug('PowerUp', "Creando kiwi fallback")
+        frames = []
         for i in range(4):
             surf = pygame.Surface((int(self.size * 1.5), int(self.size * 1.5)), pygame.SRCALPHA)
             color = self.colors.get(self.type, (34, 139, 34))
@@ -225,11 +197,17 @@ class PowerUp:
                                  (int(seed[0]), int(seed[1])), 
                                  int(self.size * 0.08))
             
-            self.kiwi_frames.append(surf)
+            frames.append(surf)
+        return tuple(frames)
     
     def _create_collect_fallback(self):
-        """Crea animación de colección simple"""
-        print("[PowerUp] Creando colección fallback")
+        """Animación de colección simple (frames compartidos por tipo y tamaño)"""
+        self.collect_frames = list(fallback_sprites.get(('kiwi_collect', self.type, self.size),
+                                                        self._build_collect_fallback))
+    
+    def _build_collect_fallback(self):
+        event_log.debug('PowerUp', "Creando colección fallback")
+        frames = []
         for i in range(4):
             surf = pygame.Surface((int(self.size * 1.5), int(self.size * 1.5)), pygame.SRCALPHA)
             color = self.colors.get(self.type, (34, 139, 34))
@@ -245,7 +223,8 @@ class PowerUp:
                                (self.size*0.4, self.size*0.4, 
                                 self.size*0.7, self.size*0.7))
             
-            self.collect_frames.append(surf)
+            frames.append(surf)
+        return tuple(frames)
     
     def _create_sparkle(self):
         """Crea partícula de chispa"""
@@ -298,18 +277,23 @@ class PowerUp:
         # ============================================
         # 🎆 PARTÍCULAS
         # ============================================
-        if random.random() < 0.2:
+        if random.random() < 0.2 * quality.current['sparkles']:
             self._create_sparkle()
         
         # Actualizar partículas
-        for p in self.sparkle_particles[:]:
+        sparkle_particles = self.sparkle_particles
+        kept = 0
+        for p in sparkle_particles:
             p['life'] -= dt
             p['x'] += p['vx']
             p['y'] += p['vy']
             p['vy'] += 0.05
             
             if p['life'] <= 0:
-                self.sparkle_particles.remove(p)
+                continue
+            sparkle_particles[kept] = p
+            kept += 1
+        del sparkle_particles[kept:]
         
         # ============================================
         # 💥 ANIMACIÓN DE RECOLECCIÓN
@@ -326,7 +310,7 @@ class PowerUp:
     def _create_explosion(self):
         """Crea explosión de partículas al recolectar"""
         color = self.colors.get(self.type, (34, 139, 34))
-        for _ in range(15):
+        for _ in range(max(1, int(15 * quality.current['sparkles']))):
             angle = random.uniform(0, math.pi * 2)
             speed = random.uniform(1, 5)
             
@@ -354,7 +338,7 @@ class PowerUp:
         # ============================================
         # 🌟 GLOW EXTERIOR
         # ============================================
-        if not self.collect_animation:
+        if not self.collect_animation and quality.current['glow']:
             glow_surf = pygame.Surface((int(self.glow_size*2), int(self.glow_size*2)), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (*color[:3], self.glow_alpha//2),
                               (int(self.glow_size), int(self.glow_size)),
@@ -382,8 +366,10 @@ class PowerUp:
             if self.kiwi_frames and self.animation_frame < len(self.kiwi_frames):
                 frame = self.kiwi_frames[self.animation_frame]
                 
-                # Rotación suave
-                rotated_frame = pygame.transform.rotate(frame, self.rotation * 0.2)
+                # Rotación suave (rotaciones compartidas entre kiwis con los mismos frames)
+                rotated_frame = rotated(('kiwi', self.kiwi_frames_key, self.animation_frame),
+                                        self.rotation * 0.2, quality.current['rotation_step'],
+                                        lambda: frame)
                 frame_rect = rotated_frame.get_rect(center=(self.x, screen_y))
                 
                 surface.blit(rotated_frame, frame_rect)
@@ -459,7 +445,7 @@ class PowerUp:
             self.collect_animation = True
             self.collect_time = 0
             self.collect_frame_index = 0
-            print(f"[PowerUp] ¡KIWI {self.type.upper()} RECOGIDO!")
+            event_log.debug('PowerUp', "¡KIWI %s RECOGIDO!", self.type.upper())
             return True
         return False
     
@@ -499,7 +485,7 @@ class CollectionEffect:
                 'color': color
             })
         
-        print(f"[CollectionEffect] Efecto creado para {powerup_type}")
+        event_log.debug('CollectionEffect', "Efecto creado para %s", powerup_type)
     
     def update(self, dt):
         """Actualiza el efecto"""
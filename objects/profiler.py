@@ -0,0 +1,133 @@
+"""
+profiler.py - Perfilador de frames y overlay de rendimiento (F3)
+
+Mide el trabajo de cada frame (eventos + update + draw + flip, sin la
+espera del reloj), por fases con mark(), y guarda las últimas
+PROFILER_WINDOW duraciones. Las pausas del recolector de basura le llegan
+desde gc_policy.py (gc.callbacks), así que el overlay puede mostrar si un
+pico de frame coincide con una colección.
+
+Durante la partida F3 muestra u oculta el overlay.
+"""
+
+import time
+from collections import deque
+import pygame
+from objects.constants import FPS, PROFILER_WINDOW, PROFILER_GC_EVENTS
+
+
+class FrameProfiler:
+    """Tiempos de frame recientes y pausas del GC por generación"""
+
+    def __init__(self, window=PROFILER_WINDOW, gc_events=PROFILER_GC_EVENTS):
+        self.frame_ms = deque(maxlen=window)
+        self.frame = 0
+        self.visible = False
+        self._frame_start = None
+        self._phase_start = None
+        self.phases = {}          # fase -> ms del último frame
+
+        # Pausas del GC
+        self.gc_events = deque(maxlen=gc_events)   # (frame, generación, ms, recogidos)
+        self.gc_counts = [0, 0, 0]
+        self.gc_total_ms = [0.0, 0.0, 0.0]
+        self.gc_max_ms = [0.0, 0.0, 0.0]
+
+    # ============================================
+    # ⏱️ MEDICIÓN
+    # ============================================
+
+    def begin_frame(self):
+        self._frame_start = self._phase_start = time.perf_counter()
+        self.phases = {}
+
+    def mark(self, phase):
+        """Cierra la fase que termina ahora (desde la marca anterior)"""
+        now = time.perf_counter()
+        if self._phase_start is not None:
+            self.phases[phase] = (now - self._phase_start) * 1000
+        self._phase_start = now
+
+    def end_frame(self):
+        """Cierra el frame. Returns: duración en ms (None sin begin_frame)"""
+        if self._frame_start is None:
+            return None
+        ms = (time.perf_counter() - self._frame_start) * 1000
+        self._frame_start = None
+        self.frame_ms.append(ms)
+        self.frame += 1
+        return ms
+
+    def record_gc(self, generation, ms, collected=0):
+        """Pausa de una colección (llamado desde el callback del GC)"""
+        self.gc_events.append((self.frame, generation, ms, collected))
+        self.gc_counts[generation] += 1
+        self.gc_total_ms[generation] += ms
+        if ms > self.gc_max_ms[generation]:
+            self.gc_max_ms[generation] = ms
+
+    def stats(self):
+        """Resumen de la ventana actual"""
+        frames = sorted(self.frame_ms)
+        if not frames:
+            return {'frames': 0, 'avg_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        return {
+            'frames': len(frames),
+            'avg_ms': sum(frames) / len(frames),
+            'p95_ms': frames[min(len(frames) - 1, int(len(frames) * 0.95))],
+            'max_ms': frames[-1],
+        }
+
+    # ============================================
+    # 🖥️ OVERLAY
+    # ============================================
+
+    def toggle(self):
+        self.visible = not self.visible
+        return self.visible
+
+    def draw(self, surface, font, extra_lines=()):
+        """Panel semitransparente con tiempos de frame, GC y líneas extra"""
+        stats = self.stats()
+        budget = 1000.0 / FPS
+        lines = [
+            f"frame {stats['avg_ms']:.2f} ms  p95 {stats['p95_ms']:.2f}  máx {stats['max_ms']:.2f}"
+            f"  (presupuesto {budget:.1f})",
+        ]
+        for generation in range(3):
+            count = self.gc_counts[generation]
+            average = self.gc_total_ms[generation] / count if count else 0.0
+            lines.append(f"gc{generation}: {count}  media {average:.2f} ms  "
+                         f"máx {self.gc_max_ms[generation]:.2f} ms")
+        if self.gc_events:
+            frame, generation, ms, collected = self.gc_events[-1]
+            lines.append(f"última gc{generation}: {ms:.2f} ms, {collected} objetos "
+                         f"(hace {self.frame - frame} frames)")
+        lines.extend(extra_lines)
+
+        rendered = [font.render(line, True, (230, 230, 230)) for line in lines]
+        width = max(text.get_width() for text in rendered) + 16
+        height = sum(text.get_height() for text in rendered) + 12
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 6
+        for text in rendered:
+            panel.blit(text, (8, y))
+            y += text.get_height()
+
+        # Barras de los últimos frames (rojo si pasan del presupuesto)
+        graph_height = 40
+        graph = pygame.Surface((width, graph_height), pygame.SRCALPHA)
+        graph.fill((0, 0, 0, 140))
+        recent = list(self.frame_ms)[-width:]
+        for x, ms in enumerate(recent):
+            bar = min(graph_height, int(ms / (budget * 2) * graph_height))
+            color = (230, 70, 70) if ms > budget else (90, 200, 90)
+            pygame.draw.line(graph, color, (x, graph_height - 1), (x, graph_height - 1 - bar))
+
+        surface.blit(panel, (10, 10))
+        surface.blit(graph, (10, 10 + height))
+
+
+# Perfilador compartido por el bucle de juego
+profiler = FrameProfiler()
@@ -0,0 +1,123 @@
+"""
+quality.py - Calidad gráfica adaptativa según el tiempo de frame
+
+El gobernador guarda la media móvil de los últimos QUALITY_WINDOW frames
+de partida (trabajo del frame, sin la espera del reloj) y elige uno de
+los niveles de QUALITY_TIERS:
+  - si la media supera QUALITY_DOWNGRADE_RATIO del presupuesto (1/FPS),
+    baja un nivel;
+  - si se queda por debajo de QUALITY_UPGRADE_RATIO durante
+    QUALITY_UPGRADE_WINDOWS ventanas seguidas, sube uno.
+La distancia entre los dos umbrales (histéresis) y el vaciado de la
+ventana tras cada cambio evitan que la calidad oscile.
+
+Cada nivel fija los efectos que más cuestan al dibujar:
+  - particles: escala de la densidad y del tope de partículas de la lava;
+  - sparkles: escala de las chispas de los power-ups;
+  - trail_length: copias del rastro de velocidad del jugador;
+  - glow: halos semitransparentes (power-ups, interior del escudo);
+  - scan_cones: haz de alerta de los drones;
+  - parallax_stride: se dibuja uno de cada N elementos del fondo;
+  - rotation_step: grados entre ángulos guardados en la caché de
+    sprites rotados (assets.rotated); más grueso = menos rotaciones.
+
+Los sistemas leen quality.current al dibujar; no hay que avisarles.
+"""
+
+from collections import deque
+from objects.constants import (FPS, QUALITY_GOVERNOR_ENABLED, QUALITY_TIERS, QUALITY_WINDOW,
+                               QUALITY_DOWNGRADE_RATIO, QUALITY_UPGRADE_RATIO,
+                               QUALITY_UPGRADE_WINDOWS)
+from objects.event_log import event_log
+
+
+class QualityGovernor:
+    """Baja o sube el nivel de calidad según la media del tiempo de frame"""
+
+    def __init__(self, tiers=QUALITY_TIERS, window=QUALITY_WINDOW, budget_ms=1000.0 / FPS,
+                 downgrade_ratio=QUALITY_DOWNGRADE_RATIO, upgrade_ratio=QUALITY_UPGRADE_RATIO,
+                 upgrade_windows=QUALITY_UPGRADE_WINDOWS, enabled=QUALITY_GOVERNOR_ENABLED):
+        self.enabled = enabled
+        self.tiers = tiers
+        self.budget_ms = budget_ms
+        self.downgrade_ms = budget_ms * downgrade_ratio
+        self.upgrade_ms = budget_ms * upgrade_ratio
+        self.upgrade_windows = upgrade_windows
+        self.locked = False
+        self.index = 0
+        self.current = tiers[0]
+        self.changes = 0
+
+        self._frames = deque(maxlen=window)
+        self._total = 0.0
+        self._headroom_frames = 0
+        self._expected_hitch = False
+
+    @property
+    def average_ms(self):
+        return self._total / len(self._frames) if self._frames else 0.0
+
+    def set_tier(self, index, locked=False):
+        """Fija el nivel (locked=True lo deja fijo, p. ej. main.py --quality)"""
+        index = max(0, min(len(self.tiers) - 1, index))
+        self.locked = locked
+        if index != self.index:
+            self.index = index
+            self.current = self.tiers[index]
+            self.changes += 1
+        self._reset_window()
+
+    def expect_hitch(self):
+        """El frame actual es lento a propósito (construir un nivel): no cuenta"""
+        self._expected_hitch = True
+
+    # ============================================
+    # 📈 MEDIA MÓVIL
+    # ============================================
+
+    def observe(self, frame_ms):
+        """Añade un frame de partida; puede cambiar el nivel de calidad"""
+        expected, self._expected_hitch = self._expected_hitch, False
+        if not self.enabled or self.locked or frame_ms is None or expected:
+            return
+
+        frames = self._frames
+        if len(frames) == frames.maxlen:
+            self._total -= frames[0]
+        frames.append(frame_ms)
+        self._total += frame_ms
+        if len(frames) < frames.maxlen:
+            return
+
+        average = self._total / len(frames)
+        if average > self.downgrade_ms:
+            if self.index < len(self.tiers) - 1:
+                self._step(+1, average)
+        elif average < self.upgrade_ms and self.index > 0:
+            # Subir solo tras varias ventanas seguidas con margen
+            self._headroom_frames += 1
+            if self._headroom_frames >= self.upgrade_windows * frames.maxlen:
+                self._step(-1, average)
+        else:
+            self._headroom_frames = 0
+
+    def _step(self, direction, average):
+        previous = self.current['name']
+        self.set_tier(self.index + direction)
+        event_log.info('Quality', "Calidad %s -> %s (media %.2f ms, presupuesto %.2f ms)",
+                       previous, self.current['name'], average, self.budget_ms)
+
+    def _reset_window(self):
+        self._frames.clear()
+        self._total = 0.0
+        self._headroom_frames = 0
+
+    def overlay_line(self):
+        """Línea para el overlay de rendimiento"""
+        state = "fija" if self.locked else ("auto" if self.enabled else "desactivada")
+        return (f"calidad {self.current['name']} ({self.index + 1}/{len(self.tiers)}, {state})  "
+                f"media {self.average_ms:.2f} ms")
+
+
+# Gobernador compartido por el bucle de juego y los sistemas que dibujan
+quality = QualityGovernor()
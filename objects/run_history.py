@@ -0,0 +1,178 @@
+"""
+run_history.py - Historial de partidas en SQLite (opcional)
+
+Guarda cada intento (nivel superado o partida perdida) en un archivo
+SQLite local con la dificultad, nivel, puntuación, tiempo, muertes,
+altura máxima y las estadísticas de Player.stats. A diferencia de las
+tablas de récords (top 10 en score_store.py), el historial no tiene
+límite: las consultas van siempre paginadas con LIMIT/OFFSET sobre
+índices, así que su coste no depende del tamaño del historial.
+
+Las inserciones se hacen en un hilo propio (con su conexión) para no
+costar un frame; las consultas del menú usan otra conexión y el modo WAL
+permite leer mientras se escribe. Si sqlite3 no está disponible o
+RUN_HISTORY_ENABLED es False, todo queda desactivado sin errores.
+"""
+
+import queue
+import atexit
+import threading
+from datetime import datetime
+from objects.constants import RUN_HISTORY_FILE, RUN_HISTORY_ENABLED, RUN_HISTORY_PAGE_SIZE
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+# Campos de Player.stats que se guardan (max_height va aparte, como altura)
+RUN_STAT_FIELDS = ('platforms_touched', 'enemies_killed', 'powerups_collected',
+                   'total_jumps', 'air_time')
+
+RUN_COLUMNS = ('played_at', 'difficulty', 'mode', 'level', 'outcome', 'score',
+               'time', 'deaths', 'max_height') + RUN_STAT_FIELDS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    played_at TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    time REAL NOT NULL,
+    deaths INTEGER NOT NULL,
+    max_height REAL NOT NULL,
+    platforms_touched INTEGER NOT NULL DEFAULT 0,
+    enemies_killed INTEGER NOT NULL DEFAULT 0,
+    powerups_collected INTEGER NOT NULL DEFAULT 0,
+    total_jumps INTEGER NOT NULL DEFAULT 0,
+    air_time REAL NOT NULL DEFAULT 0
+);
+-- Top N por dificultad
+CREATE INDEX IF NOT EXISTS runs_top ON runs (difficulty, score DESC, id);
+-- Mejores tiempos por nivel (solo niveles superados)
+CREATE INDEX IF NOT EXISTS runs_best_time ON runs (level, difficulty, time)
+    WHERE outcome = 'complete';
+-- Historial por dificultad, del más reciente al más antiguo
+CREATE INDEX IF NOT EXISTS runs_history ON runs (difficulty, id DESC);
+"""
+
+
+class RunHistory:
+    """Historial de partidas: inserciones en segundo plano, consultas paginadas"""
+
+    def __init__(self, path=RUN_HISTORY_FILE, enabled=RUN_HISTORY_ENABLED):
+        self.path = path
+        self.enabled = enabled and sqlite3 is not None
+        self._reader = None
+        self._queue = queue.Queue()
+        self._writer = None
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _read_connection(self):
+        """Conexión de consultas (se abre la primera vez)"""
+        if self._reader is None:
+            try:
+                self._reader = self._connect()
+            except Exception as e:
+                print(f"[RunHistory] Desactivado, no se pudo abrir {self.path}: {e}")
+                self.enabled = False
+        return self._reader
+
+    # ============================================
+    # 📝 REGISTRO (hilo de escritura)
+    # ============================================
+
+    def record_run(self, difficulty, level, outcome, score, time, deaths, max_height,
+                   stats=None, mode="levels"):
+        """
+        Encola un intento terminado. outcome: 'complete' (nivel superado)
+        o 'game_over'. stats es Player.stats.
+        """
+        if not self.enabled:
+            return
+        stats = stats or {}
+        row = (datetime.now().strftime("%Y-%m-%d %H:%M"), difficulty, mode, int(level),
+               outcome, int(score), float(time), int(deaths), float(max_height))
+        row += tuple(stats.get(field, 0) for field in RUN_STAT_FIELDS)
+
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="run-history",
+                                            daemon=True)
+            self._writer.start()
+            atexit.register(self.flush, 2.0)
+        self._queue.put(row)
+
+    def flush(self, timeout=None):
+        """Espera a que se hayan guardado los intentos encolados"""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _write_loop(self):
+        try:
+            connection = self._connect()
+        except Exception as e:
+            print(f"[RunHistory] Desactivado, no se pudo abrir {self.path}: {e}")
+            self.enabled = False
+            return
+        insert = (f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) "
+                  f"VALUES ({', '.join('?' * len(RUN_COLUMNS))})")
+        while True:
+            task = self._queue.get()
+            if isinstance(task, threading.Event):
+                task.set()
+                continue
+            try:
+                with connection:
+                    connection.execute(insert, task)
+            except Exception as e:
+                print(f"[RunHistory] Error guardando intento: {e}")
+
+    # ============================================
+    # 🔍 CONSULTAS PAGINADAS
+    # ============================================
+
+    def _query(self, sql, params):
+        if not self.enabled:
+            return []
+        connection = self._read_connection()
+        if connection is None:
+            return []
+        try:
+            return [dict(row) for row in connection.execute(sql, params)]
+        except Exception as e:
+            print(f"[RunHistory] Error en consulta: {e}")
+            return []
+
+    def top_scores(self, difficulty, limit=RUN_HISTORY_PAGE_SIZE, offset=0):
+        """Mejores puntuaciones de una dificultad (página limit/offset)"""
+        return self._query("SELECT * FROM runs WHERE difficulty = ? "
+                           "ORDER BY score DESC, id LIMIT ? OFFSET ?",
+                           (difficulty, limit, offset))
+
+    def best_times(self, level, difficulty, limit=RUN_HISTORY_PAGE_SIZE, offset=0):
+        """Tiempos más rápidos superando un nivel"""
+        return self._query("SELECT * FROM runs WHERE outcome = 'complete' AND level = ? "
+                           "AND difficulty = ? ORDER BY time LIMIT ? OFFSET ?",
+                           (level, difficulty, limit, offset))
+
+    def history(self, difficulty, limit=RUN_HISTORY_PAGE_SIZE, offset=0):
+        """Intentos de una dificultad, del más reciente al más antiguo"""
+        return self._query("SELECT * FROM runs WHERE difficulty = ? "
+                           "ORDER BY id DESC LIMIT ? OFFSET ?",
+                           (difficulty, limit, offset))
+
+
+# Historial compartido por el juego y el menú
+run_history = RunHistory()
@@ -0,0 +1,307 @@
+"""
+score_store.py - Almacén único de puntuaciones altas
+
+Todas las rutas del juego (menú, Game y los gestores antiguos) comparten
+este almacén. Los datos se leen una sola vez; después cada dificultad
+vive en memoria como un min-heap acotado al top N, así que comprobar si
+una puntuación entra en la tabla o consultar el récord no toca el disco.
+
+Persistencia a prueba de cortes:
+  - cada alta o borrado se añade como una línea JSON a un diario
+    (<archivo>.journal) con fsync, desde un hilo de escritura; guardar
+    una puntuación nunca cuesta un frame;
+  - cada SCORE_JOURNAL_COMPACT_EVERY registros ese mismo hilo compacta:
+    escribe la instantánea completa (archivo temporal, fsync y
+    os.replace) y vacía el diario;
+  - al arrancar se carga la instantánea y se reproducen los registros del
+    diario posteriores a ella (una última línea cortada se ignora).
+
+Formato de la instantánea (el de siempre, más el último registro aplicado):
+    {"easy": [{"name", "score", "date", ...}, ...], ..., "_journal_seq": n}
+"""
+
+import os
+import json
+import heapq
+import queue
+import atexit
+import itertools
+import threading
+from datetime import datetime
+from objects.constants import SCORE_STORE_FILE, MAX_HIGH_SCORES, SCORE_JOURNAL_COMPACT_EVERY
+
+SCORE_DIFFICULTIES = ("easy", "normal", "hard")
+JOURNAL_SEQ_KEY = "_journal_seq"
+
+# Tabla inicial cuando todavía no existe el archivo
+DEFAULT_HIGH_SCORES = {
+    "easy": [
+        {"name": "PRO", "score": 15000, "date": "2024-01-01"},
+        {"name": "MASTER", "score": 12000, "date": "2024-01-01"},
+        {"name": "SKILL", "score": 10000, "date": "2024-01-01"},
+    ],
+    "normal": [
+        {"name": "LEGEND", "score": 20000, "date": "2024-01-01"},
+        {"name": "HERO", "score": 15000, "date": "2024-01-01"},
+        {"name": "CHAMP", "score": 12000, "date": "2024-01-01"},
+    ],
+    "hard": [
+        {"name": "GOD", "score": 30000, "date": "2024-01-01"},
+        {"name": "TITAN", "score": 25000, "date": "2024-01-01"},
+        {"name": "DEMON", "score": 20000, "date": "2024-01-01"},
+    ]
+}
+
+# Tarea especial de la cola de escritura
+_COMPACT = "compact"
+
+
+class ScoreStore:
+    """
+    Top N por dificultad en memoria. Cada heap guarda (score, orden, entrada):
+    la raíz es la peor puntuación de la tabla y, a igual puntuación, la más
+    reciente (queda por debajo de las anteriores, como con sort estable).
+    """
+
+    def __init__(self, path=SCORE_STORE_FILE, capacity=MAX_HIGH_SCORES, defaults=None,
+                 compact_every=SCORE_JOURNAL_COMPACT_EVERY):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.capacity = capacity
+        self.defaults = DEFAULT_HIGH_SCORES if defaults is None else defaults
+        self.compact_every = compact_every
+        self._heaps = None
+        self._views = {}               # dificultad -> lista ordenada (caché)
+        self._order = itertools.count()
+        self._seq = 0                  # Último registro del diario asignado
+        self._lock = threading.Lock()  # Protege heaps y _seq frente al hilo de escritura
+
+        # Hilo de escritura (se arranca con la primera escritura)
+        self._queue = queue.Queue()
+        self._writer = None
+        self._pending_records = 0      # Registros en el diario desde la última compactación
+
+    # ============================================
+    # 📂 CARGA (una sola vez)
+    # ============================================
+
+    def _ensure_loaded(self):
+        if self._heaps is not None:
+            return
+        data = None
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+        except Exception as e:
+            print(f"[ScoreStore] Error cargando {self.path}: {e}")
+        if not isinstance(data, dict):
+            data = self.defaults
+
+        with self._lock:
+            self._seq = int(data.get(JOURNAL_SEQ_KEY, 0))
+            self._heaps = {difficulty: [] for difficulty in SCORE_DIFFICULTIES}
+            for difficulty, entries in data.items():
+                if difficulty.startswith("_"):
+                    continue
+                # Las mejores primero: a igual puntuación manda el orden del archivo
+                for entry in entries:
+                    self._push(difficulty, dict(entry))
+            self._pending_records = self._replay_journal()
+
+    def _replay_journal(self):
+        """Aplica los registros del diario posteriores a la instantánea"""
+        if not os.path.exists(self.journal_path):
+            return 0
+        replayed = 0
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Última línea a medias (corte durante la escritura)
+                        break
+                    if record["seq"] <= self._seq:
+                        continue
+                    self._apply(record)
+                    self._seq = record["seq"]
+                    replayed += 1
+        except Exception as e:
+            print(f"[ScoreStore] Error leyendo {self.journal_path}: {e}")
+        return replayed
+
+    def _apply(self, record):
+        """Aplica un registro del diario a los heaps"""
+        if record["op"] == "add":
+            return self._push(record["difficulty"], record["entry"])
+        for key in ([record["difficulty"]] if record.get("difficulty") else list(self._heaps)):
+            self._heaps[key] = []
+            self._views.pop(key, None)
+        return True
+
+    def _push(self, difficulty, entry):
+        """Inserta en el heap acotado. Returns: True si la entrada queda en la tabla"""
+        heap = self._heaps.setdefault(difficulty, [])
+        self._views.pop(difficulty, None)
+        item = (entry["score"], -next(self._order), entry)
+        if len(heap) < self.capacity:
+            heapq.heappush(heap, item)
+            return True
+        if item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+            return True
+        return False
+
+    # ============================================
+    # 🔍 CONSULTAS (sin disco)
+    # ============================================
+
+    def top(self, difficulty, limit=None):
+        """Entradas de mayor a menor puntuación (lista cacheada; no modificar)"""
+        self._ensure_loaded()
+        view = self._views.get(difficulty)
+        if view is None:
+            ranked = sorted(self._heaps.get(difficulty, ()), key=lambda item: item[:2], reverse=True)
+            view = self._views[difficulty] = [item[2] for item in ranked]
+        return view if limit is None else view[:limit]
+
+    def best(self, difficulty):
+        """Récord de la dificultad (0 si no hay ninguno)"""
+        view = self.top(difficulty)
+        return view[0]["score"] if view else 0
+
+    def qualifies(self, difficulty, score):
+        """True si la puntuación entraría en la tabla. O(1)"""
+        self._ensure_loaded()
+        heap = self._heaps.get(difficulty, ())
+        return len(heap) < self.capacity or score > heap[0][0]
+
+    def as_dict(self):
+        """Todas las tablas en el formato del archivo"""
+        self._ensure_loaded()
+        return self._tables()[0]
+
+    def _tables(self):
+        """(tablas ordenadas, último seq) tomados a la vez; válido desde cualquier hilo"""
+        with self._lock:
+            heaps = {difficulty: list(heap) for difficulty, heap in self._heaps.items()}
+            seq = self._seq
+        tables = {difficulty: [item[2] for item in sorted(heap, key=lambda item: item[:2], reverse=True)]
+                  for difficulty, heap in heaps.items()}
+        return tables, seq
+
+    # ============================================
+    # 💾 ALTAS (diario en segundo plano)
+    # ============================================
+
+    def add(self, difficulty, name, score, save=True, **extra):
+        """
+        Añade una puntuación (con fecha de hoy y campos extra opcionales).
+        La escritura en disco se hace en el hilo del diario.
+
+        Returns:
+            int: Posición en la tabla (1 = récord), o None si no entra
+        """
+        self._ensure_loaded()
+        entry = {"name": name, "score": score, "date": datetime.now().strftime("%Y-%m-%d")}
+        entry.update(extra)
+        with self._lock:
+            if not self._push(difficulty, entry):
+                return None
+            record = self._next_record("add", difficulty, entry)
+        if save:
+            self._enqueue(record)
+        for position, ranked in enumerate(self.top(difficulty), 1):
+            if ranked is entry:
+                return position
+
+    def clear(self, difficulty=None):
+        """Vacía una tabla (o todas) y lo registra en el diario"""
+        self._ensure_loaded()
+        with self._lock:
+            record = self._next_record("clear", difficulty)
+            self._apply(record)
+        self._enqueue(record)
+
+    def save(self):
+        """Pide una compactación (instantánea completa) en segundo plano"""
+        self._ensure_loaded()
+        self._enqueue(_COMPACT)
+        return True
+
+    def flush(self, timeout=None):
+        """Espera a que el hilo del diario haya escrito todo lo pendiente"""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _next_record(self, op, difficulty, entry=None):
+        self._seq += 1
+        record = {"seq": self._seq, "op": op, "difficulty": difficulty}
+        if entry is not None:
+            record["entry"] = entry
+        return record
+
+    def _enqueue(self, task):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="score-journal",
+                                            daemon=True)
+            self._writer.start()
+            atexit.register(self.flush, 2.0)
+        self._queue.put(task)
+
+    # ============================================
+    # 🧵 HILO DE ESCRITURA
+    # ============================================
+
+    def _write_loop(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if isinstance(task, threading.Event):
+                    task.set()
+                elif task == _COMPACT:
+                    self._compact()
+                else:
+                    self._append(task)
+                    self._pending_records += 1
+                    if self._pending_records >= self.compact_every:
+                        self._compact()
+            except Exception as e:
+                print(f"[ScoreStore] Error escribiendo puntuaciones: {e}")
+
+    def _append(self, record):
+        """Añade un registro al diario y lo fuerza a disco"""
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self):
+        """Instantánea atómica de todas las tablas y diario vacío"""
+        snapshot, seq = self._tables()
+        snapshot[JOURNAL_SEQ_KEY] = seq
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        # Los registros que queden con seq <= snapshot se ignoran al cargar,
+        # así que un corte entre los dos pasos no duplica nada
+        with open(self.journal_path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending_records = 0
+
+
+# Almacén compartido por el menú y el juego
+score_store = ScoreStore()
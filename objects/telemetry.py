@@ -0,0 +1,150 @@
+"""
+telemetry.py - Telemetría de cada intento en columnas NumPy
+
+Durante la partida se toma una muestra a frecuencia fija (TELEMETRY_RATE
+por segundo) y se escribe en buffers NumPy preasignados, una columna por
+campo: sin diccionarios ni listas por frame. Al terminar el nivel las
+columnas se guardan en un .npz (en un hilo aparte) dentro de
+TELEMETRY_DIR; el análisis offline está en telemetry_report.py.
+
+Columnas:
+    t              segundos desde el inicio del nivel
+    player_x/y     posición del jugador
+    player_vx/vy   velocidad del jugador
+    lava_y         superficie de la lava
+    lava_speed     velocidad actual de la lava
+    lava_distance  margen sobre la lava (lava_y - player_y; <0 = dentro)
+    enemies        enemigos vivos
+    frame_ms       peor frame desde la muestra anterior
+    powerups       máscara de power-ups activos (POWERUP_BITS)
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+import numpy as np
+from objects.constants import (TELEMETRY_ENABLED, TELEMETRY_RATE, TELEMETRY_CAPACITY,
+                               TELEMETRY_DIR)
+
+TELEMETRY_COLUMNS = (
+    ('t', np.float32),
+    ('player_x', np.float32),
+    ('player_y', np.float32),
+    ('player_vx', np.float32),
+    ('player_vy', np.float32),
+    ('lava_y', np.float32),
+    ('lava_speed', np.float32),
+    ('lava_distance', np.float32),
+    ('enemies', np.uint16),
+    ('frame_ms', np.float32),
+    ('powerups', np.uint8),
+)
+
+# Bits de la columna powerups
+POWERUP_BITS = {'shield': 1, 'speed': 2, 'zoom': 4}
+
+
+class TelemetryRecorder:
+    """Muestreo a frecuencia fija en buffers columnares preasignados"""
+
+    def __init__(self, rate=TELEMETRY_RATE, capacity=TELEMETRY_CAPACITY,
+                 directory=TELEMETRY_DIR, enabled=TELEMETRY_ENABLED):
+        self.enabled = enabled
+        self.interval = 1.0 / rate
+        self.directory = directory
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in TELEMETRY_COLUMNS}
+        self.count = 0
+        self.meta = {}
+        self._time = 0.0
+        self._next_sample = 0.0
+        self._worst_frame = 0.0
+
+    def begin(self, level, difficulty, mode):
+        """Empieza un intento nuevo (descarta lo no guardado del anterior)"""
+        self.count = 0
+        self._time = 0.0
+        self._next_sample = 0.0
+        self._worst_frame = 0.0
+        self.meta = {'level': level, 'difficulty': difficulty, 'mode': mode,
+                     'rate': 1.0 / self.interval,
+                     'started_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+    def sample(self, dt, player, lava, level):
+        """Se llama cada frame de juego; solo escribe cuando toca muestra"""
+        if not self.enabled or player is None:
+            return
+        self._time += dt
+        if dt > self._worst_frame:
+            self._worst_frame = dt
+        if self._time < self._next_sample:
+            return
+        self._next_sample += self.interval
+        if self._next_sample < self._time:
+            # Tras un tirón largo no se intenta recuperar muestras perdidas
+            self._next_sample = self._time + self.interval
+
+        i = self.count
+        if i == len(self.columns['t']):
+            self._grow()
+        c = self.columns
+        c['t'][i] = self._time
+        c['player_x'][i] = player.x
+        c['player_y'][i] = player.y
+        c['player_vx'][i] = player.vel_x
+        c['player_vy'][i] = player.vel_y
+        c['lava_y'][i] = lava.y
+        c['lava_speed'][i] = lava.current_speed
+        c['lava_distance'][i] = lava.y - player.y
+        c['enemies'][i] = len(level.enemies)
+        c['frame_ms'][i] = self._worst_frame * 1000
+        c['powerups'][i] = ((POWERUP_BITS['shield'] if player.shield_active else 0)
+                            | (POWERUP_BITS['speed'] if player.speed_boost else 0)
+                            | (POWERUP_BITS['zoom'] if player.zoom_active else 0))
+        self._worst_frame = 0.0
+        self.count = i + 1
+
+    def _grow(self):
+        """Duplica los buffers (solo en intentos más largos de lo previsto)"""
+        for name, column in self.columns.items():
+            self.columns[name] = np.concatenate((column, np.zeros_like(column)))
+
+    def flush(self, outcome):
+        """
+        Guarda el intento en un .npz (en segundo plano) y vacía los buffers.
+
+        Returns:
+            str: Ruta del archivo, o None si no había nada que guardar
+        """
+        if not self.enabled or not self.count:
+            return None
+        data = {name: column[:self.count].copy() for name, column in self.columns.items()}
+        meta = dict(self.meta, outcome=outcome, samples=self.count)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.directory,
+                            f"run_{stamp}_L{meta.get('level')}_{meta.get('difficulty')}.npz")
+        self.count = 0
+        threading.Thread(target=self._write, args=(path, data, meta),
+                         name="telemetry-writer", daemon=True).start()
+        return path
+
+    @staticmethod
+    def _write(path, data, meta):
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as f:
+                np.savez_compressed(f, meta=np.array(json.dumps(meta)), **data)
+        except Exception as e:
+            print(f"[Telemetry] Error guardando {path}: {e}")
+
+
+def load_telemetry(path):
+    """(columnas, meta) de un archivo .npz de telemetría"""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        columns = {name: data[name] for name in data.files if name != 'meta'}
+    return columns, meta
+
+
+# Grabador compartido por el juego
+telemetry = TelemetryRecorder()
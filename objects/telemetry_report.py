@@ -0,0 +1,164 @@
+"""
+telemetry_report.py - Informes offline de la telemetría por intento
+
+Lee los .npz de objects/telemetry.py y genera dos informes en texto:
+  - curva de dificultad: por tramos de altura escalada, tiempo empleado,
+    margen sobre la lava (medio y mínimo), tiempo cerca de la lava,
+    velocidad de la lava y enemigos;
+  - rendimiento: percentiles del peor frame de cada muestra, muestras por
+    encima del presupuesto de 1/FPS y coste del frame según enemigos vivos.
+Al final resume todos los intentos agrupados por dificultad y nivel.
+
+Uso:
+    python -m objects.telemetry_report [archivos .npz o carpetas]
+    (por defecto, todos los de TELEMETRY_DIR)
+"""
+
+import os
+import sys
+import glob
+import numpy as np
+from objects.constants import FPS, TELEMETRY_DIR
+from objects.telemetry import load_telemetry
+
+HEIGHT_BINS = 10            # Tramos de la curva de dificultad
+LAVA_CLOSE_DISTANCE = 200   # Margen que cuenta como "cerca de la lava"
+ENEMY_BUCKETS = (0, 5, 10, 20, 40)
+
+
+def collect_files(paths):
+    """Archivos .npz de las rutas indicadas (las carpetas se recorren)"""
+    files = []
+    for path in paths or [TELEMETRY_DIR]:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.npz"))))
+        elif os.path.exists(path):
+            files.append(path)
+    return files
+
+
+def climbed_height(columns):
+    """Altura escalada en cada muestra (y crece hacia abajo)"""
+    y = columns['player_y']
+    return y[0] - y if len(y) else y
+
+
+def difficulty_curve(columns, bins=HEIGHT_BINS):
+    """
+    Filas por tramo de altura máxima alcanzada hasta ese momento, para
+    que las caídas cuenten en el tramo del que se cayó.
+    """
+    height = np.maximum.accumulate(climbed_height(columns))
+    if not len(height) or height[-1] <= 0:
+        return []
+    edges = np.linspace(0, height[-1], bins + 1)
+    index = np.clip(np.searchsorted(edges, height, side='right') - 1, 0, bins - 1)
+    dt = np.diff(columns['t'], prepend=0.0)
+
+    rows = []
+    for b in range(bins):
+        mask = index == b
+        if not mask.any():
+            continue
+        rows.append({
+            'from': edges[b], 'to': edges[b + 1],
+            'time': float(dt[mask].sum()),
+            'lava_distance': float(columns['lava_distance'][mask].mean()),
+            'lava_min': float(columns['lava_distance'][mask].min()),
+            'close': float((columns['lava_distance'][mask] < LAVA_CLOSE_DISTANCE).mean() * 100),
+            'lava_speed': float(columns['lava_speed'][mask].mean()),
+            'enemies': float(columns['enemies'][mask].mean()),
+            'powerups': float((columns['powerups'][mask] != 0).mean() * 100),
+        })
+    return rows
+
+
+def performance(columns):
+    """Percentiles del peor frame por muestra y coste según enemigos vivos"""
+    frame_ms = columns['frame_ms']
+    if not len(frame_ms):
+        return None
+    budget = 1000.0 / FPS
+    p50, p95, p99 = np.percentile(frame_ms, (50, 95, 99))
+    by_enemies = []
+    for low, high in zip(ENEMY_BUCKETS, ENEMY_BUCKETS[1:] + (None,)):
+        mask = columns['enemies'] >= low
+        if high is not None:
+            mask &= columns['enemies'] < high
+        if mask.any():
+            label = f"{low}-{high - 1}" if high is not None else f"{low}+"
+            by_enemies.append((label, int(mask.sum()), float(frame_ms[mask].mean()),
+                               float(frame_ms[mask].max())))
+    return {'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+            'max': float(frame_ms.max()), 'budget': budget,
+            'over_budget': float((frame_ms > budget * 1.5).mean() * 100),
+            'by_enemies': by_enemies}
+
+
+def print_run(path, columns, meta):
+    duration = float(columns['t'][-1]) if len(columns['t']) else 0.0
+    print(f"\n=== {os.path.basename(path)} ===")
+    print(f"Nivel {meta.get('level')} | {meta.get('difficulty')} | {meta.get('mode')} | "
+          f"{meta.get('outcome')} | {duration:.1f}s | {meta.get('samples')} muestras")
+
+    curve = difficulty_curve(columns)
+    if curve:
+        print("\n📈 Curva de dificultad (por altura máxima alcanzada)")
+        print(f"{'altura':>13} {'tiempo':>7} {'lava':>7} {'lava min':>8} {'cerca %':>7} "
+              f"{'vel lava':>8} {'enem':>5} {'pwr %':>6}")
+        for row in curve:
+            print(f"{row['from']:6.0f}-{row['to']:<6.0f} {row['time']:6.1f}s {row['lava_distance']:7.0f} "
+                  f"{row['lava_min']:8.0f} {row['close']:7.1f} {row['lava_speed']:8.2f} "
+                  f"{row['enemies']:5.1f} {row['powerups']:6.1f}")
+
+    perf = performance(columns)
+    if perf:
+        print(f"\n⏱️ Rendimiento (peor frame de cada muestra, presupuesto {perf['budget']:.1f} ms)")
+        print(f"p50 {perf['p50']:.1f} ms | p95 {perf['p95']:.1f} ms | p99 {perf['p99']:.1f} ms | "
+              f"máx {perf['max']:.1f} ms | >1.5x presupuesto: {perf['over_budget']:.1f}%")
+        for label, samples, mean_ms, max_ms in perf['by_enemies']:
+            print(f"  enemigos {label:>6}: {samples:6d} muestras, media {mean_ms:5.1f} ms, "
+                  f"máx {max_ms:5.1f} ms")
+
+
+def print_summary(runs):
+    """Resumen por (dificultad, nivel) de todos los intentos"""
+    groups = {}
+    for columns, meta in runs:
+        groups.setdefault((meta.get('difficulty'), meta.get('level')), []).append((columns, meta))
+
+    print("\n=== Resumen ===")
+    print(f"{'dificultad':>10} {'nivel':>5} {'intentos':>8} {'superados':>9} {'duración':>9} "
+          f"{'lava min':>8} {'p95 ms':>7}")
+    for (difficulty, level), group in sorted(groups.items(), key=lambda item: str(item[0])):
+        completed = sum(1 for _, meta in group if meta.get('outcome') == 'complete')
+        durations = [float(c['t'][-1]) for c, _ in group if len(c['t'])]
+        lava_min = min((float(c['lava_distance'].min()) for c, _ in group if len(c['t'])), default=0)
+        frame_ms = np.concatenate([c['frame_ms'] for c, _ in group])
+        print(f"{str(difficulty):>10} {str(level):>5} {len(group):8d} {completed:9d} "
+              f"{np.mean(durations) if durations else 0:8.1f}s "
+              f"{lava_min:8.0f} "
+              f"{np.percentile(frame_ms, 95) if len(frame_ms) else 0:7.1f}")
+
+
+def main(paths):
+    files = collect_files(paths)
+    if not files:
+        print(f"[TelemetryReport] No hay archivos de telemetría en {paths or TELEMETRY_DIR}")
+        return 1
+    runs = []
+    for path in files:
+        try:
+            columns, meta = load_telemetry(path)
+        except Exception as e:
+            print(f"[TelemetryReport] Error leyendo {path}: {e}")
+            continue
+        print_run(path, columns, meta)
+        runs.append((columns, meta))
+    if len(runs) > 1:
+        print_summary(runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,11 +1,131 @@
 """
-tile_manager.py - Sistema que usa imágenes Blue.png y Terrain.png como tilesets
+tile_manager.py - Sistema que usa imágenes blue.png y terrain.png como tilesets
+
+El nivel de tiles se guarda en un Tilemap (rejilla NumPy, ver tilemap.py).
+Si existe Levels/tilemaps/level_<n>.npz se carga directamente; si no, las
+rutinas build_* lo construyen. Para exportarlos:
+    python -m objects.tile_manager
+
+Esa pantalla base es el pie del nivel. Con level_height el mapa se amplía
+hacia arriba con secciones procedurales (una por chunk de dibujado) que se
+generan la primera vez que se necesitan, de forma determinista a partir de
+la semilla del nivel.
 """
 
+import sys
 import pygame
 import random
-import os
 from objects.constants import *
+from objects.event_log import event_log
+from objects.memory_ledger import memory_ledger
+from objects.assets import asset_cache, tile_sprites, BLUE_TILESET_PATH, TERRAIN_TILESET_PATH
+from objects.tilemap import (Tilemap, load_level_tilemap, tilemap_path, decode_tile,
+                             EMPTY_TILE, LAYER_SOLID, LAYER_DECOR)
+
+# Fuente compartida para el ID de debug de los tiles de emergencia
+_debug_font = None
+
+# Filas de tiles por chunk pre-renderizado
+TILE_CHUNK_ROWS = 8
+# Chunks renderizados que se conservan fuera de pantalla (por arriba y por abajo)
+TILE_CHUNK_KEEP = 2
+
+# Secciones procedurales: mismo alto que un chunk; la más baja ocupa las
+# primeras filas de la pantalla base para enlazar con sus plataformas
+TILE_SECTION_ROWS = TILE_CHUNK_ROWS
+TILE_BASE_OVERLAP_ROWS = 3
+
+# Plataformas de las secciones por nivel: (ancho mínimo, ancho máximo) en tiles
+TILE_SECTION_WIDTHS = {1: (3, 5), 2: (2, 4), 3: (2, 3)}
+# Centro (en columnas) de las franjas izquierda, centro y derecha. Con
+# ±1 columna de variación y 2 tiles de ancho mínimo, el hueco entre filas
+# consecutivas nunca supera 3 tiles; con una envolvente de salto más corta
+# las plataformas se acercan a la franja vecina (_reachable_start)
+TILE_SECTION_BANDS = (6, 9, 12)
+# Franja de cada fila de plataformas: izquierda, centro, derecha, centro
+TILE_SECTION_PATTERN = (0, 1, 2, 1)
+
+
+def is_collidable_tile(tileset_type, tile_id):
+    """Determina si un tile concreto es colisionable"""
+    # Los tiles de suelo son colisionables, los decorativos no
+    if tileset_type == 'blue':
+        # Los tiles azules 0-3 son plataformas, 4+ son decoración
+        return tile_id < 4
+    elif tileset_type == 'terrain':
+        # Los tiles de terreno 0-2 son suelo, 3+ son decoración
+        return tile_id < 3
+    return True
+
+
+def extract_tile_sprite(tileset_image, tile_id, tile_size, tile_width=32, tile_height=32):
+    """Extrae y escala un tile del tileset"""
+    # Calcular posición en el tileset
+    tiles_per_row = tileset_image.get_width() // tile_width
+    tile_x = (tile_id % tiles_per_row) * tile_width
+    tile_y = (tile_id // tiles_per_row) * tile_height
+    
+    # Extraer tile
+    tile_rect = pygame.Rect(tile_x, tile_y, tile_width, tile_height)
+    tile_surface = tileset_image.subsurface(tile_rect)
+    
+    # Escalar si es necesario
+    if tile_width != tile_size or tile_height != tile_size:
+        return pygame.transform.scale(tile_surface, (tile_size, tile_size))
+    return tile_surface.copy()
+
+
+def build_fallback_tile(tileset_type, tile_id, tile_size):
+    """Dibuja el sprite de emergencia de un tile"""
+    global _debug_font
+    surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+    
+    if tileset_type == 'blue':
+        # Azules
+        colors = [
+            (100, 100, 255),  # Tile 0
+            (80, 80, 220),    # Tile 1
+            (60, 60, 200),    # Tile 2
+            (120, 120, 255),  # Tile 3
+            (150, 150, 255),  # Tile 4
+            (180, 180, 255)   # Tile 5
+        ]
+    else:  # terrain
+        # Marrones/verdes
+        colors = [
+            (139, 69, 19),    # Tile 0 - tierra
+            (34, 139, 34),    # Tile 1 - hierba
+            (160, 82, 45),    # Tile 2 - tierra oscura
+            (107, 142, 35),   # Tile 3 - hierba clara
+            (85, 107, 47),    # Tile 4 - musgo
+            (188, 143, 143)   # Tile 5 - tierra clara
+        ]
+    
+    color = colors[tile_id % len(colors)]
+    pygame.draw.rect(surf, color, (0, 0, tile_size, tile_size))
+    
+    # Patrón según ID
+    if tile_id == 1:  # Hierba
+        pygame.draw.rect(surf, (0, 100, 0), 
+                       (0, 0, tile_size, 8))
+    elif tile_id == 2:  # Tierra con piedras
+        for _ in range(5):
+            stone_x = random.randint(5, tile_size - 5)
+            stone_y = random.randint(5, tile_size - 5)
+            pygame.draw.circle(surf, (100, 100, 100), 
+                             (stone_x, stone_y), 3)
+    
+    # Borde
+    pygame.draw.rect(surf, (255, 255, 255), 
+                    (0, 0, tile_size, tile_size), 1)
+    
+    # ID de debug (una sola fuente para todos los tiles)
+    if _debug_font is None:
+        _debug_font = pygame.font.Font(None, 12)
+    id_text = _debug_font.render(str(tile_id), True, (255, 255, 255))
+    surf.blit(id_text, (5, 5))
+    
+    return surf
 
 class Tile:
     """Representa un tile individual del tileset"""
@@ -26,88 +146,28 @@ class Tile:
         
     def is_collidable(self):
         """Determina si este tile específico es colisionable"""
-        # Los tiles de suelo son colisionables, los decorativos no
-        if self.tileset_type == 'blue':
-            # Los tiles azules 0-3 son plataformas, 4+ son decoración
-            return self.tile_id < 4
-        elif self.tileset_type == 'terrain':
-            # Los tiles de terreno 0-2 son suelo, 3+ son decoración
-            return self.tile_id < 3
-        return True
+        return is_collidable_tile(self.tileset_type, self.tile_id)
     
     def load_sprite(self, tileset_image, tile_width=32, tile_height=32):
-        """Carga el sprite específico desde el tileset"""
+        """Asigna el sprite compartido (tileset, tile_id, tamaño)"""
         try:
-            # Calcular posición en el tileset
-            tiles_per_row = tileset_image.get_width() // tile_width
-            tile_x = (self.tile_id % tiles_per_row) * tile_width
-            tile_y = (self.tile_id // tiles_per_row) * tile_height
-            
-            # Extraer tile
-            tile_rect = pygame.Rect(tile_x, tile_y, tile_width, tile_height)
-            tile_surface = tileset_image.subsurface(tile_rect).copy()
-            
-            # Escalar si es necesario
-            if tile_width != self.tile_size or tile_height != self.tile_size:
-                self.sprite = pygame.transform.scale(tile_surface, 
-                                                   (self.tile_size, self.tile_size))
-            else:
-                self.sprite = tile_surface
-                
+            key = ('tile', self.tileset_type, self.tile_id, self.tile_size)
+            self.sprite = tile_sprites.get(
+                key,
+                lambda: extract_tile_sprite(tileset_image, self.tile_id, self.tile_size,
+                                            tile_width, tile_height)
+            )
         except Exception as e:
-            print(f"[Tile] Error cargando tile {self.tile_id}: {e}")
+            event_log.error('Tile', "Error cargando tile %s: %s", self.tile_id, e)
             # Crear tile de color como fallback
             self.create_fallback_sprite()
     
     def create_fallback_sprite(self):
-        """Crea un sprite simple si falla la carga"""
-        surf = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
-        
-        if self.tileset_type == 'blue':
-            # Azules
-            colors = [
-                (100, 100, 255),  # Tile 0
-                (80, 80, 220),    # Tile 1
-                (60, 60, 200),    # Tile 2
-                (120, 120, 255),  # Tile 3
-                (150, 150, 255),  # Tile 4
-                (180, 180, 255)   # Tile 5
-            ]
-        else:  # terrain
-            # Marrones/verdes
-            colors = [
-                (139, 69, 19),    # Tile 0 - tierra
-                (34, 139, 34),    # Tile 1 - hierba
-                (160, 82, 45),    # Tile 2 - tierra oscura
-                (107, 142, 35),   # Tile 3 - hierba clara
-                (85, 107, 47),    # Tile 4 - musgo
-                (188, 143, 143)   # Tile 5 - tierra clara
-            ]
-        
-        color = colors[self.tile_id % len(colors)]
-        pygame.draw.rect(surf, color, (0, 0, self.tile_size, self.tile_size))
-        
-        # Patrón según ID
-        if self.tile_id == 1:  # Hierba
-            pygame.draw.rect(surf, (0, 100, 0), 
-                           (0, 0, self.tile_size, 8))
-        elif self.tile_id == 2:  # Tierra con piedras
-            for _ in range(5):
-                stone_x = random.randint(5, self.tile_size - 5)
-                stone_y = random.randint(5, self.tile_size - 5)
-                pygame.draw.circle(surf, (100, 100, 100), 
-                                 (stone_x, stone_y), 3)
-        
-        # Borde
-        pygame.draw.rect(surf, (255, 255, 255), 
-                        (0, 0, self.tile_size, self.tile_size), 1)
-        
-        # ID de debug
-        font = pygame.font.Font(None, 12)
-        id_text = font.render(str(self.tile_id), True, (255, 255, 255))
-        surf.blit(id_text, (5, 5))
-        
-        self.sprite = surf
+        """Asigna un sprite simple compartido si falla la carga"""
+        key = ('tile_fallback', self.tileset_type, self.tile_id, self.tile_size)
+        self.sprite = tile_sprites.get(
+            key, lambda: build_fallback_tile(self.tileset_type, self.tile_id, self.tile_size)
+        )
     
     def get_rect(self):
         """Retorna rectángulo de colisión"""
@@ -127,67 +187,123 @@ class Tile:
                 pygame.draw.rect(surface, color,
                                (self.x, screen_y, self.width, self.height))
 
+class TilePlatform:
+    """
+    Tramo de tiles caminable. Expone lo mismo que Platform para la
+    generación (centro x/y, ancho) y para la colisión del jugador.
+    """
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.x = self.rect.centerx
+        self.y = self.rect.centery
+        self.width = width
+        self.height = height
+        self.touched = False
+    
+    def get_rect(self):
+        return self.rect
+
 class TileManager:
     """Gestiona todo el sistema de tiles del nivel"""
     
-    def __init__(self, level_number):
+    def __init__(self, level_number, level_height=None, tilemap=None, use_file=True, seed=None,
+                 envelope=None):
+        """
+        Args:
+            level_number: Número del nivel (elige tilemap y tema)
+            level_height: Altura total del nivel en píxeles; si supera la
+                          pantalla base se añaden secciones por encima
+            tilemap: Tilemap ya construido (opcional)
+            use_file: False para ignorar Levels/tilemaps y construirlo
+            seed: Semilla de las partes aleatorias (misma semilla, mismo mapa)
+            envelope: JumpEnvelope del jugador (Levels/reachability.py). Si
+                      la subida máxima no llega a dos filas, las secciones
+                      ponen una plataforma en cada fila, y cada plataforma
+                      queda al alcance de las filas vecinas
+        """
         self.level_number = level_number
         self.tile_size = 64
-        self.tiles = []
-        self.platform_tiles = []  # Tiles que funcionan como plataformas
-        
-        # Cargar tilesets
+        self.envelope = envelope
+        self.row_step = 2 if envelope is None or envelope.max_rise >= 2 * self.tile_size else 1
+        self.final_platform = None
+        self.seed = random.randrange(1 << 30) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        
+        # Tramos caminables de las filas ya generadas (crece con cada sección)
+        self.platform_list = []
+        self.platforms_by_row = {}
+        self.sections_ready = []   # Secciones procedurales ya generadas
+        self.on_section_built = None   # callback(índice, tramos, (y_min, y_max))
+        
+        # Tilesets: se cargan al dibujar por primera vez, así el manager se
+        # puede crear en el hilo de pre-generación sin tocar superficies
         self.blue_tileset = None
         self.terrain_tileset = None
-        self.load_tilesets()
-        
-        # Construir nivel
-        self.build_level()
+        self.tilesets_loaded = False
+        
+        # Tilemap: el indicado, el archivo del nivel o construido por código
+        if tilemap is None and use_file:
+            tilemap = load_level_tilemap(level_number)
+        self.tilemap = tilemap
+        if self.tilemap is not None:
+            self.tile_size = self.tilemap.tile_size
+            event_log.info('TileManager', "Tilemap del nivel %s cargado (%sx%s)", level_number,
+                           self.tilemap.rows, self.tilemap.cols)
+        else:
+            self.tilemap = Tilemap.empty(SCREEN_WIDTH + self.tile_size, 0,
+                                         SCREEN_HEIGHT, self.tile_size)
+            self.build_level()
+        
+        final = self.tilemap.meta.get('final')
+        if final:
+            self.final_platform = pygame.Rect(final[0], final[1], self.tile_size, self.tile_size)
+        
+        # Secciones procedurales por encima de la pantalla base
+        self.level_height = level_height
+        if level_height:
+            self.extend_to_height(level_height)
+        
+        # Superficies por chunk (se renderizan al primer dibujado)
+        self.chunks = {}
+        memory_ledger.track('tiles', self, 'chunks', 'tilemap.layers')
+        self._refresh_platforms(0, self.tilemap.rows)
     
     def load_tilesets(self):
-        """Carga las imágenes de los tilesets"""
+        """Obtiene los tilesets de la caché de assets (compartidos entre niveles)"""
+        self.tilesets_loaded = True
         try:
-            # Cargar Blue.png
-            blue_path = "./Assets/Terrain/Blue.png"
-            if os.path.exists(blue_path):
-                self.blue_tileset = pygame.image.load(blue_path).convert_alpha()
-                print(f"[TileManager] Blue tileset cargado: {blue_path}")
-            else:
-                print(f"[TileManager] No se encontró {blue_path}")
-                
-            # Cargar Terrain.png
-            terrain_path = "./Assets/Terrain/Terrain.png"
-            if os.path.exists(terrain_path):
-                self.terrain_tileset = pygame.image.load(terrain_path).convert_alpha()
-                print(f"[TileManager] Terrain tileset cargado: {terrain_path}")
-            else:
-                print(f"[TileManager] No se encontró {terrain_path}")
-                
+            self.blue_tileset = asset_cache.image(BLUE_TILESET_PATH)
         except Exception as e:
-            print(f"[TileManager ERROR] No se pudieron cargar tilesets: {e}")
-    
-    def create_tile(self, x, y, tile_id, tileset_type):
-        """Crea un tile y carga su sprite"""
-        tile = Tile(x, y, tile_id, tileset_type, self.tile_size)
-        
-        # Cargar sprite del tileset correspondiente
-        if tileset_type == 'blue' and self.blue_tileset:
-            tile.load_sprite(self.blue_tileset, 32, 32)
-        elif tileset_type == 'terrain' and self.terrain_tileset:
-            tile.load_sprite(self.terrain_tileset, 32, 32)
-        else:
-            tile.create_fallback_sprite()
-        
-        # Añadir a listas
-        self.tiles.append(tile)
-        if tile.collidable:
-            self.platform_tiles.append(tile)
+            event_log.warning('TileManager', "No se encontró %s: %s", BLUE_TILESET_PATH, e)
         
-        return tile
+        try:
+            self.terrain_tileset = asset_cache.image(TERRAIN_TILESET_PATH)
+        except Exception as e:
+            event_log.warning('TileManager', "No se encontró %s: %s", TERRAIN_TILESET_PATH, e)
+    
+    def create_tile(self, x, y, tile_id, tileset_type, layer=None):
+        """
+        Coloca un tile en el tilemap (capa sólida o decorativa según el tile).
+        
+        Returns:
+            pygame.Rect de la celda, o None si cae fuera del mapa
+        """
+        if layer is None:
+            layer = LAYER_SOLID if is_collidable_tile(tileset_type, tile_id) else LAYER_DECOR
+        cell = self.tilemap.set_tile(layer, x, y, tileset_type, tile_id)
+        if cell is None:
+            return None
+        return pygame.Rect(self.tilemap.cell_rect(*cell))
+    
+    def mark_final(self, rect):
+        """Marca la celda de la plataforma final (se guarda en los metadatos)"""
+        if rect is not None:
+            self.final_platform = rect
+            self.tilemap.meta['final'] = [rect.x, rect.y]
     
     def build_level(self):
         """Construye el nivel usando tiles"""
-        print(f"[TileManager] Construyendo nivel {self.level_number} con tiles...")
+        event_log.info('TileManager', "Construyendo nivel %s con tiles...", self.level_number)
         
         if self.level_number == 1:
             self.build_forest_level()
@@ -200,7 +316,7 @@ class TileManager:
     
     def build_forest_level(self):
         """Nivel 1: Bosque con tiles de terreno"""
-        print("[TileManager] Construyendo bosque...")
+        event_log.info('TileManager', "Construyendo bosque...")
         
         # ============================================
         # 🌳 SUELO BASE (Terrain tiles)
@@ -247,25 +363,24 @@ class TileManager:
                     tile = self.create_tile(tile_x, tile_y, tile_id, 'blue')
                     
                     if is_final and col == width // 2 and row == 0:
-                        self.final_platform = tile
+                        self.mark_final(tile)
         
         # ============================================
         # 🌿 DECORACIÓN (Terrain tiles decorativos)
         # ============================================
         for _ in range(20):
-            x = random.randint(0, SCREEN_WIDTH - self.tile_size)
-            y = random.randint(0, SCREEN_HEIGHT - 300)
+            x = self.rng.randint(0, SCREEN_WIDTH - self.tile_size)
+            y = self.rng.randint(0, SCREEN_HEIGHT - 300)
             
             # Verificar que no colisione
             if not self.check_collision_at(x, y):
                 # Usar tiles decorativos (ID 3-5)
-                tile_id = random.choice([3, 4, 5])
-                tile = self.create_tile(x, y, tile_id, 'terrain')
-                tile.collidable = False  # Decoración no colisionable
+                tile_id = self.rng.choice([3, 4, 5])
+                self.create_tile(x, y, tile_id, 'terrain', LAYER_DECOR)  # Decoración no colisionable
     
     def build_cave_level(self):
         """Nivel 2: Caverna con mezcla de tiles"""
-        print("[TileManager] Construyendo caverna...")
+        event_log.info('TileManager', "Construyendo caverna...")
         
         # ============================================
         # 🗿 PAREDES Y SUELO (Terrain tiles)
@@ -281,7 +396,7 @@ class TileManager:
         # Suelo rocoso
         for x in range(self.tile_size, SCREEN_WIDTH - self.tile_size, self.tile_size):
             y = SCREEN_HEIGHT - self.tile_size
-            tile_id = random.choice([2, 4, 5])  # Variedad de tierra/piedra
+            tile_id = self.rng.choice([2, 4, 5])  # Variedad de tierra/piedra
             tile = self.create_tile(x, y, tile_id, 'terrain')
         
         # ============================================
@@ -311,24 +426,23 @@ class TileManager:
                     tile = self.create_tile(tile_x, tile_y, tile_id, 'blue')
                     
                     if is_exit and col == width // 2:
-                        self.final_platform = tile
+                        self.mark_final(tile)
         
         # ============================================
         # 🔦 ILUMINACIÓN (Blue tiles decorativos)
         # ============================================
         for _ in range(10):
-            x = random.randint(100, SCREEN_WIDTH - 100)
-            y = random.randint(100, 400)
+            x = self.rng.randint(100, SCREEN_WIDTH - 100)
+            y = self.rng.randint(100, 400)
             
             if not self.check_collision_at(x, y):
                 # Tiles azules brillantes como luz
-                tile_id = random.choice([4, 5])
-                tile = self.create_tile(x, y, tile_id, 'blue')
-                tile.collidable = False
+                tile_id = self.rng.choice([4, 5])
+                self.create_tile(x, y, tile_id, 'blue', LAYER_DECOR)
     
     def build_storm_level(self):
         """Nivel 3: Tormenta con plataformas flotantes"""
-        print("[TileManager] Construyendo nivel de tormenta...")
+        event_log.info('TileManager', "Construyendo nivel de tormenta...")
         
         # ============================================
         # ☁️ PLATAFORMAS FLOTANTES (Blue tiles)
@@ -362,24 +476,23 @@ class TileManager:
                     tile = self.create_tile(tile_x, tile_y, tile_id, 'blue')
                     
                     if is_top and col == width // 2:
-                        self.final_platform = tile
+                        self.mark_final(tile)
         
         # ============================================
         # ⚡ NUBES Y RAYOS (Terrain tiles decorativos)
         # ============================================
         for _ in range(15):
-            x = random.randint(0, SCREEN_WIDTH - self.tile_size)
-            y = random.randint(50, SCREEN_HEIGHT - 200)
+            x = self.rng.randint(0, SCREEN_WIDTH - self.tile_size)
+            y = self.rng.randint(50, SCREEN_HEIGHT - 200)
             
-            if random.random() > 0.5:  # 50% probabilidad
+            if self.rng.random() > 0.5:  # 50% probabilidad
                 # Nubes (tiles claros)
-                tile_id = random.choice([4, 5])
-                tile = self.create_tile(x, y, tile_id, 'terrain')
-                tile.collidable = False
+                tile_id = self.rng.choice([4, 5])
+                self.create_tile(x, y, tile_id, 'terrain', LAYER_DECOR)
     
     def build_default_level(self):
         """Nivel por defecto"""
-        print("[TileManager] Construyendo nivel por defecto...")
+        event_log.info('TileManager', "Construyendo nivel por defecto...")
         
         # Suelo simple
         for x in range(0, SCREEN_WIDTH + self.tile_size, self.tile_size):
@@ -398,29 +511,290 @@ class TileManager:
                 tile = self.create_tile(tile_x, y, tile_id, 'blue')
                 
                 if i == 4 and j == 1:
-                    self.final_platform = tile
+                    self.mark_final(tile)
+    
+    # ============================================
+    # 🧗 SECCIONES PROCEDURALES (NIVELES ALTOS)
+    # ============================================
+    
+    def extend_to_height(self, level_height):
+        """
+        Amplía el mapa hacia arriba hasta cubrir level_height píxeles con
+        secciones de TILE_SECTION_ROWS filas. Cada sección se genera la
+        primera vez que se consultan o dibujan sus filas (_ensure_rows); la
+        cima se genera ya porque lleva la plataforma final. on_section_built
+        avisa al nivel de cada sección nueva para que planifique su contenido.
+        """
+        section_height = TILE_SECTION_ROWS * self.tile_size
+        overlap = TILE_BASE_OVERLAP_ROWS * self.tile_size
+        missing = int(level_height) - (SCREEN_HEIGHT - self.tilemap.origin_y - overlap)
+        sections = max(0, -(-missing // section_height))
+        if not sections:
+            return
+        
+        self.tilemap.extend_up(sections * TILE_SECTION_ROWS - TILE_BASE_OVERLAP_ROWS)
+        self.sections_ready = [False] * sections
+        
+        # La meta de la pantalla base deja de serlo: la nueva está en la cima
+        self.tilemap.meta.pop('final', None)
+        self.final_platform = None
+        self._ensure_rows(0, TILE_SECTION_ROWS)
+        event_log.info('TileManager', "Nivel %s ampliado a %spx (%s secciones)", self.level_number,
+                       self.tilemap.height, sections)
+    
+    def _ensure_rows(self, first_row, last_row):
+        """Genera las secciones pendientes que tocan las filas [first_row, last_row)"""
+        first = max(0, first_row // TILE_SECTION_ROWS)
+        last = min(len(self.sections_ready), -(-last_row // TILE_SECTION_ROWS))
+        for index in range(first, last):
+            if not self.sections_ready[index]:
+                self._build_section(index)
+    
+    def ensure_all(self):
+        """Genera todas las secciones pendientes (planificar el nivel entero)"""
+        self._ensure_rows(0, self.tilemap.rows)
+        return self.platform_list
+    
+    def _build_section(self, index):
+        """
+        Genera una sección: una plataforma cada row_step filas alternando
+        franjas (izquierda, centro, derecha, centro) para que cada salto sea
+        alcanzable. La sección 0 es la cima, con la plataforma final.
+        """
+        self.sections_ready[index] = True
+        rng = random.Random(self.seed * 1009 + index)
+        ts = self.tile_size
+        first_row = index * TILE_SECTION_ROWS
+        last_col = SCREEN_WIDTH // ts - 1
+        min_width, max_width = TILE_SECTION_WIDTHS.get(self.level_number, (3, 5))
+        
+        # La caverna sigue teniendo paredes a ambos lados
+        if self.level_number == 2:
+            for row in range(first_row, first_row + TILE_SECTION_ROWS):
+                y = self.tilemap.origin_y + row * ts
+                self.create_tile(0, y, 2, 'terrain')
+                self.create_tile(last_col * ts, y, 2, 'terrain')
+        
+        for local_row in range(TILE_SECTION_ROWS - 1, -1, -self.row_step):
+            row = first_row + local_row
+            y = self.tilemap.origin_y + row * ts
+            
+            if index == 0 and local_row < 3:
+                continue  # Hueco sobre la cima para el castillo y la bandera
+            if index == 0 and local_row == 3:
+                # ============================================
+                # 🏰 CIMA
+                # ============================================
+                width = max_width + 1
+                start = TILE_SECTION_BANDS[1] - width // 2
+                for col in range(width):
+                    tile = self.create_tile((start + col) * ts, y,
+                                            self._section_tile_id(col, width, row), 'blue')
+                    if col == width // 2:
+                        self.mark_final(tile)
+                continue
+            
+            band = self._row_band(row)
+            width = rng.randint(min_width, max_width)
+            start = band - width // 2 + rng.randint(-1, 1)
+            start = self._reachable_start(row, width, start, min_width)
+            start = max(1, min(last_col - width, start))
+            for col in range(width):
+                self.create_tile((start + col) * ts, y,
+                                 self._section_tile_id(col, width, row), 'blue')
+        
+        # Decoración en celdas libres
+        decor_tileset, decor_ids = {
+            2: ('blue', (4, 5)),
+            3: ('terrain', (4, 5)),
+        }.get(self.level_number, ('terrain', (3, 4, 5)))
+        for _ in range(2):
+            row = first_row + rng.randrange(TILE_SECTION_ROWS)
+            col = rng.randint(1, last_col - 1)
+            if (self.tilemap.layers[:, row, col] == EMPTY_TILE).all():
+                self.create_tile(col * ts, self.tilemap.origin_y + row * ts,
+                                 rng.choice(decor_ids), decor_tileset, LAYER_DECOR)
+        
+        # La fila de debajo también cambia: ahora puede tener un sólido encima
+        self._refresh_platforms(first_row, first_row + TILE_SECTION_ROWS + 1)
+        
+        if self.on_section_built:
+            self.on_section_built(index, *self.section_area(index))
+    
+    def _refresh_platforms(self, first_row, last_row):
+        """Recalcula los tramos caminables de las filas [first_row, last_row)"""
+        stale = set()
+        for row in range(first_row, last_row):
+            stale.update(id(platform) for platform in self.platforms_by_row.pop(row, ()))
+        if stale:
+            # En el sitio: Level.tile_platforms es esta misma lista
+            self.platform_list[:] = [p for p in self.platform_list if id(p) not in stale]
+        for run in self.tilemap.platform_runs(first_row, last_row):
+            platform = TilePlatform(*run)
+            self.platform_list.append(platform)
+            row, _ = self.tilemap.cell_at(run[0], run[1])
+            self.platforms_by_row.setdefault(row, []).append(platform)
+    
+    def _row_band(self, row):
+        """Columna central de la franja de una fila de plataformas"""
+        if row == 3:
+            return TILE_SECTION_BANDS[1]   # La cima (sección 0) va centrada
+        return TILE_SECTION_BANDS[TILE_SECTION_PATTERN[(row // self.row_step) % 4]]
+    
+    def _reachable_start(self, row, width, start, min_width):
+        """
+        Acerca start a las franjas de las filas vecinas (row ± row_step) lo
+        necesario para que el hueco con ellas quepa en la envolvente, aunque
+        la vecina tenga el peor caso (ancho mínimo y variación en contra).
+        No depende de cómo salieron las vecinas, así que cada sección se
+        puede generar por separado.
+        """
+        if self.envelope is None:
+            return start
+        ts = self.tile_size
+        max_cols = self.envelope.max_gap(self.row_step * ts) // ts
+        low, high = -self.tilemap.cols, 2 * self.tilemap.cols
+        for neighbour in (row - self.row_step, row + self.row_step):
+            band = self._row_band(neighbour)
+            # Peor caso de la vecina: 1 columna más lejos y ancho mínimo
+            neighbour_left = band - min_width // 2 + 1
+            neighbour_right = band - min_width // 2 - 1 + min_width
+            low = max(low, neighbour_left - max_cols - width)
+            high = min(high, neighbour_right + max_cols)
+        if low > high:
+            event_log.warning('TileManager', "Fila %s: ninguna posición queda al alcance de "
+                              "las dos filas vecinas", row)
+        return max(low, min(high, start)) if low <= high else (low + high) // 2
+    
+    def _section_tile_id(self, col, width, row):
+        """Tile azul colisionable de una plataforma de sección según el tema"""
+        if self.level_number == 2:
+            return (row + col) % 4           # Cristales variados
+        if self.level_number == 3:
+            return (3 + col) % 4             # Tiles eléctricos
+        # Bosque: esquinas y centro como en la pantalla base
+        return 0 if col == 0 else 2 if col == width - 1 else 1
+    
+    # ============================================
+    # 💥 CONSULTAS
+    # ============================================
     
     def check_collision_at(self, x, y):
-        """Verifica si hay colisión en una posición"""
-        test_rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
-        
-        for tile in self.tiles:
-            if tile.collidable and tile.get_rect().colliderect(test_rect):
-                return True
-        return False
+        """Verifica si hay colisión en una posición (consulta a la rejilla)"""
+        row, _ = self.tilemap.cell_at(x, y)
+        self._ensure_rows(row, row + 2)
+        return self.tilemap.any_solid(x, y, self.tile_size, self.tile_size)
     
     def get_platforms(self):
-        """Retorna tiles colisionables como plataformas"""
-        return self.platform_tiles
+        """
+        Superficies caminables (tramos de tiles fusionados) de las secciones
+        ya generadas. La lista es siempre la misma y crece al generar más.
+        """
+        return self.platform_list
+    
+    def platforms_near(self, rect, margin=None):
+        """
+        Tramos caminables en las filas que toca rect (ampliado en margin).
+        Consulta por fila de la rejilla: no depende del número de tramos.
+        Genera las secciones de esas filas si aún no existen.
+        """
+        margin = self.tile_size if margin is None else margin
+        first_row, last_row, _, _ = self.tilemap.cell_range(
+            rect.x, rect.y - margin, max(1, rect.width), rect.height + 2 * margin)
+        self._ensure_rows(first_row, last_row)
+        near = []
+        for row in range(first_row, last_row):
+            near.extend(self.platforms_by_row.get(row, ()))
+        return near
+    
+    def rows_platforms(self, first_row, last_row):
+        """Tramos ya generados de las filas [first_row, last_row), sin generar nada"""
+        platforms = []
+        for row in range(first_row, last_row):
+            platforms.extend(self.platforms_by_row.get(row, ()))
+        return platforms
+    
+    def rows_y_range(self, first_row, last_row):
+        """(y_min, y_max) en el mundo de las filas [first_row, last_row)"""
+        origin, ts = self.tilemap.origin_y, self.tile_size
+        return origin + first_row * ts, origin + last_row * ts
+    
+    def section_area(self, index):
+        """(tramos, (y_min, y_max)) de una sección ya generada"""
+        first_row = index * TILE_SECTION_ROWS
+        last_row = first_row + TILE_SECTION_ROWS
+        # La primera fila puede quedar tapada al generar la sección de encima
+        return self.rows_platforms(first_row + 1, last_row), self.rows_y_range(first_row, last_row)
+    
+    def base_area(self):
+        """(tramos, (y_min, y_max)) de la pantalla base que no cubre ninguna sección"""
+        first_row = len(self.sections_ready) * TILE_SECTION_ROWS
+        last_row = self.tilemap.rows
+        return self.rows_platforms(first_row, last_row), self.rows_y_range(first_row, last_row)
     
     def get_final_platform(self):
         """Retorna la plataforma final"""
         return self.final_platform
     
+    # ============================================
+    # 🎨 DIBUJADO POR CHUNKS
+    # ============================================
+    
+    def _tile_sprite(self, tileset_type, tile_id):
+        """Sprite compartido de un tile (del tileset o de emergencia)"""
+        if not self.tilesets_loaded:
+            self.load_tilesets()
+        tileset = self.blue_tileset if tileset_type == 'blue' else self.terrain_tileset
+        
+        def create():
+            if tileset is not None:
+                try:
+                    return extract_tile_sprite(tileset, tile_id, self.tile_size)
+                except Exception as e:
+                    event_log.error('Tile', "Error cargando tile %s: %s", tile_id, e)
+            # Se guarda bajo la misma clave: el error solo se reporta una vez
+            return build_fallback_tile(tileset_type, tile_id, self.tile_size)
+        
+        return tile_sprites.get(('tile', tileset_type, tile_id, self.tile_size), create)
+    
+    def _render_chunk(self, index):
+        """Pre-renderiza un chunk de filas en una sola superficie (None si está vacío)"""
+        first_row = index * TILE_CHUNK_ROWS
+        block = self.tilemap.layers[:, first_row:first_row + TILE_CHUNK_ROWS]
+        if not (block != EMPTY_TILE).any():
+            return None
+        
+        surf = pygame.Surface((self.tilemap.width, block.shape[1] * self.tile_size),
+                              pygame.SRCALPHA)
+        # Decoración detrás, sólidos delante
+        for layer in (LAYER_DECOR, LAYER_SOLID):
+            rows, cols = (block[layer] != EMPTY_TILE).nonzero()
+            for row, col in zip(rows, cols):
+                tileset_type, tile_id = decode_tile(block[layer, row, col])
+                surf.blit(self._tile_sprite(tileset_type, tile_id),
+                          (int(col) * self.tile_size, int(row) * self.tile_size))
+        return surf.convert_alpha()
+    
     def draw(self, surface, camera_y=0):
-        """Dibuja todos los tiles"""
-        for tile in self.tiles:
-            tile.draw(surface, camera_y)
+        """Dibuja los chunks visibles"""
+        chunk_height = TILE_CHUNK_ROWS * self.tile_size
+        origin_y = self.tilemap.origin_y
+        first = max(0, int((camera_y - origin_y) // chunk_height))
+        last = min((self.tilemap.rows - 1) // TILE_CHUNK_ROWS,
+                   int((camera_y + SCREEN_HEIGHT - origin_y) // chunk_height))
+        
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                self._ensure_rows(index * TILE_CHUNK_ROWS, (index + 1) * TILE_CHUNK_ROWS)
+                self.chunks[index] = self._render_chunk(index)
+            chunk = self.chunks[index]
+            if chunk is not None:
+                surface.blit(chunk, (0, origin_y + index * chunk_height - camera_y))
+        
+        # Liberar los chunks que quedaron lejos de la cámara
+        for index in [i for i in self.chunks
+                      if i < first - TILE_CHUNK_KEEP or i > last + TILE_CHUNK_KEEP]:
+            del self.chunks[index]
     
     def draw_background(self, surface, camera_y=0):
         """Dibuja fondo según nivel"""
@@ -441,4 +815,23 @@ class TileManager:
                 g = int(100 * (1 - y/SCREEN_HEIGHT) + 60 * (y/SCREEN_HEIGHT))
                 b = int(150 * (1 - y/SCREEN_HEIGHT) + 100 * (y/SCREEN_HEIGHT))
             
-            pygame.draw.line(surface, (r, g, b), (0, screen_y), (SCREEN_WIDTH, screen_y))
\ No newline at end of file
+            pygame.draw.line(surface, (r, g, b), (0, screen_y), (SCREEN_WIDTH, screen_y))
+
+
+def export_level_tilemaps(levels=(1, 2, 3)):
+    """
+    Construye los tilemaps de los niveles con las rutinas build_* y los
+    guarda en Levels/tilemaps/ para que el juego solo tenga que leerlos.
+    """
+    for level_number in levels:
+        manager = TileManager(level_number, use_file=False)
+        path = tilemap_path(level_number)
+        manager.tilemap.save(path)
+        event_log.info('TileManager', "Tilemap guardado en %s", path)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    export_level_tilemaps([int(arg) for arg in sys.argv[1:]] or (1, 2, 3))
+    pygame.quit()
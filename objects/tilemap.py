@@ -0,0 +1,239 @@
+"""
+tilemap.py - Formato de tilemap basado en una rejilla NumPy
+
+Un tilemap es un array 2D por capa con los IDs de tile de cada celda más
+unos metadatos. Se guarda como .npz:
+
+    layers: int16 (capas, filas, columnas); EMPTY_TILE = celda vacía y
+            cualquier otro valor = índice_tileset * TILESET_STRIDE + tile_id
+    meta:   JSON con tile_size, origin_y, tilesets, capas y celda final
+
+La capa 'solid' define directamente la rejilla booleana de colisión, así
+que preguntar si un punto es sólido es una consulta O(1) a una celda.
+Este módulo solo maneja datos (sin pygame); el dibujado por chunks vive
+en tile_manager.py.
+"""
+
+import os
+import json
+import numpy as np
+
+TILEMAP_VERSION = 1
+TILEMAP_DIR = "./Levels/tilemaps"
+
+EMPTY_TILE = -1
+TILESET_STRIDE = 256
+TILEMAP_TILESETS = ('blue', 'terrain')
+
+# Capas: la sólida colisiona, la decorativa solo se dibuja
+LAYER_SOLID = 0
+LAYER_DECOR = 1
+TILEMAP_LAYERS = ('solid', 'decor')
+
+
+def encode_tile(tileset_type, tile_id):
+    """Valor de celda para un tile de un tileset"""
+    return TILEMAP_TILESETS.index(tileset_type) * TILESET_STRIDE + tile_id
+
+
+def decode_tile(value):
+    """(tileset, tile_id) de un valor de celda no vacío"""
+    return TILEMAP_TILESETS[int(value) // TILESET_STRIDE], int(value) % TILESET_STRIDE
+
+
+def tilemap_path(level_number, tilemap_dir=TILEMAP_DIR):
+    """Ruta del tilemap de un nivel"""
+    return os.path.join(tilemap_dir, f"level_{level_number}.npz")
+
+
+class Tilemap:
+    """
+    Rejilla de tiles por capas con su rejilla de colisión.
+    Las coordenadas de mundo se convierten a celdas con tile_size y origin_y
+    (la fila 0 empieza en origin_y; x siempre empieza en 0).
+    """
+
+    def __init__(self, layers, tile_size=64, origin_y=0, meta=None):
+        self.layers = np.asarray(layers, dtype=np.int16)
+        self.tile_size = int(tile_size)
+        self.origin_y = int(origin_y)
+        self.meta = dict(meta or {})
+        self.update_collision()
+
+    @classmethod
+    def empty(cls, width, top_y, bottom_y, tile_size=64):
+        """
+        Tilemap vacío que cubre [0, width) x [top_y, bottom_y) en píxeles.
+        """
+        origin_y = int(top_y // tile_size) * tile_size
+        rows = max(1, -(-(int(bottom_y) - origin_y) // tile_size))
+        cols = max(1, -(-int(width) // tile_size))
+        layers = np.full((len(TILEMAP_LAYERS), rows, cols), EMPTY_TILE, dtype=np.int16)
+        return cls(layers, tile_size, origin_y)
+
+    @property
+    def rows(self):
+        return self.layers.shape[1]
+
+    @property
+    def cols(self):
+        return self.layers.shape[2]
+
+    @property
+    def width(self):
+        return self.cols * self.tile_size
+
+    @property
+    def height(self):
+        return self.rows * self.tile_size
+
+    # ============================================
+    # 🧭 CELDAS Y COORDENADAS
+    # ============================================
+
+    def cell_at(self, x, y):
+        """(fila, columna) de un punto del mundo (puede quedar fuera del mapa)"""
+        return int((y - self.origin_y) // self.tile_size), int(x // self.tile_size)
+
+    def cell_rect(self, row, col):
+        """(x, y, ancho, alto) de una celda en coordenadas de mundo"""
+        return (col * self.tile_size, self.origin_y + row * self.tile_size,
+                self.tile_size, self.tile_size)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def set_tile(self, layer, x, y, tileset_type, tile_id):
+        """
+        Coloca un tile en la celda que contiene (x, y).
+
+        Returns:
+            (fila, columna) o None si cae fuera del mapa
+        """
+        row, col = self.cell_at(x, y)
+        if not self.in_bounds(row, col):
+            return None
+        self.layers[layer, row, col] = encode_tile(tileset_type, tile_id)
+        if layer == LAYER_SOLID:
+            self.collision[row, col] = True
+        return row, col
+
+    def update_collision(self):
+        """Recalcula la rejilla de colisión desde la capa sólida"""
+        self.collision = self.layers[LAYER_SOLID] != EMPTY_TILE
+
+    def extend_up(self, rows):
+        """Añade filas vacías por encima del mapa (el origen sube con ellas)"""
+        if rows <= 0:
+            return
+        top = np.full((self.layers.shape[0], rows, self.cols), EMPTY_TILE, dtype=np.int16)
+        self.layers = np.concatenate((top, self.layers), axis=1)
+        self.origin_y -= rows * self.tile_size
+        self.update_collision()
+
+    # ============================================
+    # 💥 CONSULTAS DE COLISIÓN
+    # ============================================
+
+    def is_solid(self, x, y):
+        """True si el punto (x, y) cae en una celda sólida. O(1)"""
+        row, col = self.cell_at(x, y)
+        return self.in_bounds(row, col) and bool(self.collision[row, col])
+
+    def cell_range(self, x, y, width, height):
+        """Rango de celdas (filas, columnas) que toca un rectángulo, recortado al mapa"""
+        row0, col0 = self.cell_at(x, y)
+        row1, col1 = self.cell_at(x + width - 1, y + height - 1)
+        return (max(0, row0), min(self.rows, row1 + 1),
+                max(0, col0), min(self.cols, col1 + 1))
+
+    def any_solid(self, x, y, width, height):
+        """True si algún punto del rectángulo toca una celda sólida"""
+        row0, row1, col0, col1 = self.cell_range(x, y, width, height)
+        if row0 >= row1 or col0 >= col1:
+            return False
+        return bool(self.collision[row0:row1, col0:col1].any())
+
+    def solid_cells_in_rect(self, x, y, width, height):
+        """Celdas sólidas (fila, columna) que toca un rectángulo"""
+        row0, row1, col0, col1 = self.cell_range(x, y, width, height)
+        if row0 >= row1 or col0 >= col1:
+            return []
+        rows, cols = np.nonzero(self.collision[row0:row1, col0:col1])
+        return [(int(r) + row0, int(c) + col0) for r, c in zip(rows, cols)]
+
+    def platform_runs(self, first_row=0, last_row=None):
+        """
+        Superficies caminables: tramos horizontales de celdas sólidas sin
+        otra celda sólida encima, fusionados en un solo rectángulo por tramo.
+
+        Args:
+            first_row, last_row: Filas [first_row, last_row) a recorrer
+                (por defecto todo el mapa)
+
+        Returns:
+            list de (x, y, ancho, alto)
+        """
+        last_row = self.rows if last_row is None else min(last_row, self.rows)
+        first_row = max(0, first_row)
+        if first_row >= last_row:
+            return []
+        top = self.collision[first_row:last_row].copy()
+        if first_row > 0:
+            top &= ~self.collision[first_row - 1:last_row - 1]
+        else:
+            top[1:] &= ~self.collision[:last_row - 1]
+
+        runs = []
+        padded = np.zeros((last_row - first_row, self.cols + 2), dtype=np.int8)
+        padded[:, 1:-1] = top
+        edges = np.diff(padded, axis=1)
+        for offset in range(last_row - first_row):
+            starts = np.flatnonzero(edges[offset] == 1)
+            ends = np.flatnonzero(edges[offset] == -1)
+            for start, end in zip(starts, ends):
+                runs.append((int(start) * self.tile_size,
+                             self.origin_y + (first_row + offset) * self.tile_size,
+                             int(end - start) * self.tile_size,
+                             self.tile_size))
+        return runs
+
+    # ============================================
+    # 💾 GUARDAR / CARGAR
+    # ============================================
+
+    def save(self, path):
+        """Guarda el tilemap en un .npz comprimido"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        meta = dict(self.meta, version=TILEMAP_VERSION, tile_size=self.tile_size,
+                    origin_y=self.origin_y, tilesets=list(TILEMAP_TILESETS),
+                    layers=list(TILEMAP_LAYERS))
+        with open(path, "wb") as f:
+            np.savez_compressed(f, layers=self.layers, meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, path):
+        """Carga un tilemap (una sola lectura del array)"""
+        with np.load(path, allow_pickle=False) as data:
+            layers = data['layers']
+            meta = json.loads(str(data['meta']))
+
+        if meta.get('version') != TILEMAP_VERSION:
+            raise ValueError(f"{path}: versión de tilemap {meta.get('version')} no soportada")
+        if tuple(meta.get('tilesets', TILEMAP_TILESETS)) != TILEMAP_TILESETS:
+            raise ValueError(f"{path}: tilesets {meta.get('tilesets')} no soportados")
+        return cls(layers, meta['tile_size'], meta['origin_y'], meta)
+
+
+def load_level_tilemap(level_number, tilemap_dir=TILEMAP_DIR):
+    """Tilemap de un nivel si existe el archivo; None en caso contrario"""
+    path = tilemap_path(level_number, tilemap_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        return Tilemap.load(path)
+    except Exception as e:
+        print(f"[Tilemap] Error cargando {path}: {e}")
+        return None
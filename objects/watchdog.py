@@ -0,0 +1,198 @@
+"""
+watchdog.py - Detector de picos de frame con muestreo de pila
+
+Cuando el trabajo de un frame supera SPIKE_THRESHOLD_MS se guarda en
+SPIKE_LOG_FILE (una línea JSON por pico) por qué fue lento:
+  - la duración de cada fase (eventos, update, draw, flip) y la más lenta;
+  - muestras de la pila del hilo principal tomadas durante ese frame;
+  - las pausas del GC ocurridas en el frame;
+  - un recuento de entidades y partículas y el estado del juego
+    (lo aporta Game.spike_snapshot).
+
+El muestreo lo hace un hilo que se despierta una vez por frame: si el
+frame sigue en curso pasada la mitad del umbral, copia la pila del hilo
+principal (sys._current_frames) cada SPIKE_SAMPLE_INTERVAL segundos hasta
+que termine. Los frames normales no pagan más que un Event.set(). La
+escritura del registro también va en un hilo aparte.
+"""
+
+import sys
+import json
+import time
+import queue
+import atexit
+import threading
+import traceback
+from collections import Counter
+from datetime import datetime
+from objects.constants import (SPIKE_WATCHDOG_ENABLED, SPIKE_THRESHOLD_MS, SPIKE_LOG_FILE,
+                               SPIKE_SAMPLE_INTERVAL, SPIKE_MAX_SAMPLES, SPIKE_STACK_DEPTH)
+from objects.profiler import profiler
+from objects.event_log import event_log
+
+
+class FrameWatchdog:
+    """Detecta frames lentos y guarda la causa probable en un log JSONL"""
+
+    def __init__(self, threshold_ms=SPIKE_THRESHOLD_MS, path=SPIKE_LOG_FILE,
+                 sample_interval=SPIKE_SAMPLE_INTERVAL, max_samples=SPIKE_MAX_SAMPLES,
+                 stack_depth=SPIKE_STACK_DEPTH, enabled=SPIKE_WATCHDOG_ENABLED,
+                 frame_profiler=profiler):
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.path = path
+        self.sample_interval = sample_interval
+        self.max_samples = max_samples
+        self.stack_depth = stack_depth
+        self.profiler = frame_profiler
+        self.spikes = 0
+
+        # Estado del frame en curso (compartido con el hilo de muestreo)
+        self._frame_id = 0
+        self._frame_start = None
+        self._samples = []
+        self._lock = threading.Lock()
+        self._frame_started = threading.Event()
+        self._expected_hitch = False
+        self._main_thread_id = threading.main_thread().ident
+        self._sampler = None
+
+        # Escritura del log
+        self._queue = queue.Queue()
+        self._writer = None
+
+    # ============================================
+    # 🎞️ BUCLE PRINCIPAL
+    # ============================================
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        if self._sampler is None:
+            self._sampler = threading.Thread(target=self._sample_loop, name="spike-sampler",
+                                             daemon=True)
+            self._sampler.start()
+        with self._lock:
+            self._frame_id += 1
+            self._frame_start = time.perf_counter()
+            self._samples = []
+        self._frame_started.set()
+
+    def expect_hitch(self):
+        """El frame actual es lento a propósito (p. ej. construir un nivel): no se registra"""
+        self._expected_hitch = True
+
+    def end_frame(self, frame_ms, snapshot=None):
+        """
+        Cierra el frame; si superó el umbral encola el registro del pico.
+
+        Args:
+            frame_ms: Duración del frame (profiler.end_frame())
+            snapshot: Función sin argumentos que devuelve el recuento de
+                entidades (solo se llama si hay pico)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._frame_start = None
+            samples = self._samples
+            self._samples = []
+        expected, self._expected_hitch = self._expected_hitch, False
+        if frame_ms is None or frame_ms < self.threshold_ms or expected:
+            return
+
+        self.spikes += 1
+        phases = self.profiler.phases
+        slowest = max(phases, key=phases.get) if phases else None
+        frame = self.profiler.frame - 1
+        record = {
+            'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'frame': frame,
+            'frame_ms': round(frame_ms, 2),
+            'threshold_ms': round(self.threshold_ms, 2),
+            'slowest_phase': slowest,
+            'phases': {phase: round(ms, 2) for phase, ms in phases.items()},
+            'gc': [{'generation': generation, 'ms': round(ms, 2), 'collected': collected}
+                   for gc_frame, generation, ms, collected in self.profiler.gc_events
+                   if gc_frame == frame],
+            'stacks': [{'count': count, 'stack': list(stack)}
+                       for stack, count in Counter(samples).most_common()],
+        }
+        if snapshot is not None:
+            try:
+                record['snapshot'] = snapshot()
+            except Exception as e:
+                record['snapshot'] = {'error': str(e)}
+
+        event_log.warning('Watchdog', "Pico de frame: %.1f ms (fase más lenta: %s)",
+                          frame_ms, slowest)
+        self._enqueue(record)
+
+    # ============================================
+    # 🔍 MUESTREO (hilo propio)
+    # ============================================
+
+    def _sample_loop(self):
+        delay = self.threshold_ms / 2000.0
+        while True:
+            self._frame_started.wait()
+            self._frame_started.clear()
+            with self._lock:
+                frame_id, start = self._frame_id, self._frame_start
+            if start is None:
+                continue
+            wait = start + delay - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            taken = 0
+            while taken < self.max_samples:
+                frame = sys._current_frames().get(self._main_thread_id)
+                if frame is None:
+                    break
+                stack = self._format_stack(frame)
+                with self._lock:
+                    if self._frame_id != frame_id or self._frame_start is None:
+                        break
+                    self._samples.append(stack)
+                taken += 1
+                time.sleep(self.sample_interval)
+
+    def _format_stack(self, frame):
+        """Pila como tupla de 'archivo:línea función' (la más interna al final)"""
+        entries = traceback.extract_stack(frame, limit=self.stack_depth)
+        return tuple(f"{entry.filename}:{entry.lineno} {entry.name}" for entry in entries)
+
+    # ============================================
+    # 💾 LOG (hilo de escritura)
+    # ============================================
+
+    def _enqueue(self, record):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="spike-log", daemon=True)
+            self._writer.start()
+            atexit.register(self.flush, 2.0)
+        self._queue.put(record)
+
+    def flush(self, timeout=None):
+        """Espera a que se hayan escrito los picos encolados"""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _write_loop(self):
+        while True:
+            task = self._queue.get()
+            if isinstance(task, threading.Event):
+                task.set()
+                continue
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(task, ensure_ascii=False) + "\n")
+            except Exception as e:
+                event_log.error('Watchdog', "Error escribiendo %s: %s", self.path, e)
+
+
+# Vigilante compartido por el bucle de juego
+watchdog = FrameWatchdog()